@@ -0,0 +1,107 @@
+"""
+Compares bigram_topic_matrix_creator() with the term-by-term re.findall loop it replaced,
+as the bigram dictionary grows with made-up bigrams taken from the answers.
+
+Run from the project root:
+
+    python -m benchmarks.bench_bigram_matcher --sizes 1000 3000
+
+"""
+
+import argparse
+import random
+import re
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from src.text_normalizations import bigram_topic_matrix_creator
+from src.topics import TopicIndex
+
+from .common import load_topic_dictionaries, load_topic_texts, timed
+
+
+def reference_bigram_matrix(texts: List[str], topic_index: TopicIndex) -> np.ndarray:
+    """
+    The previous bigram_topic_matrix_creator(): one re.findall per term and text.
+
+    """
+    matrix = np.zeros((len(texts), len(topic_index.labels)))
+
+    for row, t in enumerate(texts):
+        for term, topic_ids in topic_index.keywords.items():
+            if len(re.findall(term, t)) > 0:
+                matrix[row, topic_ids] = 1
+
+    return matrix
+
+
+def grow_dictionary(
+    topic_index: TopicIndex, texts: List[str], size: int, seed: int = 0
+) -> TopicIndex:
+    """
+    Adds bigrams of neighbouring words of the answers, with random topics, until the index has size keywords.
+
+    """
+    rng = random.Random(seed)
+    bigrams = sorted(
+        set(
+            f"{a} {b}" for text in texts for a, b in zip(text.split(), text.split()[1:])
+        )
+    )
+    rng.shuffle(bigrams)
+
+    keywords = dict(topic_index.keywords)
+    for bigram in bigrams:
+        if len(keywords) >= size:
+            break
+        keywords.setdefault(bigram, np.array([rng.randrange(len(topic_index.labels))]))
+
+    return TopicIndex(topic_index.labels, keywords)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 3000],
+        help="bigram dictionary sizes to time, besides the shipped one",
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=500,
+        help="answers to match, 0 for all of them",
+    )
+    args = parser.parse_args()
+
+    _, bigram_index = load_topic_dictionaries()
+    text_analysis, councilors_spelled = load_topic_texts()
+    dataframe = pd.concat([text_analysis, councilors_spelled], ignore_index=True)
+    texts = dataframe.cleaned.tolist()
+
+    # Past the 512 patterns re caches, every re.findall of the reference recompiles its term
+    rows = dataframe.sample(n=args.rows, random_state=0) if args.rows else dataframe
+
+    for size in [len(bigram_index.keywords)] + args.sizes:
+        topic_index = grow_dictionary(bigram_index, texts, size)
+
+        expected, reference_time = timed(
+            reference_bigram_matrix, rows.cleaned.tolist(), topic_index
+        )
+        result, matcher_time = timed(bigram_topic_matrix_creator, rows, topic_index)
+
+        mismatches = int((expected != result).any(axis=1).sum())
+
+        print(
+            f"{len(topic_index.keywords)} bigrams, {len(rows)} rows: re.findall {reference_time:.2f}s, "
+            f"matcher {matcher_time:.2f}s, speedup {reference_time / matcher_time:.1f}x, "
+            f"mismatched rows {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares cleaner() with the rule-by-rule implementation it replaced.
+
+Run from the project root:
+
+    python -m benchmarks.bench_cleaner --scale 10
+
+"""
+
+import argparse
+from typing import Dict, List
+
+from src.rules import RuleSet, apply_rules_sequentially, compile_rules, load_rule_specs
+from src.text_normalizations import (
+    cleaner,
+    lemma_stem,
+    stem_word,
+    unify_citizens_councilors_texts,
+)
+
+from .common import load_responses, timed
+
+
+def reference_cleaner(
+    text: str, stem_dict: Dict[str, List[str]], rules: RuleSet
+) -> str:
+    """
+    The previous cleaner(): one list comprehension per rule, each followed by the length filter.
+
+    """
+    cleaned_text = apply_rules_sequentially(text.split(), rules)
+    cleaned_text = [lemma_stem(text, "stem") for text in cleaned_text]
+
+    fin = []
+    for token in cleaned_text:
+        try:
+            fin.append(stem_dict[token][0])
+        except KeyError:
+            fin.append(token)
+
+    return " ".join(fin).strip()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale", type=int, default=1, help="repeat every answer N times"
+    )
+    args = parser.parse_args()
+
+    text_analysis, councilors_spelled = load_responses(args.scale)
+    stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(
+        citizens_df=text_analysis, councilors_df=councilors_spelled
+    )
+
+    reference_rules = compile_rules(load_rule_specs("cleaner"))
+
+    for population, dataframe, stem_dict in (
+        ("citizens", text_analysis, stem_dict_1),
+        ("councilors", councilors_spelled, stem_dict_2),
+    ):
+        texts = dataframe.cleaned.values.tolist()
+
+        # Both start from an empty stemming memo
+        stem_word.cache_clear()
+        expected, reference_time = timed(
+            lambda: [reference_cleaner(t, stem_dict, reference_rules) for t in texts]
+        )
+        stem_word.cache_clear()
+        result, cleaner_time = timed(lambda: [cleaner(t, stem_dict) for t in texts])
+
+        mismatches = sum(a != b for a, b in zip(expected, result))
+        print(
+            f"{population}: {len(texts)} rows, reference {reference_time:.2f}s, "
+            f"cleaner {cleaner_time:.2f}s, speedup {reference_time / cleaner_time:.1f}x, "
+            f"mismatches {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Compares the notebook's serial cleaner -> normalize_text_for_topic_analysis -> topic_cleaner
+chain with run_pipeline() on a growing number of worker processes.
+
+Run from the project root:
+
+    python -m benchmarks.bench_parallel --scale 10 --workers 1 2 4 8
+
+"""
+
+import argparse
+
+from src.parallel import run_pipeline
+from src.text_normalizations import (
+    normalize_text_for_topic_analysis,
+    topic_cleaner,
+    unify_citizens_councilors_texts,
+)
+
+from .common import load_responses, timed
+
+# Stages of run_pipeline giving what the serial chain gives
+STAGES = ["cleaner", "topic_normalizer", "topic_cleaner"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale", type=int, default=10, help="repeat every answer N times"
+    )
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4], help="pool sizes to time"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="responses sent to a worker at a time",
+    )
+    args = parser.parse_args()
+
+    stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(*load_responses())
+    text_analysis, councilors_spelled = load_responses(args.scale)
+    texts = text_analysis.cleaned.values.tolist()
+
+    def serial():
+        # Only the citizens are timed, the councilors DataFrame is left empty
+        citizens, _ = normalize_text_for_topic_analysis(
+            text_analysis.copy(),
+            councilors_spelled.iloc[:0].copy(),
+            stem_dict_1,
+            stem_dict_2,
+        )
+        return citizens.cleaned.apply(topic_cleaner).tolist()
+
+    expected, serial_time = timed(serial)
+    print(
+        f"{len(texts)} responses, serial {serial_time:.2f}s, "
+        f"{len(texts) / serial_time:.0f} responses/s"
+    )
+
+    for workers in args.workers:
+        result, elapsed = timed(
+            run_pipeline,
+            texts,
+            STAGES,
+            stem_dict=stem_dict_1,
+            max_workers=workers,
+            chunk_size=args.chunk_size,
+            population="citizens",
+        )
+        mismatches = sum(a != b for a, b in zip(expected, result))
+        print(
+            f"{workers} workers: {elapsed:.2f}s, {len(texts) / elapsed:.0f} responses/s, "
+            f"speedup {serial_time / elapsed:.1f}x, mismatches {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
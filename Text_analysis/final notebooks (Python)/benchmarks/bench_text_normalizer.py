@@ -0,0 +1,124 @@
+"""
+Measures the throughput of text_normalizer() in responses per second, against the
+substitution-by-substitution implementation it replaced.
+
+Run from the project root:
+
+    python -m benchmarks.bench_text_normalizer --scale 10
+
+"""
+
+import argparse
+import re
+
+from src.ingest import load_sheet
+from src.resources import get_config
+from src.text_normalizations import PUNCTUATION, text_normalizer
+
+from .common import timed
+
+REFERENCE_ACCENTS = [
+    ("ά", "α"),
+    ("έ", "ε"),
+    ("ή", "η"),
+    ("ί", "ι"),
+    ("ό", "ο"),
+    ("ύ", "υ"),
+    ("ώ", "ω"),
+    ("ϊ", "ι"),
+    ("ϋ", "υ"),
+    ("ΐ", "ι"),
+    ("ΰ", "υ"),
+]
+
+REFERENCE_LATIN = [
+    ("a", "α"),
+    ("b", "μπ"),
+    ("d", "δ"),
+    ("e", "ε"),
+    ("f", "φ"),
+    ("g", "γ"),
+    ("h", "χ"),
+    ("i", "ι"),
+    ("k", "κ"),
+    ("l", "λ"),
+    ("m", "μ"),
+    ("n", "ν"),
+    ("o", "ο"),
+    ("p", "π"),
+    ("r", "ρ"),
+    ("s", "σ"),
+    ("t", "τ"),
+    ("u", "υ"),
+    ("v", "β"),
+    ("w", "ω"),
+    ("s", "σ"),
+    ("y", "υ"),
+    ("z", "ζ"),
+]
+
+
+def reference_accent_remover(text: str) -> str:
+    """
+    The previous accent_remover(): one re.sub per accented letter.
+
+    """
+    cleaned_text = text.lower()
+    for accented, plain in REFERENCE_ACCENTS:
+        cleaned_text = re.sub(accented, plain, cleaned_text)
+
+    return cleaned_text
+
+
+def reference_text_normalizer(text: str) -> str:
+    """
+    The previous text_normalizer(): one re.sub per Latin letter, then a loop over the
+    punctuation marks repeating the whitespace, accent and digit clean-up for every mark.
+
+    """
+    cleaned_text = reference_accent_remover(text.lower())
+
+    re.findall(r"([a-zA-z]+[α-ωΑ-Ω]+)|([α-ωΑ-Ω]+[a-zA-z]+)", cleaned_text)
+    for latin, greek in REFERENCE_LATIN:
+        cleaned_text = re.sub(latin, greek, cleaned_text)
+
+    for punc in PUNCTUATION:
+        cleaned_text = re.sub(re.escape(punc), " ", cleaned_text)
+        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+        cleaned_text = cleaned_text.strip()
+        cleaned_text = reference_accent_remover(cleaned_text)
+        cleaned_text = re.sub(r"(?![0-9]+\s?\%)[0-9]", " ", cleaned_text)
+        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+
+    return cleaned_text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale", type=int, default=1, help="repeat every answer N times"
+    )
+    args = parser.parse_args()
+
+    config_dict = get_config()
+    texts = []
+    for key in ("text analysis data excel path", "councilors spelled excel path"):
+        texts += load_sheet(config_dict[key]).Q30.dropna().astype(str).tolist()
+    texts = texts * args.scale
+
+    expected, reference_time = timed(
+        lambda: [reference_text_normalizer(t) for t in texts]
+    )
+    result, normalizer_time = timed(lambda: [text_normalizer(t) for t in texts])
+
+    mismatches = sum(a != b for a, b in zip(expected, result))
+    print(
+        f"{len(texts)} responses, "
+        f"reference {len(texts) / reference_time:,.0f} responses/s, "
+        f"text_normalizer {len(texts) / normalizer_time:,.0f} responses/s, "
+        f"speedup {reference_time / normalizer_time:.1f}x, mismatches {mismatches}"
+    )
+
+
+if __name__ == "__main__":
+    main()
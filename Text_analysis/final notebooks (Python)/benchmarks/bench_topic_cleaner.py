@@ -0,0 +1,55 @@
+"""
+Measures the per-response cost of topic_cleaner() and of its stopword filter with a list and with a frozenset.
+
+Run from the project root:
+
+    python -m benchmarks.bench_topic_cleaner --repeat 5
+
+"""
+
+import argparse
+import timeit
+
+from src.resources import get_stop_word_set, get_stop_words
+from src.text_normalizations import topic_cleaner
+
+from .common import load_topic_responses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timed runs, the best is kept"
+    )
+    args = parser.parse_args()
+
+    text_analysis, councilors_spelled = load_topic_responses()
+    texts = text_analysis.cleaned.tolist() + councilors_spelled.cleaned.tolist()
+    tokens = [text.split() for text in texts]
+
+    stop_word_list = get_stop_words()
+    stop_word_set = get_stop_word_set()
+
+    def per_response(statement) -> float:
+        best = min(timeit.repeat(statement, number=1, repeat=args.repeat))
+        return best / len(texts) * 1e6
+
+    list_filter = per_response(
+        lambda: [[t for t in ts if t not in stop_word_list] for ts in tokens]
+    )
+    set_filter = per_response(
+        lambda: [[t for t in ts if t not in stop_word_set] for ts in tokens]
+    )
+    cleaner = per_response(lambda: [topic_cleaner(text) for text in texts])
+
+    print(f"{len(texts)} responses, {len(stop_word_list)} stopwords")
+    print(f"stopword filter, list: {list_filter:.1f} us/response")
+    print(f"stopword filter, frozenset: {set_filter:.1f} us/response")
+    print(
+        f"topic_cleaner with frozenset: {cleaner:.1f} us/response, "
+        f"{cleaner + list_filter - set_filter:.1f} us/response with the list"
+    )
+
+
+if __name__ == "__main__":
+    main()
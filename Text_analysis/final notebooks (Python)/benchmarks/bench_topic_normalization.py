@@ -0,0 +1,69 @@
+"""
+Compares the backends of the topic analysis substitutions in normalize_text_for_topic_analysis().
+
+Run from the project root:
+
+    python -m benchmarks.bench_topic_normalization --scale 100
+
+"""
+
+import argparse
+
+from src.text_normalizations import (
+    apply_topic_rules,
+    cleaner,
+    unify_citizens_councilors_texts,
+)
+
+from .common import load_responses, timed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale", type=int, default=100, help="repeat every answer N times"
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["apply", "vectorized", "vocabulary"],
+        help="backends to time, the first one is the reference",
+    )
+    args = parser.parse_args()
+
+    # The stem dictionaries only depend on the distinct answers
+    stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(*load_responses())
+
+    text_analysis, councilors_spelled = load_responses(args.scale)
+    text_analysis["cleaned"] = text_analysis.cleaned.apply(
+        lambda x: cleaner(x, stem_dict_1)
+    )
+    councilors_spelled["cleaned"] = councilors_spelled.cleaned.apply(
+        lambda x: cleaner(x, stem_dict_2)
+    )
+    print(
+        f"{len(text_analysis)} citizens and {len(councilors_spelled)} councilors rows"
+    )
+
+    expected = None
+    for backend in args.backends:
+        (citizens, councilors), elapsed = timed(
+            apply_topic_rules,
+            text_analysis.copy(),
+            councilors_spelled.copy(),
+            backend,
+        )
+        result = citizens.cleaned.tolist() + councilors.cleaned.tolist()
+
+        if expected is None:
+            expected, reference_time = result, elapsed
+        mismatches = sum(a != b for a, b in zip(expected, result))
+
+        print(
+            f"{backend}: {elapsed:.2f}s, speedup {reference_time / elapsed:.1f}x, "
+            f"mismatches {mismatches}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import time
+from typing import Any, Callable, Tuple
+
+import pandas as pd
+
+from src.ingest import load_sheet
+from src.resources import get_config
+from src.topics import TopicIndex
+from src.text_normalizations import (
+    abbreviation_creator,
+    drop_empty_topics,
+    normalize_text_for_topic_analysis,
+    text_normalizer,
+    topic_cleaner,
+    topic_dictionary,
+    unify_citizens_councilors_texts,
+)
+
+
+def load_responses(scale: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads the citizens and councilors Q30 answers and applies the first normalization steps.
+
+    Args:
+    ----
+    scale (int): Number of times every answer is repeated, to simulate bigger survey waves.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: Citizens and councilors DataFrames with a "cleaned" column.
+
+    """
+    config_dict = get_config()
+
+    text_analysis = load_sheet(config_dict["text analysis data excel path"])
+    text_analysis.dropna(subset=["Q30"], inplace=True)
+    councilors_spelled = load_sheet(config_dict["councilors spelled excel path"])
+    councilors_spelled.dropna(subset=["Q30"], inplace=True)
+
+    frames = []
+    for dataframe in (text_analysis, councilors_spelled):
+        # The answers are normalized before being repeated, the result is the same
+        dataframe["cleaned"] = dataframe.Q30.astype(str).apply(text_normalizer)
+        dataframe["cleaned"] = dataframe.cleaned.apply(abbreviation_creator)
+        frames.append(pd.concat([dataframe] * scale, ignore_index=True))
+
+    return frames[0], frames[1]
+
+
+def load_topic_responses(scale: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads the citizens and councilors Q30 answers as they are before topic_cleaner() in the notebook.
+
+    Args:
+    ----
+    scale (int): Number of times every answer is repeated, to simulate bigger survey waves.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: Citizens and councilors DataFrames with a "cleaned" column.
+
+    """
+    text_analysis, councilors_spelled = load_responses()
+    stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(
+        citizens_df=text_analysis, councilors_df=councilors_spelled
+    )
+    text_analysis, councilors_spelled = normalize_text_for_topic_analysis(
+        text_analysis, councilors_spelled, stem_dict_1, stem_dict_2
+    )
+
+    return (
+        pd.concat([text_analysis] * scale, ignore_index=True),
+        pd.concat([councilors_spelled] * scale, ignore_index=True),
+    )
+
+
+def load_topic_dictionaries() -> Tuple[TopicIndex, TopicIndex]:
+    """
+    Reads the unigram and bigram topic keywords the way the notebook does.
+
+    Returns:
+    -------
+    Tuple[TopicIndex, TopicIndex]: Unigram and bigram topic indexes.
+
+    """
+    sheets = []
+    for sheet_name in ("unigrams", "bigrams"):
+        keywords = load_sheet(get_config()["topic excel path"], sheet_name=sheet_name)
+        keywords.drop(1, inplace=True)
+        sheets.append(keywords.iloc[:, 1:])
+
+    unigrams, bigrams = drop_empty_topics(*sheets)
+    unigrams.fillna("nothing", inplace=True)
+    bigrams.fillna("nothing", inplace=True)
+
+    return topic_dictionary(unigrams), topic_dictionary(bigrams)
+
+
+def load_topic_texts(scale: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Loads the citizens and councilors Q30 answers after topic_cleaner(), as the topic matrices see them.
+
+    Args:
+    ----
+    scale (int): Number of times every answer is repeated, to simulate bigger survey waves.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: Citizens and councilors DataFrames with a "cleaned" column.
+
+    """
+    frames = []
+    for dataframe in load_topic_responses():
+        dataframe = dataframe.dropna(subset=["cleaned"])
+        dataframe["cleaned"] = dataframe.cleaned.apply(topic_cleaner)
+        frames.append(pd.concat([dataframe] * scale, ignore_index=True))
+
+    return frames[0], frames[1]
+
+
+def timed(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, float]:
+    """
+    Calls a function once and measures its wall time.
+
+    Returns:
+    -------
+    Tuple[Any, float]: The return value and the elapsed seconds.
+
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+
+    return result, time.perf_counter() - start
@@ -0,0 +1,85 @@
+"""
+Runs the notebook's normalization and topic matrix steps under the profiler and writes
+the per-stage and per-rule statistics as JSON and as folded stacks for a flame graph.
+
+Run from the project root:
+
+    python -m benchmarks.profile_pipeline --json profile.json --folded profile.folded
+
+The folded stacks can be drawn with flamegraph.pl or opened in speedscope.
+
+"""
+
+import argparse
+
+from src.profiling import profile
+from src.text_normalizations import (
+    binarize_topic_matrices,
+    normalize_text_for_topic_analysis,
+    topic_cleaner,
+    topic_matrix_creator,
+    unify_citizens_councilors_texts,
+)
+
+from .common import load_responses, load_topic_dictionaries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scale", type=int, default=1, help="repeat every answer N times"
+    )
+    parser.add_argument("--json", default="profile.json", help="JSON output file")
+    parser.add_argument(
+        "--folded", default="profile.folded", help="folded stacks output file"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="number of stages and rules printed"
+    )
+    args = parser.parse_args()
+
+    unigram_index, bigram_index = load_topic_dictionaries()
+
+    with profile() as profiler:
+        text_analysis, councilors_spelled = load_responses(args.scale)
+        stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(
+            citizens_df=text_analysis, councilors_df=councilors_spelled
+        )
+        text_analysis, councilors_spelled = normalize_text_for_topic_analysis(
+            text_analysis, councilors_spelled, stem_dict_1, stem_dict_2
+        )
+        for dataframe in (text_analysis, councilors_spelled):
+            dataframe["cleaned"] = dataframe.cleaned.apply(topic_cleaner)
+            binarize_topic_matrices(
+                topic_matrix_creator(dataframe, unigram_index, bigram_index)
+            )
+
+    profiler.to_json(args.json)
+    profiler.to_folded(args.folded)
+
+    print("slowest stages:")
+    for stats in profiler.stage_stats()[: args.top]:
+        print(f"  {stats['stage']}: {stats['calls']} calls, {stats['seconds']:.2f}s")
+
+    print("slowest rules:")
+    for stats in profiler.rule_stats()[: args.top]:
+        print(
+            f"  {stats['section']}[{stats['position']}] {stats['name']}: "
+            f"{stats['calls']} calls, {stats['hits']} hits, {stats['seconds']:.3f}s"
+        )
+
+    print("tokens rewritten one by one:")
+    for stats in profiler.token_stats():
+        print(
+            f"  {stats['section']}: {stats['tokens']} tokens, {stats['cached']} cached, "
+            f"{stats['skipped']} matched no rule, {stats['rewritten']} went through the rules"
+        )
+
+    unmatched = profiler.unmatched_rules(["cleaner", "topic analysis", "topic cleaner"])
+    print(f"{len(unmatched)} rules never matched:")
+    for stats in unmatched:
+        print(f"  {stats['section']}[{stats['position']}] {stats['name']}")
+
+
+if __name__ == "__main__":
+    main()
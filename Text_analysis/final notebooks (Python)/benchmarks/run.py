@@ -0,0 +1,600 @@
+"""
+Times the public functions of src.text_normalizations and the notebook's end-to-end flow
+on synthetic survey waves, reporting answers per second and peak memory, and stores the
+results per commit so that slowdowns show up between commits.
+
+Run from the project root:
+
+    python -m benchmarks.run --rows 1000 10000 100000 1000000
+    python -m benchmarks.run --compare <commit>
+
+Every wave is generated and taken through the notebook's steps once, and the input of
+every step is stored in a temporary directory. Every case then runs once in a fresh
+process, so the word caches start empty and the peak resident memory is that of the
+case alone. Rows are the answers of both populations, empty ones included.
+
+The results are added to benchmarks/results/<commit>.json, "-dirty" being appended to
+the commit when the project has uncommitted changes. --compare prints the change of
+every case between the results of another commit and those of the current one.
+
+"""
+
+import argparse
+import json
+import os
+import pickle
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from src.resources import get_normalization_type, get_stop_words
+from src.text_normalizations import (
+    abbreviation_creator,
+    accent_remover,
+    apply_topic_rules,
+    binarize_topic_matrices,
+    bigram_topic_matrix_creator,
+    cleaner,
+    lemma_stem,
+    lemmatize_texts,
+    normalize_text_for_topic_analysis,
+    normalize_words,
+    stem_lookup_keys,
+    stop_word_remover,
+    text_normalizer,
+    topic_cleaner,
+    topic_matrix_creator,
+    unify_citizens_councilors_texts,
+    unigram_topic_matrix_creator,
+)
+
+from .common import load_topic_dictionaries
+from .synthetic import synthetic_survey
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Change of answers per second under which a case is reported as slower
+SLOWDOWN_THRESHOLD = 0.1
+
+
+def texts_of(frames: Sequence[pd.DataFrame], column: str = "cleaned") -> List[str]:
+    """
+    Returns the non-empty texts of a column of both populations, citizens first.
+
+    """
+    texts = []
+    for dataframe in frames:
+        texts += dataframe[column].dropna().astype(str).values.tolist()
+
+    return texts
+
+
+def vocabulary_of(frames: Sequence[pd.DataFrame]) -> List[str]:
+    """
+    Returns the distinct lowercase words of the cleaned texts of both populations.
+
+    """
+    return sorted(
+        set(token.lower() for text in texts_of(frames) for token in text.split())
+    )
+
+
+def prepare_inputs(rows: int, seed: int, inputs_dir: str) -> None:
+    """
+    Generates a synthetic wave and stores the input of every step of the notebook.
+
+    Args:
+    ----
+    rows (int): Number of citizens answers.
+    seed (int): Seed of the synthetic wave.
+    inputs_dir (str): Directory the inputs are pickled to, one file per step.
+
+    """
+
+    def store(name: str, value: Any) -> None:
+        with open(os.path.join(inputs_dir, f"{name}.pkl"), "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    citizens, councilors = synthetic_survey(rows, seed)
+    store("raw", (citizens, councilors))
+
+    frames = []
+    for dataframe in (citizens, councilors):
+        dataframe = dataframe.dropna(subset=["Q30"]).copy()
+        dataframe["cleaned"] = dataframe.Q30.astype(str).apply(text_normalizer)
+        frames.append(dataframe)
+    store("normalized", frames)
+
+    for dataframe in frames:
+        dataframe["cleaned"] = dataframe.cleaned.apply(abbreviation_creator)
+    store("prepared", frames)
+
+    stem_dicts = unify_citizens_councilors_texts(
+        citizens_df=frames[0], councilors_df=frames[1]
+    )
+    store("stem_dicts", stem_dicts)
+
+    for dataframe, stem_dict in zip(frames, stem_dicts):
+        dataframe["cleaned"] = dataframe.cleaned.apply(lambda x: cleaner(x, stem_dict))
+    store("cleaned", frames)
+
+    frames = list(apply_topic_rules(frames[0], frames[1]))
+    store("topic", frames)
+
+    frames = [dataframe.dropna(subset=["cleaned"]).copy() for dataframe in frames]
+    for dataframe in frames:
+        dataframe["cleaned"] = dataframe.cleaned.apply(topic_cleaner)
+    store("topic_cleaned", frames)
+
+    unigram_index, bigram_index = load_topic_dictionaries()
+    store(
+        "matrices",
+        [
+            (
+                unigram_topic_matrix_creator(dataframe, unigram_index),
+                bigram_topic_matrix_creator(dataframe, bigram_index),
+            )
+            for dataframe in frames
+        ],
+    )
+
+
+def notebook_flow(
+    citizens: pd.DataFrame, councilors: pd.DataFrame, topic_indexes: Tuple[Any, Any]
+) -> None:
+    """
+    Runs the notebook from the raw answers to the binary topic matrices of both populations.
+
+    """
+    unigram_index, bigram_index = topic_indexes
+
+    citizens = citizens.dropna(subset=["Q30"]).copy()
+    councilors = councilors.dropna(subset=["Q30"]).copy()
+    for dataframe in (citizens, councilors):
+        dataframe["cleaned"] = dataframe.Q30.apply(lambda x: text_normalizer(x))
+        dataframe["cleaned"] = dataframe.cleaned.apply(
+            lambda x: abbreviation_creator(x)
+        )
+
+    stem_dict_1, stem_dict_2 = unify_citizens_councilors_texts(
+        citizens_df=citizens, councilors_df=councilors
+    )
+    citizens, councilors = normalize_text_for_topic_analysis(
+        citizens, councilors, stem_dict_1, stem_dict_2
+    )
+
+    for dataframe in (citizens, councilors):
+        dataframe = dataframe.dropna(subset=["cleaned"]).copy()
+        dataframe["cleaned"] = dataframe.cleaned.apply(lambda x: topic_cleaner(x))
+        binarize_topic_matrices(
+            unigram_topic_matrix_creator(dataframe, unigram_index),
+            bigram_topic_matrix_creator(dataframe, bigram_index),
+        )
+
+
+def per_text(function: Callable[..., Any], *args: Any) -> Callable[[List[str]], Any]:
+    """
+    Returns a case applying a function to every text of a list.
+
+    """
+    return lambda texts: [function(text, *args) for text in texts]
+
+
+def per_population(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Returns a case calling a function with the DataFrame of every population.
+
+    """
+    return lambda frames, *args: [function(dataframe, *args) for dataframe in frames]
+
+
+# Every case: the stored input it starts from, how the arguments are taken out of the
+# loaded inputs, and the timed call
+CASES: Dict[str, Tuple[Tuple[str, ...], Callable[..., Tuple], Callable[..., Any]]] = {
+    "accent_remover": (
+        ("raw",),
+        lambda raw: (texts_of(raw, "Q30"),),
+        per_text(accent_remover),
+    ),
+    "text_normalizer": (
+        ("raw",),
+        lambda raw: (texts_of(raw, "Q30"),),
+        per_text(text_normalizer),
+    ),
+    "abbreviation_creator": (
+        ("normalized",),
+        lambda frames: (texts_of(frames),),
+        per_text(abbreviation_creator),
+    ),
+    "stop_word_remover": (
+        ("prepared",),
+        lambda frames: (texts_of(frames), get_stop_words()),
+        lambda texts, stop_words: [
+            stop_word_remover(text, stop_words) for text in texts
+        ],
+    ),
+    "lemma_stem": (
+        ("prepared",),
+        lambda frames: (texts_of(frames), get_normalization_type()),
+        lambda texts, normalization_type: [
+            lemma_stem(text, normalization_type) for text in texts
+        ],
+    ),
+    "stem_lookup_keys": (
+        ("prepared",),
+        lambda frames: (texts_of(frames),),
+        per_text(stem_lookup_keys),
+    ),
+    "normalize_words": (
+        ("prepared",),
+        lambda frames: (vocabulary_of(frames), get_normalization_type()),
+        normalize_words,
+    ),
+    "lemmatize_texts": (
+        ("prepared",),
+        lambda frames: (vocabulary_of(frames),),
+        lemmatize_texts,
+    ),
+    "unify_citizens_councilors_texts": (
+        ("prepared",),
+        lambda frames: tuple(frames),
+        unify_citizens_councilors_texts,
+    ),
+    "cleaner": (
+        ("prepared", "stem_dicts"),
+        lambda frames, stem_dicts: (texts_of(frames[:1]), texts_of(frames[1:]))
+        + tuple(stem_dicts),
+        lambda citizens, councilors, stem_dict_1, stem_dict_2: (
+            [cleaner(text, stem_dict_1) for text in citizens],
+            [cleaner(text, stem_dict_2) for text in councilors],
+        ),
+    ),
+    "normalize_text_for_topic_analysis": (
+        ("prepared", "stem_dicts"),
+        lambda frames, stem_dicts: tuple(frames) + tuple(stem_dicts),
+        normalize_text_for_topic_analysis,
+    ),
+    "apply_topic_rules[apply]": (
+        ("cleaned",),
+        lambda frames: tuple(frames),
+        lambda citizens, councilors: apply_topic_rules(citizens, councilors, "apply"),
+    ),
+    "apply_topic_rules[vectorized]": (
+        ("cleaned",),
+        lambda frames: tuple(frames),
+        lambda citizens, councilors: apply_topic_rules(
+            citizens, councilors, "vectorized"
+        ),
+    ),
+    "apply_topic_rules[vocabulary]": (
+        ("cleaned",),
+        lambda frames: tuple(frames),
+        lambda citizens, councilors: apply_topic_rules(
+            citizens, councilors, "vocabulary"
+        ),
+    ),
+    "topic_cleaner": (
+        ("topic",),
+        lambda frames: (texts_of(frames),),
+        per_text(topic_cleaner),
+    ),
+    "unigram_topic_matrix_creator": (
+        ("topic_cleaned",),
+        lambda frames: (frames, load_topic_dictionaries()[0]),
+        per_population(unigram_topic_matrix_creator),
+    ),
+    "bigram_topic_matrix_creator": (
+        ("topic_cleaned",),
+        lambda frames: (frames, load_topic_dictionaries()[1]),
+        per_population(bigram_topic_matrix_creator),
+    ),
+    "topic_matrix_creator": (
+        ("topic_cleaned",),
+        lambda frames: (frames,) + load_topic_dictionaries(),
+        per_population(topic_matrix_creator),
+    ),
+    "binarize_topic_matrices": (
+        ("matrices",),
+        lambda matrices: (matrices,),
+        lambda matrices: [binarize_topic_matrices(*pair) for pair in matrices],
+    ),
+    "notebook": (
+        ("raw",),
+        lambda raw: tuple(raw) + (load_topic_dictionaries(),),
+        notebook_flow,
+    ),
+}
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Returns the peak resident memory of the process so far in MB, None where it cannot be read.
+
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(case: str, inputs_dir: str) -> Dict[str, Any]:
+    """
+    Loads the inputs of a case and times it once.
+
+    Args:
+    ----
+    case (str): Key of CASES.
+    inputs_dir (str): Directory written by prepare_inputs.
+
+    Returns:
+    -------
+    Dict[str, Any]: "seconds", "peak_rss_mb" and "case_rss_mb", the growth of the peak while the case ran, or "error" if the case failed.
+
+    """
+    stages, arguments, function = CASES[case]
+
+    loaded = []
+    for stage in stages:
+        with open(os.path.join(inputs_dir, f"{stage}.pkl"), "rb") as f:
+            loaded.append(pickle.load(f))
+
+    try:
+        args = arguments(*loaded)
+        del loaded
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        function(*args)
+        seconds = time.perf_counter() - start
+    except Exception as error:
+        return {"error": f"{type(error).__name__}: {error}"}
+
+    peak = peak_rss_mb()
+
+    return {
+        "seconds": seconds,
+        "peak_rss_mb": peak,
+        "case_rss_mb": None if peak is None else peak - baseline,
+    }
+
+
+def current_commit() -> str:
+    """
+    Returns the short hash of HEAD, with "-dirty" if tracked files of the project are modified, or "unknown" outside git.
+
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no", "."],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+    return commit + ("-dirty" if status else "")
+
+
+def results_path(commit: str) -> str:
+    return os.path.join(RESULTS_DIR, f"{commit}.json")
+
+
+def load_results(commit: str) -> Dict[str, Any]:
+    """
+    Reads the stored results of a commit.
+
+    Args:
+    ----
+    commit (str): Commit hash, as in the results file name.
+
+    Returns:
+    -------
+    Dict[str, Any]: The results document, with no results if none are stored.
+
+    """
+    path = results_path(commit)
+    if not os.path.exists(path):
+        return {"commit": commit, "results": []}
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def store_results(commit: str, results: List[Dict[str, Any]], seed: int) -> str:
+    """
+    Adds results to those stored for a commit, replacing earlier runs of the same case and size.
+
+    Args:
+    ----
+    commit (str): Commit hash the results belong to.
+    results (List[Dict[str, Any]]): One result per case and size.
+    seed (int): Seed of the synthetic waves.
+
+    Returns:
+    -------
+    str: Path to the results file.
+
+    """
+    document = load_results(commit)
+    measured = set((result["case"], result["rows"]) for result in results)
+    document.update(
+        {
+            "commit": commit,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "normalization type": get_normalization_type(),
+            "seed": seed,
+        }
+    )
+    document["results"] = sorted(
+        [
+            result
+            for result in document["results"]
+            if (result["case"], result["rows"]) not in measured
+        ]
+        + results,
+        key=lambda result: (result["rows"], result["case"]),
+    )
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = results_path(commit)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=4, ensure_ascii=False)
+
+    return path
+
+
+def compare(base: str, head: str, threshold: float = SLOWDOWN_THRESHOLD) -> int:
+    """
+    Prints the change of answers per second of every case measured for both commits.
+
+    Args:
+    ----
+    base (str): Commit to compare against.
+    head (str): Commit to compare.
+    threshold (float): Relative drop of answers per second from which a case is reported as slower.
+
+    Returns:
+    -------
+    int: Number of slower cases.
+
+    """
+    base_results = {
+        (result["case"], result["rows"]): result
+        for result in load_results(base)["results"]
+        if "rows_per_s" in result
+    }
+
+    slower = 0
+    for result in load_results(head)["results"]:
+        key = (result["case"], result["rows"])
+        if key not in base_results or "rows_per_s" not in result:
+            continue
+
+        ratio = result["rows_per_s"] / base_results[key]["rows_per_s"]
+        flag = ""
+        if ratio < 1 - threshold:
+            flag = "  SLOWER"
+            slower += 1
+        print(
+            f"{result['case']:<36} {result['rows']:>9} rows "
+            f"{base_results[key]['rows_per_s']:>12,.0f} -> {result['rows_per_s']:>12,.0f} rows/s "
+            f"({ratio:.2f}x){flag}"
+        )
+
+    return slower
+
+
+def call_worker(arguments: List[str]) -> Dict[str, Any]:
+    """
+    Runs this module in a new process and returns the JSON it prints.
+
+    """
+    process = subprocess.run(
+        [sys.executable, "-m", "benchmarks.run"] + arguments,
+        capture_output=True,
+        text=True,
+    )
+    if process.returncode != 0:
+        lines = process.stderr.strip().splitlines() or [
+            f"exit code {process.returncode}"
+        ]
+        return {"error": lines[-1]}
+
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[1000, 10000],
+        help="citizens answers of every synthetic wave",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=list(CASES),
+        metavar="CASE",
+        help="cases to run, all by default",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the waves")
+    parser.add_argument(
+        "--compare", metavar="COMMIT", help="compare stored results instead of running"
+    )
+    parser.add_argument(
+        "--head",
+        metavar="COMMIT",
+        help="commit compared by --compare, the current one by default",
+    )
+    parser.add_argument("--prepare", metavar="DIR", help=argparse.SUPPRESS)
+    parser.add_argument(
+        "--worker", nargs=2, metavar=("CASE", "DIR"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.prepare:
+        prepare_inputs(args.rows[0], args.seed, args.prepare)
+        with open(os.path.join(args.prepare, "raw.pkl"), "rb") as f:
+            print(json.dumps({"rows": sum(len(frame) for frame in pickle.load(f))}))
+        return
+
+    if args.worker:
+        print(json.dumps(run_case(*args.worker)))
+        return
+
+    if args.compare:
+        slower = compare(args.compare, args.head or current_commit())
+        print(f"{slower} cases slower by more than {SLOWDOWN_THRESHOLD:.0%}")
+        sys.exit(1 if slower else 0)
+
+    commit = current_commit()
+    results = []
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as inputs_dir:
+            prepared = call_worker(
+                ["--prepare", inputs_dir, "--rows", str(rows), "--seed", str(args.seed)]
+            )
+            if "error" in prepared:
+                print(f"{rows} rows: preparing the wave failed, {prepared['error']}")
+                continue
+
+            for case in args.cases or CASES:
+                result = {"case": case, "rows": prepared["rows"]}
+                result.update(call_worker(["--worker", case, inputs_dir]))
+                if "seconds" in result:
+                    result["rows_per_s"] = result["rows"] / result["seconds"]
+                    print(
+                        f"{case:<36} {result['rows']:>9} rows "
+                        f"{result['rows_per_s']:>12,.0f} rows/s "
+                        f"peak {result['peak_rss_mb'] or 0:>8,.0f} MB"
+                    )
+                else:
+                    print(f"{case:<36} {result['rows']:>9} rows {result['error']}")
+                results.append(result)
+
+    print(store_results(commit, results, args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Synthetic Greek survey waves shaped like the shipped Q30 files, for benchmarking at sizes
+the real data does not reach.
+
+Run from the project root to write a wave to a file:
+
+    python -m benchmarks.synthetic --rows 100000 --output synthetic_Q30.csv
+
+"""
+
+import argparse
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.ingest import load_sheet
+from src.resources import get_config
+
+# Share of citizens answers mirrored as councilors answers, as in the shipped files
+COUNCILORS_SHARE = 409 / 7025
+
+# Probability that a word of a synthetic answer is misspelled
+TYPO_RATE = 0.02
+
+
+def load_answer_tokens(config_key: str) -> Tuple[List[str], np.ndarray, float]:
+    """
+    Reads the Q30 answers of a shipped file as a single run of whitespace tokens.
+
+    Args:
+    ----
+    config_key (str): Config key of the Excel file, e.g. "text analysis data excel path".
+
+    Returns:
+    -------
+    Tuple[List[str], np.ndarray, float]: The tokens of all answers one after the other, the number of tokens of every answer and the share of empty answers.
+
+    """
+    answers = load_sheet(get_config()[config_key]).Q30
+    empty_share = float(answers.isna().mean())
+
+    tokens = []
+    lengths = []
+    for answer in answers.dropna().astype(str).values.tolist():
+        words = answer.split()
+        if words:
+            tokens += words
+            lengths.append(len(words))
+
+    return tokens, np.array(lengths), empty_share
+
+
+def misspell(word: str, rng: np.random.Generator) -> str:
+    """
+    Drops, doubles or swaps one letter of a word, the typos found in the shipped answers.
+
+    Args:
+    ----
+    word (str): Word to misspell.
+    rng (np.random.Generator): Random generator.
+
+    Returns:
+    -------
+    str: The misspelled word, or the word itself if it is a single character.
+
+    """
+    if len(word) < 2:
+        return word
+
+    i = int(rng.integers(len(word) - 1))
+    kind = int(rng.integers(3))
+    if kind == 0:
+        return word[:i] + word[i + 1 :]
+    if kind == 1:
+        return word[: i + 1] + word[i:]
+
+    return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+
+
+def synthetic_answers(
+    rows: int, config_key: str, seed: int = 0, typo_rate: float = TYPO_RATE
+) -> List[object]:
+    """
+    Generates answers by splicing runs of consecutive words out of the shipped answers.
+
+    Answer lengths and the share of empty answers follow the shipped file, and runs of
+    consecutive words keep its bigrams, abbreviations, punctuation, digits, accents and
+    Latin letters. Misspelling a share of the words makes the vocabulary keep growing with
+    the number of rows, as it does in real survey waves.
+
+    Args:
+    ----
+    rows (int): Number of answers.
+    config_key (str): Config key of the Excel file the answers are modelled on.
+    seed (int): Seed of the random generator, the same seed giving the same answers.
+    typo_rate (float): Probability that a word is misspelled.
+
+    Returns:
+    -------
+    List[object]: The answers, NaN for the empty ones.
+
+    """
+    tokens, lengths, empty_share = load_answer_tokens(config_key)
+    rng = np.random.default_rng(seed)
+
+    sizes = rng.choice(lengths, size=rows)
+    starts = rng.integers(0, len(tokens) - sizes + 1)
+    empty = rng.random(rows) < empty_share
+    typos = rng.binomial(sizes, typo_rate)
+
+    answers = []
+    for size, start, is_empty, n_typos in zip(
+        sizes.tolist(), starts.tolist(), empty.tolist(), typos.tolist()
+    ):
+        if is_empty:
+            answers.append(np.nan)
+            continue
+
+        words = tokens[start : start + size]
+        for i in rng.integers(0, size, n_typos).tolist():
+            words[i] = misspell(words[i], rng)
+        answers.append(" ".join(words))
+
+    return answers
+
+
+def synthetic_survey(rows: int, seed: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generates a citizens wave shaped like text_analysis_data_Q30.xls and the matching councilors wave.
+
+    Args:
+    ----
+    rows (int): Number of citizens answers, the councilors getting the same share as in the shipped files.
+    seed (int): Seed of the random generator.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: Citizens with Anonymous_id and Q30 columns, and councilors with id_anonymous and Q30 columns.
+
+    """
+    councilors_rows = max(1, round(rows * COUNCILORS_SHARE))
+
+    citizens = pd.DataFrame(
+        {
+            "Anonymous_id": np.arange(1, rows + 1),
+            "Q30": synthetic_answers(rows, "text analysis data excel path", seed),
+        }
+    )
+    councilors = pd.DataFrame(
+        {
+            "Q30": synthetic_answers(
+                councilors_rows, "councilors spelled excel path", seed + 1
+            ),
+            "id_anonymous": np.arange(1, councilors_rows + 1),
+        }
+    )
+
+    return citizens, councilors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000, help="citizens answers")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--output",
+        default="synthetic_Q30.csv",
+        help="citizens .csv or .xlsx file, the councilors go next to it",
+    )
+    args = parser.parse_args()
+
+    citizens, councilors = synthetic_survey(args.rows, args.seed)
+    root, extension = os.path.splitext(args.output)
+    for dataframe, path in (
+        (citizens, args.output),
+        (councilors, f"{root}_councilors{extension}"),
+    ):
+        if extension == ".xlsx":
+            dataframe.to_excel(path, index=False)
+        else:
+            dataframe.to_csv(path, index=False)
+        print(f"{path}: {len(dataframe)} answers")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from typing import Any, Iterable, Optional
+
+from .resources import SPACY_MODEL, get_config, get_normalization_type
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:
+    # Python 3.7, importlib-metadata is in requirements.txt
+    from importlib_metadata import PackageNotFoundError, version
+
+# Bumped whenever the layout of the cached objects changes
+CACHE_VERSION = 2
+
+# Packages the stems and lemmas come from, an upgrade of any of them invalidating the cache
+NORMALIZATION_PACKAGES = ("greek-stemmer", "nltk", "spacy", SPACY_MODEL)
+
+# Files kept of every kind of object, the least recently used ones being removed
+CACHE_ENTRIES = 4
+
+
+def get_cache_dir() -> str:
+    """
+    Returns the directory of the on-disk cache set in config.json, "cache" by default.
+
+    Returns:
+    -------
+    str: Path to the cache directory.
+
+    """
+    return get_config().get("cache path", "cache")
+
+
+def package_version(name: str) -> str:
+    """
+    Returns the installed version of a package, "missing" if it is not installed.
+
+    """
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return "missing"
+
+
+def update_with_file(digest: Any, path: str) -> None:
+    """
+    Feeds the path and the contents of a file to a hashlib digest.
+
+    Args:
+    ----
+    digest (hashlib._Hash): Digest to update.
+    path (str): Path to the file.
+
+    """
+    digest.update(path.encode("utf-8") + b"\0")
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(b"\0")
+
+
+def settings_digest(*parts: Any) -> Any:
+    """
+    Starts a sha256 digest of everything the normalization depends on besides the texts:
+    the cache version, the normalization type, the versions of NORMALIZATION_PACKAGES,
+    the stopword files and the normalization rules file.
+
+    Args:
+    ----
+    *parts (Any): Further values the cached object depends on, hashed through str().
+
+    Returns:
+    -------
+    hashlib._Hash: Digest to be updated with the inputs of the cached object.
+
+    """
+    config_dict = get_config()
+    digest = hashlib.sha256()
+
+    versions = tuple(package_version(name) for name in NORMALIZATION_PACKAGES)
+    digest.update(
+        "".join(
+            f"{part}\0"
+            for part in (CACHE_VERSION, get_normalization_type()) + versions + parts
+        ).encode("utf-8")
+    )
+
+    for key in (
+        "stopwords excel path",
+        "additional_stopwords_path",
+        "keep_stopwords_path",
+        "normalization rules path",
+    ):
+        update_with_file(digest, config_dict[key])
+
+    return digest
+
+
+def stem_dicts_key(
+    citizens_texts: Iterable[str], councilors_texts: Iterable[str], compact: bool
+) -> str:
+    """
+    Hashes everything the stem dictionaries depend on: the texts of both populations
+    and the settings of settings_digest.
+
+    Args:
+    ----
+    citizens_texts (Iterable[str]): Cleaned citizens answers.
+    councilors_texts (Iterable[str]): Cleaned councilors answers.
+    compact (bool): Whether the dictionaries are stored as StemIndex objects.
+
+    Returns:
+    -------
+    str: Hex sha256 digest.
+
+    """
+    digest = settings_digest(compact)
+
+    for texts in (citizens_texts, councilors_texts):
+        for text in texts:
+            digest.update(text.encode("utf-8") + b"\0")
+        # Separate the two populations so moving an answer between them changes the key
+        digest.update(b"\1")
+
+    return digest.hexdigest()
+
+
+def load_cached(name: str, key: str) -> Optional[Any]:
+    """
+    Reads an object stored with store_cached.
+
+    Args:
+    ----
+    name (str): Kind of object, used as file name prefix.
+    key (str): Hash of the inputs the object was computed from.
+
+    Returns:
+    -------
+    Optional[Any]: The stored object, or None if there is none for this key.
+
+    """
+    path = os.path.join(get_cache_dir(), f"{name}_{key}.pkl")
+
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    # Mark the file as recently used, so prune_cached keeps it
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    return value
+
+
+def store_cached(name: str, key: str, value: Any) -> None:
+    """
+    Writes an object to the cache directory. The file is written under a temporary
+    name and renamed, so readers never see a partially written file. Older files of the
+    same kind are then pruned, see prune_cached.
+
+    Args:
+    ----
+    name (str): Kind of object, used as file name prefix.
+    key (str): Hash of the inputs the object was computed from.
+    value (Any): Object to store.
+
+    """
+    cache_dir = get_cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(cache_dir, f"{name}_{key}.pkl"))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    prune_cached(name)
+
+
+def prune_cached(name: str, keep: int = CACHE_ENTRIES) -> None:
+    """
+    Removes the files of a kind of object but the keep most recently used ones.
+
+    Args:
+    ----
+    name (str): Kind of object, used as file name prefix.
+    keep (int): Number of files kept.
+
+    """
+    cache_dir = get_cache_dir()
+    pattern = re.compile(re.escape(name) + r"_[0-9a-f]{64}\.pkl")
+
+    # Files removed by another process in the meantime are skipped
+    entries = []
+    for file_name in os.listdir(cache_dir):
+        if pattern.fullmatch(file_name):
+            path = os.path.join(cache_dir, file_name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                pass
+    entries.sort(reverse=True)
+
+    for _, path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,434 @@
+import bisect
+import hashlib
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .cache import load_cached, settings_digest, store_cached, update_with_file
+from .profiling import substitute
+from .resources import get_config, get_normalization_type
+from .rules import get_rules, rewrite_token, rules_for
+from .text_normalizations import (
+    abbreviation_creator,
+    bigram_topic_matrix_creator,
+    lemma_stem,
+    lemmatize_texts,
+    stem_lookup_keys,
+    text_normalizer,
+    topic_cleaner,
+    unigram_topic_matrix_creator,
+)
+from .topics import TopicIndex, as_topic_index
+
+
+def text_fingerprint(text: str) -> str:
+    """
+    Hashes the text of a response.
+
+    Args:
+    ----
+    text (str): Raw answer.
+
+    Returns:
+    -------
+    str: Hex sha1 digest.
+
+    """
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def topic_index_fingerprint(unigram_index: TopicIndex, bigram_index: TopicIndex) -> str:
+    """
+    Hashes the labels and keywords of the topic indexes, so topic rows are recomputed when the taxonomy changes.
+
+    Args:
+    ----
+    unigram_index (TopicIndex): Topic index of the unigram keywords.
+    bigram_index (TopicIndex): Topic index of the bigram keywords.
+
+    Returns:
+    -------
+    str: Hex sha256 digest.
+
+    """
+    digest = hashlib.sha256()
+    for topic_index in (unigram_index, bigram_index):
+        digest.update("\0".join(topic_index.labels).encode("utf-8") + b"\1")
+        for keyword in sorted(topic_index.keywords):
+            topic_ids = ",".join(map(str, topic_index.keywords[keyword].tolist()))
+            digest.update(f"{keyword}\0{topic_ids}\0".encode("utf-8"))
+        digest.update(b"\1")
+
+    return digest.hexdigest()
+
+
+def state_key(population: str) -> str:
+    """
+    Hashes everything the stored state of a population depends on besides the responses.
+
+    Args:
+    ----
+    population (str): "citizens" or "councilors".
+
+    Returns:
+    -------
+    str: Hex sha256 digest.
+
+    """
+    digest = settings_digest("incremental", population)
+    update_with_file(digest, get_config()["additional_topic_stopwords_path"])
+
+    return digest.hexdigest()
+
+
+class IncrementalState:
+    """
+    Intermediate outputs of the topic pipeline for the responses of one population, keyed by response id.
+
+    A response goes through text_normalizer, abbreviation_creator, the stem dictionary,
+    cleaner, the topic analysis rules, topic_cleaner and the topic matrix creators like in
+    the notebook. The stem dictionary is kept with the number of responses using each
+    word, so it can be updated when responses are added, edited or removed, and the
+    responses whose words are looked up under a stem are indexed by that stem. After an
+    update only the new and edited responses, and the responses using a stem whose first
+    original form changed, are cleaned again, and only the responses whose cleaned text
+    changed are tagged again.
+
+    Attributes:
+    ----------
+    population (str): "citizens" or "councilors", selects the topic analysis rules.
+    normalization_type (str): "stem" or "lemma", how the stem dictionary is keyed.
+    fingerprints (Dict[Any, str]): Text hash of every response.
+    words (Dict[Any, Set[str]]): Distinct lowercase words of every response, the vocabulary of the stem dictionary.
+    keys (Dict[Any, List[str]]): Tokens cleaner() looks up in the stem dictionary for every response.
+    word_counts (Dict[str, int]): Number of responses using every word.
+    rewritten (Dict[str, Optional[str]]): Every word rewritten by the cleaning rules, None if dropped.
+    rewritten_counts (Dict[str, int]): Number of words of the vocabulary rewritten to every rewritten word.
+    stems (Dict[str, str]): Stem or lemma of every rewritten word seen so far.
+    stem_dict (Dict[str, List[str]]): Stems with their original forms, sorted, as unify_citizens_councilors_texts builds them.
+    key_rows (Dict[str, Set[Any]]): Responses looking up every token.
+    cleaned (Dict[Any, str]): Text of every response after topic_cleaner.
+    topic_rows (Dict[Any, np.ndarray]): Topic matrix row of every response, as booleans.
+    topics_fingerprint (Optional[str]): Fingerprint of the topic indexes the topic rows were computed with.
+
+    """
+
+    def __init__(self, population: str, normalization_type: str):
+        self.population = population
+        self.normalization_type = normalization_type
+        self.fingerprints: Dict[Any, str] = {}
+        self.words: Dict[Any, Set[str]] = {}
+        self.keys: Dict[Any, List[str]] = {}
+        self.word_counts: Dict[str, int] = {}
+        self.rewritten: Dict[str, Optional[str]] = {}
+        self.rewritten_counts: Dict[str, int] = {}
+        self.stems: Dict[str, str] = {}
+        self.stem_dict: Dict[str, List[str]] = {}
+        self.key_rows: Dict[str, Set[Any]] = {}
+        self.cleaned: Dict[Any, str] = {}
+        self.topic_rows: Dict[Any, np.ndarray] = {}
+        self.topics_fingerprint: Optional[str] = None
+
+    def _remove_response(self, response_id: Any, removed_words: Set[str]) -> None:
+        """
+        Forgets a response, collecting the words no response uses anymore.
+
+        Args:
+        ----
+        response_id (Any): Id of the response.
+        removed_words (Set[str]): Words left unused, updated in place.
+
+        """
+        for word in self.words.pop(response_id):
+            self.word_counts[word] -= 1
+            if not self.word_counts[word]:
+                del self.word_counts[word]
+                removed_words.add(word)
+
+        for key in set(self.keys.pop(response_id)):
+            self.key_rows[key].discard(response_id)
+            if not self.key_rows[key]:
+                del self.key_rows[key]
+
+        del self.fingerprints[response_id]
+        self.cleaned.pop(response_id, None)
+        self.topic_rows.pop(response_id, None)
+
+    def _add_response(self, response_id: Any, text: str, added_words: Set[str]) -> None:
+        """
+        Applies text_normalizer and abbreviation_creator to a response and indexes its words.
+
+        Args:
+        ----
+        response_id (Any): Id of the response.
+        text (str): Raw answer.
+        added_words (Set[str]): Words no response used before, updated in place.
+
+        """
+        fingerprint = text_fingerprint(text)
+        text = abbreviation_creator(text_normalizer(text))
+
+        words = set(token.lower() for token in text.split())
+        for word in words:
+            if word in self.word_counts:
+                self.word_counts[word] += 1
+            else:
+                self.word_counts[word] = 1
+                added_words.add(word)
+
+        keys = stem_lookup_keys(text)
+        for key in set(keys):
+            self.key_rows.setdefault(key, set()).add(response_id)
+
+        self.fingerprints[response_id] = fingerprint
+        self.words[response_id] = words
+        self.keys[response_id] = keys
+
+    def _update_stem_dict(
+        self, added_words: Set[str], removed_words: Set[str]
+    ) -> Set[str]:
+        """
+        Adds and removes words from the stem dictionary.
+
+        Args:
+        ----
+        added_words (Set[str]): Words that joined the vocabulary.
+        removed_words (Set[str]): Words that left the vocabulary.
+
+        Returns:
+        -------
+        Set[str]: Stems whose first original form, the one cleaner() uses, changed.
+
+        """
+        ruleset = get_rules("cleaner")
+
+        # A word can leave and join again within one update
+        added_words, removed_words = (
+            added_words - removed_words,
+            removed_words - added_words,
+        )
+
+        joined, left = [], []
+        for word in added_words:
+            if word not in self.rewritten:
+                self.rewritten[word] = rewrite_token(word, ruleset)
+            rewritten = self.rewritten[word]
+            if rewritten is None:
+                continue
+            if rewritten in self.rewritten_counts:
+                self.rewritten_counts[rewritten] += 1
+            else:
+                self.rewritten_counts[rewritten] = 1
+                joined.append(rewritten)
+
+        for word in removed_words:
+            rewritten = self.rewritten[word]
+            if rewritten is None:
+                continue
+            self.rewritten_counts[rewritten] -= 1
+            if not self.rewritten_counts[rewritten]:
+                del self.rewritten_counts[rewritten]
+                left.append(rewritten)
+
+        # Stemming or lemmatizing only the words never seen before
+        unseen = sorted(word for word in joined if word not in self.stems)
+        if self.normalization_type == "lemma":
+            self.stems.update(zip(unseen, lemmatize_texts(unseen)))
+        else:
+            self.stems.update(
+                (word, lemma_stem(word, self.normalization_type)) for word in unseen
+            )
+
+        first_forms = {}
+        for word in joined + left:
+            stem = self.stems[word]
+            if stem not in first_forms:
+                forms = self.stem_dict.get(stem)
+                first_forms[stem] = forms[0] if forms else None
+
+        for word in joined:
+            bisect.insort(self.stem_dict.setdefault(self.stems[word], []), word)
+
+        for word in left:
+            stem = self.stems[word]
+            forms = self.stem_dict[stem]
+            del forms[bisect.bisect_left(forms, word)]
+            if not forms:
+                del self.stem_dict[stem]
+
+        return {
+            stem
+            for stem, first_form in first_forms.items()
+            if (self.stem_dict[stem][0] if stem in self.stem_dict else None)
+            != first_form
+        }
+
+    def _clean(self, response_id: Any) -> str:
+        """
+        Applies the stem dictionary, the topic analysis rules and topic_cleaner to a response.
+
+        Args:
+        ----
+        response_id (Any): Id of the response.
+
+        Returns:
+        -------
+        str: The response as the topic matrix creators see it.
+
+        """
+        stem_dict = self.stem_dict
+        text = " ".join(
+            stem_dict[key][0] if key in stem_dict else key
+            for key in self.keys[response_id]
+        ).strip()
+
+        for rule in rules_for(get_rules("topic analysis"), self.population):
+            text = substitute(rule, text)
+
+        return topic_cleaner(text)
+
+    def update(
+        self,
+        response_ids: List[Any],
+        texts: List[str],
+        unigram_index: TopicIndex,
+        bigram_index: TopicIndex,
+    ) -> Dict[str, int]:
+        """
+        Brings the state in line with the current responses of the population.
+
+        Args:
+        ----
+        response_ids (List[Any]): Id of every response, e.g. Anonymous_id or id_anonymous.
+        texts (List[str]): Raw answer of every response.
+        unigram_index (TopicIndex): Topic index of the unigram keywords.
+        bigram_index (TopicIndex): Topic index of the bigram keywords.
+
+        Returns:
+        -------
+        Dict[str, int]: Number of "added", "edited" and "removed" responses, of responses
+        "cleaned" again and of responses "tagged" again.
+
+        """
+        if len(set(response_ids)) != len(response_ids):
+            raise ValueError("The response ids are not unique")
+
+        current = dict(zip(response_ids, texts))
+        removed = [
+            response_id
+            for response_id in self.fingerprints
+            if response_id not in current
+        ]
+        added, edited = [], []
+        for response_id, text in current.items():
+            fingerprint = self.fingerprints.get(response_id)
+            if fingerprint is None:
+                added.append(response_id)
+            elif fingerprint != text_fingerprint(text):
+                edited.append(response_id)
+
+        added_words, removed_words = set(), set()
+        for response_id in removed + edited:
+            self._remove_response(response_id, removed_words)
+        for response_id in added + edited:
+            self._add_response(response_id, current[response_id], added_words)
+
+        # Responses using a stem whose first form changed are cleaned again too
+        to_clean = set(added + edited)
+        for stem in self._update_stem_dict(added_words, removed_words):
+            to_clean.update(self.key_rows.get(stem, ()))
+
+        to_tag = set(
+            response_id for response_id in current if response_id not in self.topic_rows
+        )
+        for response_id in to_clean:
+            text = self._clean(response_id)
+            if self.cleaned.get(response_id) != text:
+                self.cleaned[response_id] = text
+                to_tag.add(response_id)
+
+        topics_fingerprint = topic_index_fingerprint(unigram_index, bigram_index)
+        if topics_fingerprint != self.topics_fingerprint:
+            to_tag = set(current)
+            self.topics_fingerprint = topics_fingerprint
+
+        if to_tag:
+            tagged = [
+                response_id for response_id in response_ids if response_id in to_tag
+            ]
+            dataframe = pd.DataFrame(
+                {"cleaned": [self.cleaned[response_id] for response_id in tagged]}
+            )
+            matrix = unigram_topic_matrix_creator(
+                dataframe, unigram_index, output="bool"
+            )
+            matrix = bigram_topic_matrix_creator(
+                dataframe, bigram_index, output="bool", out=matrix
+            )
+            self.topic_rows.update(zip(tagged, matrix))
+
+        return {
+            "added": len(added),
+            "edited": len(edited),
+            "removed": len(removed),
+            "cleaned": len(to_clean),
+            "tagged": len(to_tag),
+        }
+
+
+def update_topic_analysis(
+    dataframe: pd.DataFrame,
+    id_column: str,
+    population: str,
+    unigram_index: Union[TopicIndex, Dict[str, str]],
+    bigram_index: Union[TopicIndex, Dict[str, str]],
+    text_column: str = "Q30",
+) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Runs the topic pipeline of a population incrementally, reusing the state stored in the cache directory by the previous run.
+
+    Only new and edited responses are normalized again, the stem dictionary is updated
+    with their words, and topic rows are recomputed only where the cleaned text changed.
+    The state is dropped when the stopword files, the normalization rules or the
+    normalization type change, and the topic rows are recomputed when the topic indexes
+    change. The output is the same as running the notebook steps over all responses.
+
+    Args:
+    ----
+    dataframe (pd.DataFrame): Responses of the population, without empty answers.
+    id_column (str): Column holding the response ids, "Anonymous_id" for citizens and "id_anonymous" for councilors.
+    population (str): "citizens" or "councilors", selects the topic analysis rules.
+    unigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the unigram keywords.
+    bigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the bigram keywords.
+    text_column (str): Column holding the answers.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, np.ndarray]: The DataFrame with the "cleaned" column set, and its topic matrix of 0s and 1s as binarize_topic_matrices returns it.
+
+    """
+    unigram_index = as_topic_index(unigram_index)
+    bigram_index = as_topic_index(bigram_index)
+
+    name = f"incremental_{population}"
+    key = state_key(population)
+    state = load_cached(name, key)
+    if state is None:
+        state = IncrementalState(population, get_normalization_type())
+
+    response_ids = dataframe[id_column].values.tolist()
+    state.update(
+        response_ids,
+        dataframe[text_column].astype(str).values.tolist(),
+        unigram_index,
+        bigram_index,
+    )
+    store_cached(name, key, state)
+
+    dataframe["cleaned"] = [state.cleaned[response_id] for response_id in response_ids]
+    matrix = np.zeros((len(response_ids), len(unigram_index.labels)))
+    for row, response_id in enumerate(response_ids):
+        matrix[row] = state.topic_rows[response_id]
+
+    return dataframe, matrix
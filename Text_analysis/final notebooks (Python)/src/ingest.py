@@ -0,0 +1,300 @@
+import argparse
+import os
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from .resources import get_config
+
+# Excel files set in config.json and the sheets read from each, 0 being the first sheet
+EXCEL_SOURCES: Dict[str, Tuple[Union[int, str], ...]] = {
+    "text analysis data excel path": (0,),
+    "councilors spelled excel path": (0,),
+    "citizens full excel path": (0,),
+    "councilors full excel path": (0,),
+    "immigrants populations excel path": (0,),
+    "stopwords excel path": ("stopwords",),
+    "topic excel path": ("unigrams", "bigrams"),
+}
+
+# File extension of every columnar format, in the order load_sheet looks for them
+FORMATS = {"feather": ".feather", "parquet": ".parquet", "pickle": ".pkl"}
+
+
+def has_pyarrow() -> bool:
+    """
+    Tells whether pyarrow, which Feather and Parquet files need, is installed.
+
+    Returns:
+    -------
+    bool: True if pyarrow can be imported.
+
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+
+    return True
+
+
+def get_ingest_dir() -> str:
+    """
+    Returns the directory of the converted files set in config.json, "data/ingested" by default.
+
+    Returns:
+    -------
+    str: Path to the directory.
+
+    """
+    return get_config().get("ingest path", os.path.join("data", "ingested"))
+
+
+def get_ingest_format() -> str:
+    """
+    Returns the format set in config.json, Feather by default, or pickle when pyarrow is not installed.
+
+    Returns:
+    -------
+    str: One of "feather", "parquet" or "pickle".
+
+    """
+    data_format = get_config().get("ingest format")
+    if data_format is None:
+        data_format = "feather" if has_pyarrow() else "pickle"
+
+    return data_format
+
+
+def converted_path(path: str, sheet_name: Union[int, str], data_format: str) -> str:
+    """
+    Returns where the converted copy of an Excel sheet is stored.
+
+    Args:
+    ----
+    path (str): Path to the Excel file.
+    sheet_name (Union[int, str]): Sheet of the file.
+    data_format (str): One of "feather", "parquet" or "pickle".
+
+    Returns:
+    -------
+    str: Path to the converted file.
+
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+
+    return os.path.join(get_ingest_dir(), f"{name}__{sheet_name}{FORMATS[data_format]}")
+
+
+def string_columns(columns: Sequence[object]) -> List[str]:
+    """
+    Turns column headers into the distinct strings Feather and Parquet files require.
+
+    Headers are converted with str(), and a header seen before gets a ".1", ".2", ...
+    suffix, as pd.read_excel does for repeated headers.
+
+    Args:
+    ----
+    columns (Sequence[object]): Column headers, e.g. numbers read from the header row of a sheet.
+
+    Returns:
+    -------
+    List[str]: Distinct column names, in the order of columns.
+
+    """
+    names = []
+    seen = set()
+    for column in columns:
+        name = base = str(column)
+        suffix = 0
+        while name in seen:
+            suffix += 1
+            name = f"{base}.{suffix}"
+        seen.add(name)
+        names.append(name)
+
+    return names
+
+
+def write_sheet(dataframe: pd.DataFrame, path: str, data_format: str) -> None:
+    """
+    Writes a sheet in a columnar format. The file is written under a temporary name and
+    renamed, so a reader never loads a partially written file. Feather and Parquet files
+    store the column headers as distinct strings, see string_columns.
+
+    Args:
+    ----
+    dataframe (pd.DataFrame): Contents of the sheet.
+    path (str): Path to the converted file.
+    data_format (str): One of "feather", "parquet" or "pickle".
+
+    """
+    tmp_path = path + ".tmp"
+
+    if data_format != "pickle":
+        dataframe = dataframe.set_axis(string_columns(dataframe.columns), axis=1)
+
+    try:
+        if data_format == "feather":
+            # Uncompressed, so that the file can be memory-mapped when loading
+            dataframe.to_feather(tmp_path, compression="uncompressed")
+        elif data_format == "parquet":
+            dataframe.to_parquet(tmp_path, index=False)
+        else:
+            dataframe.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_converted(path: str, data_format: str) -> pd.DataFrame:
+    """
+    Reads a sheet converted by write_sheet, memory-mapping Feather and Parquet files.
+
+    Args:
+    ----
+    path (str): Path to the converted file.
+    data_format (str): One of "feather", "parquet" or "pickle".
+
+    Returns:
+    -------
+    pd.DataFrame: Contents of the sheet.
+
+    """
+    if data_format == "feather":
+        from pyarrow import feather
+
+        return feather.read_table(path, memory_map=True).to_pandas()
+    if data_format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, memory_map=True).to_pandas()
+
+    return pd.read_pickle(path)
+
+
+def load_sheet(path: str, sheet_name: Union[int, str] = 0) -> pd.DataFrame:
+    """
+    Reads an Excel sheet from its converted copy, falling back to the Excel file itself.
+
+    The converted copies are tried in the order of FORMATS, skipping those written before
+    the Excel file was last modified. The Excel file is parsed only when no copy is up to
+    date, with a warning if stale copies exist, in which case `python -m src.ingest`
+    should be run again.
+
+    Args:
+    ----
+    path (str): Path to the Excel file, as set in config.json.
+    sheet_name (Union[int, str]): Sheet of the file, 0 being the first sheet.
+
+    Returns:
+    -------
+    pd.DataFrame: Contents of the sheet, as pd.read_excel returns it, with the headers of a Feather or Parquet copy turned into strings.
+
+    """
+    source_mtime = os.path.getmtime(path)
+
+    # Converted copies older than the Excel file, tried in the order of FORMATS
+    stale = []
+    for data_format in FORMATS:
+        copy_path = converted_path(path, sheet_name, data_format)
+        if not os.path.exists(copy_path):
+            continue
+
+        if os.path.getmtime(copy_path) < source_mtime:
+            stale.append(copy_path)
+            continue
+
+        if data_format != "pickle" and not has_pyarrow():
+            continue
+
+        return read_converted(copy_path, data_format)
+
+    if stale:
+        warnings.warn(
+            f"{path} is newer than {', '.join(stale)}, reading the Excel file. "
+            "Run `python -m src.ingest` to convert it again."
+        )
+
+    return pd.read_excel(path, sheet_name=sheet_name)
+
+
+def ingest(
+    keys: Optional[Sequence[str]] = None,
+    data_format: Optional[str] = None,
+    force: bool = False,
+) -> List[str]:
+    """
+    Converts the Excel files set in config.json to a columnar format once, for load_sheet.
+
+    Sheets whose converted copy is newer than the Excel file are skipped unless force is
+    set, and Excel files that do not exist are skipped.
+
+    Args:
+    ----
+    keys (Optional[Sequence[str]]): Config keys of the files to convert, every key of EXCEL_SOURCES by default.
+    data_format (Optional[str]): One of "feather", "parquet" or "pickle", the format set in config.json by default.
+    force (bool): Convert the sheets even if their converted copy is up to date.
+
+    Returns:
+    -------
+    List[str]: Paths of the converted files written.
+
+    """
+    data_format = data_format or get_ingest_format()
+    if data_format not in FORMATS:
+        raise ValueError(
+            f"Unknown format {data_format!r}, expected any of {list(FORMATS)}"
+        )
+
+    config_dict = get_config()
+    os.makedirs(get_ingest_dir(), exist_ok=True)
+
+    written = []
+    for key in keys or EXCEL_SOURCES:
+        path = config_dict[key]
+        if not os.path.exists(path):
+            continue
+
+        for sheet_name in EXCEL_SOURCES[key]:
+            copy_path = converted_path(path, sheet_name, data_format)
+            if (
+                not force
+                and os.path.exists(copy_path)
+                and os.path.getmtime(copy_path) >= os.path.getmtime(path)
+            ):
+                continue
+
+            write_sheet(
+                pd.read_excel(path, sheet_name=sheet_name), copy_path, data_format
+            )
+            written.append(copy_path)
+
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Convert the Excel files in config.json to a columnar format."
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(FORMATS),
+        default=None,
+        help="output format, the one in config.json by default",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="convert up-to-date sheets again"
+    )
+    parser.add_argument("keys", nargs="*", help="config keys, all Excel files if none")
+    args = parser.parse_args(argv)
+
+    for path in ingest(args.keys or None, data_format=args.format, force=args.force):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from typing import Dict, List
+
+# Characters that make a keyword a regular expression rather than a literal string
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def is_literal(keyword: str) -> bool:
+    """
+    Tells whether a keyword matches as a regular expression exactly where it occurs as a substring.
+
+    Args:
+    ----
+    keyword (str): Keyword to check.
+
+    Returns:
+    -------
+    bool: True if the keyword has no regular expression metacharacters.
+
+    """
+    return not REGEX_METACHARACTERS.intersection(keyword)
+
+
+class KeywordMatcher:
+    """
+    Aho–Corasick automaton that finds every keyword occurring as a substring of a text in one scan.
+
+    Every keyword carries an integer bitmask, e.g. the topic columns it marks, and a scan
+    returns the bitwise OR of the masks of all keywords found in the text.
+
+    Attributes:
+    ----------
+    goto (List[Dict[str, int]]): Trie transitions of every state.
+    fail (List[int]): Longest proper suffix state of every state.
+    output (List[int]): OR of the masks of the keywords ending at every state, including through fail links.
+
+    """
+
+    __slots__ = ("goto", "fail", "output")
+
+    def __init__(self, keywords: Dict[str, int]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[int] = [0]
+
+        # Build the trie
+        for keyword, mask in keywords.items():
+            state = 0
+            for character in keyword:
+                next_state = self.goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][character] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(0)
+                state = next_state
+            self.output[state] |= mask
+
+        # Link every state to its longest proper suffix, breadth first
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for character, next_state in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback and character not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(character, 0)
+                self.output[next_state] |= self.output[self.fail[next_state]]
+                queue.append(next_state)
+
+    def match(self, text: str) -> int:
+        """
+        Scans a text once and collects the masks of the keywords it contains.
+
+        Args:
+        ----
+        text (str): Text to scan.
+
+        Returns:
+        -------
+        int: OR of the masks of every keyword found in the text, 0 if there is none.
+
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        found = output[0]
+
+        for character in text:
+            while state and character not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(character, 0)
+            found |= output[state]
+
+        return found
@@ -0,0 +1,167 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from .resources import get_stop_word_set, warmup
+from .rules import get_rules
+from .text_normalizations import (
+    abbreviation_creator,
+    cleaner,
+    text_normalizer,
+    topic_cleaner,
+    topic_normalizer,
+)
+
+# Per-response functions the pipeline can run, by name
+STAGES: Dict[str, Callable[..., str]] = {
+    "text_normalizer": text_normalizer,
+    "abbreviation_creator": abbreviation_creator,
+    "cleaner": cleaner,
+    "topic_normalizer": topic_normalizer,
+    "topic_cleaner": topic_cleaner,
+}
+
+# State of a worker process, set once by _initialize_worker
+_worker_stages: List[Callable[[str], str]] = []
+
+
+def _initialize_worker(
+    stages: Sequence[str], stem_dict: Optional[Any], population: Optional[str]
+) -> None:
+    """
+    Loads the resources the stages need and binds the stages, once per worker process.
+
+    Args:
+    ----
+    stages (Sequence[str]): Names of the stages, in the order they run.
+    stem_dict (Optional[Any]): Stem dictionary the "cleaner" stage looks words up in.
+    population (Optional[str]): Population whose rules the "topic_normalizer" stage applies.
+
+    """
+    warmup()
+    get_rules("cleaner")
+    get_rules("topic analysis")
+    get_rules("topic cleaner")
+    get_stop_word_set()
+
+    bound = {
+        "cleaner": lambda text: cleaner(text, stem_dict),
+        "topic_normalizer": lambda text: topic_normalizer(text, population),
+    }
+    _worker_stages[:] = [bound.get(stage, STAGES[stage]) for stage in stages]
+
+
+def _run_chunk(texts: List[str]) -> List[str]:
+    """
+    Runs the stages of the worker over a chunk of responses.
+
+    Args:
+    ----
+    texts (List[str]): Responses of the chunk.
+
+    Returns:
+    -------
+    List[str]: Processed responses in the order of texts.
+
+    """
+    for stage in _worker_stages:
+        texts = [stage(text) for text in texts]
+
+    return texts
+
+
+def run_pipeline(
+    texts: Sequence[str],
+    stages: Sequence[str],
+    stem_dict: Optional[Any] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    population: Optional[str] = None,
+) -> List[str]:
+    """
+    Runs per-response normalization stages over many responses in a pool of worker processes.
+
+    The responses are split in chunks of chunk_size. Every worker loads the compiled rules,
+    the stopwords and the stemmer once when it starts, then processes chunks until all are
+    done, and the results are put back in the order of texts. The stages
+    ["cleaner", "topic_normalizer", "topic_cleaner"] give what normalize_text_for_topic_analysis
+    followed by topic_cleaner gives in the notebook.
+
+    Args:
+    ----
+    texts (Sequence[str]): Responses to process.
+    stages (Sequence[str]): Names of the stages in STAGES, in the order they run.
+    stem_dict (Optional[Any]): Stem dictionary from unify_citizens_councilors_texts, required by the "cleaner" stage.
+    max_workers (Optional[int]): Number of worker processes, the number of CPUs by default.
+    chunk_size (int): Number of responses sent to a worker at a time.
+    population (Optional[str]): Population of the responses, "citizens" or "councilors", required by the "topic_normalizer" stage.
+
+    Returns:
+    -------
+    List[str]: Processed responses in the order of texts.
+
+    """
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stages {unknown}, expected any of {list(STAGES)}")
+    if "cleaner" in stages and stem_dict is None:
+        raise ValueError("The cleaner stage needs a stem_dict")
+    if "topic_normalizer" in stages and population is None:
+        raise ValueError("The topic_normalizer stage needs a population")
+
+    texts = list(texts)
+    chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    max_workers = min(max_workers or os.cpu_count() or 1, max(len(chunks), 1))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(list(stages), stem_dict, population),
+    ) as executor:
+        # map keeps the order of the chunks
+        results = executor.map(_run_chunk, chunks)
+
+        return [text for chunk in results for text in chunk]
+
+
+def apply_pipeline(
+    dataframe: pd.DataFrame,
+    stages: Sequence[str],
+    stem_dict: Optional[Any] = None,
+    source: str = "cleaned",
+    target: str = "cleaned",
+    max_workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    population: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    Runs run_pipeline over a column of a DataFrame and stores the result in another one.
+
+    Args:
+    ----
+    dataframe (pd.DataFrame): Citizens or councilors text data.
+    stages (Sequence[str]): Names of the stages in STAGES, in the order they run.
+    stem_dict (Optional[Any]): Stem dictionary of the population, required by the "cleaner" stage.
+    source (str): Column holding the responses.
+    target (str): Column the processed responses are written to.
+    max_workers (Optional[int]): Number of worker processes, the number of CPUs by default.
+    chunk_size (int): Number of responses sent to a worker at a time.
+    population (Optional[str]): Population of the DataFrame, required by the "topic_normalizer" stage.
+
+    Returns:
+    -------
+    pd.DataFrame: The DataFrame, with the target column set.
+
+    """
+    dataframe[target] = run_pipeline(
+        dataframe[source].values.tolist(),
+        stages,
+        stem_dict=stem_dict,
+        max_workers=max_workers,
+        chunk_size=chunk_size,
+        population=population,
+    )
+
+    return dataframe
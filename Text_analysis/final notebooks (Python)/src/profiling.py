@@ -0,0 +1,356 @@
+import json
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class Profiler:
+    """
+    Wall time and call counts of the pipeline stages, and calls, hits and wall time of every normalization rule.
+
+    Stages are the functions decorated with profiled, recorded under the stack of stages
+    they ran in. Rules are recorded by substitute, under the stage they ran in. A rule
+    call is a hit if the rule matched at least once. Tokens rewritten one by one are
+    recorded by record_token, since the ones served from the cache of their RuleSet or
+    skipped by its trigger never reach substitute.
+
+    Attributes:
+    ----------
+    stages (Dict[Tuple[str, ...], List[float]]): Calls and seconds of every stack of stages.
+    rules (Dict[Tuple[Tuple[str, ...], str, int, str], List[float]]): Calls, hits, matches and seconds of every (stack, section, position, name) rule.
+    tokens (Dict[str, List[int]]): Tokens, cache hits and trigger skips of every rule section rewritten token by token.
+    stack (List[str]): Stages running at the moment.
+
+    """
+
+    def __init__(self):
+        self.stages: Dict[Tuple[str, ...], List[float]] = {}
+        self.rules: Dict[Tuple[Tuple[str, ...], str, int, str], List[float]] = {}
+        self.tokens: Dict[str, List[int]] = {}
+        self.stack: List[str] = []
+
+    def stage_stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the statistics of every stage, summed over the stacks it ran in.
+
+        Returns:
+        -------
+        List[Dict[str, Any]]: "stage", "calls" and "seconds" of every stage, slowest first.
+
+        """
+        totals = {}
+        for stack, (calls, seconds) in self.stages.items():
+            # Time of a stage running inside itself is already in the outer call
+            outer = stack[-1] not in stack[:-1]
+            stats = totals.setdefault(stack[-1], [0, 0.0])
+            stats[0] += calls
+            stats[1] += seconds if outer else 0.0
+
+        return sorted(
+            (
+                {"stage": stage, "calls": int(calls), "seconds": seconds}
+                for stage, (calls, seconds) in totals.items()
+            ),
+            key=lambda stats: -stats["seconds"],
+        )
+
+    def rule_stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns the statistics of every rule, summed over the stages it ran in.
+
+        Returns:
+        -------
+        List[Dict[str, Any]]: "section", "position", "name", "calls", "hits", "matches" and "seconds" of every rule, slowest first.
+
+        """
+        totals = {}
+        for (_, section, position, name), stats in self.rules.items():
+            total = totals.setdefault((section, position, name), [0, 0, 0, 0.0])
+            for i, value in enumerate(stats):
+                total[i] += value
+
+        return sorted(
+            (
+                {
+                    "section": section,
+                    "position": position,
+                    "name": name,
+                    "calls": int(calls),
+                    "hits": int(hits),
+                    "matches": int(matches),
+                    "seconds": seconds,
+                }
+                for (section, position, name), (
+                    calls,
+                    hits,
+                    matches,
+                    seconds,
+                ) in totals.items()
+            ),
+            key=lambda stats: -stats["seconds"],
+        )
+
+    def token_stats(self) -> List[Dict[str, Any]]:
+        """
+        Returns how the tokens of every rule section rewritten token by token were handled.
+
+        Only the "rewritten" tokens went through the rules and count in rule_stats. The
+        "cached" ones reused the result of an earlier call, possibly made before
+        profiling started, and the "skipped" ones matched no rule.
+
+        Returns:
+        -------
+        List[Dict[str, Any]]: "section", "tokens", "cached", "skipped" and "rewritten" of every section, in the order they ran.
+
+        """
+        return [
+            {
+                "section": section,
+                "tokens": tokens,
+                "cached": cached,
+                "skipped": skipped,
+                "rewritten": tokens - cached - skipped,
+            }
+            for section, (tokens, cached, skipped) in self.tokens.items()
+        ]
+
+    def unmatched_rules(self, sections: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Lists the rules of the given sections of the normalization rules file that never matched while profiling.
+
+        A token rule can also have matched tokens whose result was cached before
+        profiling started, see token_stats.
+
+        Args:
+        ----
+        sections (Sequence[str]): Rule sections, e.g. ["cleaner", "topic analysis", "topic cleaner"].
+
+        Returns:
+        -------
+        List[Dict[str, Any]]: "section", "position", "name" and "calls" of every rule without a hit, in file order.
+
+        """
+        from .rules import get_rules
+
+        stats = {
+            (rule["section"], rule["position"]): rule for rule in self.rule_stats()
+        }
+
+        unmatched = []
+        for section in sections:
+            for rule in get_rules(section).rules:
+                calls, hits = 0, 0
+                if (section, rule.position) in stats:
+                    calls = stats[(section, rule.position)]["calls"]
+                    hits = stats[(section, rule.position)]["hits"]
+                if not hits:
+                    unmatched.append(
+                        {
+                            "section": section,
+                            "position": rule.position,
+                            "name": rule.name,
+                            "calls": calls,
+                        }
+                    )
+
+        return unmatched
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Exports the stage and rule statistics as JSON.
+
+        Args:
+        ----
+        path (Optional[str]): File to write the JSON to.
+
+        Returns:
+        -------
+        str: The JSON document.
+
+        """
+        document = json.dumps(
+            {
+                "stages": self.stage_stats(),
+                "rules": self.rule_stats(),
+                "tokens": self.token_stats(),
+            },
+            indent=4,
+            ensure_ascii=False,
+        )
+
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(document)
+
+        return document
+
+    def to_folded(self, path: Optional[str] = None) -> str:
+        """
+        Exports the profile as folded stacks, one "stage;stage;rule microseconds" line per
+        frame, which flamegraph.pl and speedscope read. Every line holds the time spent in
+        the frame itself, without the stages and rules it called.
+
+        Args:
+        ----
+        path (Optional[str]): File to write the stacks to.
+
+        Returns:
+        -------
+        str: The folded stacks.
+
+        """
+        self_time = {stack: seconds for stack, (_, seconds) in self.stages.items()}
+        for stack, (_, seconds) in self.stages.items():
+            if stack[:-1] in self_time:
+                self_time[stack[:-1]] -= seconds
+
+        for (stack, section, position, name), stats in self.rules.items():
+            frame = f"{section}[{position}] {name}".replace(";", ",")
+            if stack in self_time:
+                self_time[stack] -= stats[3]
+            self_time[stack + (frame,)] = (
+                self_time.get(stack + (frame,), 0.0) + stats[3]
+            )
+
+        lines = [
+            f"{';'.join(stack)} {round(max(seconds, 0.0) * 1e6)}"
+            for stack, seconds in self_time.items()
+            if stack
+        ]
+        folded = "\n".join(lines) + "\n"
+
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(folded)
+
+        return folded
+
+
+# Profiler recording at the moment, None when profiling is off
+_active: Optional[Profiler] = None
+
+
+def is_profiling() -> bool:
+    """
+    Tells whether a profile() block is running.
+
+    Returns:
+    -------
+    bool: True while profiling.
+
+    """
+    return _active is not None
+
+
+@contextmanager
+def profile() -> Iterator[Profiler]:
+    """
+    Records the stages and rules that run inside the with block.
+
+    Rules rewriting single words run once per distinct word, since their results are
+    memoized by the RuleSet, so their calls are counted per distinct word, and words
+    rewritten before the block are not counted again. Profiler.token_stats gives the
+    number of tokens behind those calls.
+
+    Returns:
+    -------
+    Iterator[Profiler]: The profiler holding the statistics.
+
+    """
+    global _active
+
+    previous = _active
+    _active = Profiler()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+def profiled(function: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Records the calls and wall time of a function as a stage while profiling.
+
+    Args:
+    ----
+    function (Callable[..., Any]): Function to instrument.
+
+    Returns:
+    -------
+    Callable[..., Any]: The instrumented function, which only calls function when profiling is off.
+
+    """
+
+    @wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        profiler = _active
+        if profiler is None:
+            return function(*args, **kwargs)
+
+        profiler.stack.append(function.__name__)
+        stack = tuple(profiler.stack)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            profiler.stack.pop()
+            stats = profiler.stages.setdefault(stack, [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+
+    return wrapper
+
+
+def substitute(rule: Any, text: str) -> str:
+    """
+    Applies a rule to a text, recording the call while profiling.
+
+    Args:
+    ----
+    rule (Rule): Rule to apply.
+    text (str): Text to rewrite.
+
+    Returns:
+    -------
+    str: The text with every match of the rule replaced.
+
+    """
+    profiler = _active
+    if profiler is None:
+        return rule.pattern.sub(rule.replacement, text)
+
+    start = time.perf_counter()
+    text, matches = rule.pattern.subn(rule.replacement, text)
+    elapsed = time.perf_counter() - start
+
+    key = (tuple(profiler.stack), rule.section, rule.position, rule.name)
+    stats = profiler.rules.setdefault(key, [0, 0, 0, 0.0])
+    stats[0] += 1
+    stats[1] += matches > 0
+    stats[2] += matches
+    stats[3] += elapsed
+
+    return text
+
+
+def record_token(ruleset: Any, cached: bool, skipped: bool) -> None:
+    """
+    Records a token rewritten by a RuleSet while profiling.
+
+    Args:
+    ----
+    ruleset (RuleSet): Rules the token went through.
+    cached (bool): Whether the result came from the cache of the RuleSet.
+    skipped (bool): Whether no rule could match the token, so none ran.
+
+    """
+    profiler = _active
+    if profiler is None or not ruleset.rules:
+        return
+
+    stats = profiler.tokens.setdefault(ruleset.rules[0].section, [0, 0, 0])
+    stats[0] += 1
+    stats[1] += cached
+    stats[2] += skipped
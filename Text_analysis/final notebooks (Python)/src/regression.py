@@ -0,0 +1,1046 @@
+import argparse
+import difflib
+import gzip
+import importlib
+import json
+import os
+import re
+import sys
+import types
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import text_normalizations
+from .ingest import load_sheet
+from .parallel import run_pipeline
+from .resources import get_config, get_normalization_type
+from .rules import (
+    Rule,
+    apply_rules_sequentially,
+    compile_rules,
+    get_rules,
+    load_rule_specs,
+    rewrite_texts_by_vocabulary,
+    rewrite_token,
+    rewrite_tokens,
+    rules_for,
+)
+from .stem_index import StemIndex
+from .streaming import stream_stem_dict
+from .text_normalizations import (
+    ABBREVIATION_RULES,
+    apply_topic_rules,
+    cleaner,
+    drop_empty_topics,
+    lemma_stem,
+    stem_lookup_keys,
+    text_normalizer,
+    topic_dictionary,
+    topic_matrix_creator,
+)
+from .topics import TopicIndex
+
+# Shipped answers of every population: config key of the Excel file and id column
+POPULATIONS = {
+    "citizens": ("text analysis data excel path", "Anonymous_id"),
+    "councilors": ("councilors spelled excel path", "id_anonymous"),
+}
+
+# Rule sections of the normalization rules file stored in the snapshot
+RULE_SECTIONS = ("cleaner", "topic analysis", "topic cleaner")
+
+# Columns of the snapshot, in the order the notebook computes them
+TEXT_STAGES = ("prepared", "cleaned", "topic", "topic_cleaned")
+
+# Comparisons of compare_backends, each a faster implementation against its reference
+BACKENDS = (
+    "cleaned",
+    "cleaned[compact]",
+    "cleaned[parallel]",
+    "stem_dict[compact]",
+    "stem_dict[streaming]",
+    "topic[vectorized]",
+    "topic[vocabulary]",
+    "topic_cleaned[parallel]",
+    "topics[single pass]",
+)
+
+
+class Divergence(NamedTuple):
+    """
+    An output that differs from the one it is compared with.
+
+    Attributes:
+    ----------
+    stage (str): Output that differs, e.g. "cleaned", "stem_dict" or "topics".
+    population (str): "citizens" or "councilors".
+    row (Any): Respondent id of the answer, or the stem for the stem dictionaries.
+    expected (Any): Output of the snapshot or of the reference implementation.
+    actual (Any): Output of the current or of the faster implementation.
+    cause (Optional[str]): Rule, keyword or stem dictionary entry that explains the difference, None if none does.
+
+    """
+
+    stage: str
+    population: str
+    row: Any
+    expected: Any
+    actual: Any
+    cause: Optional[str]
+
+
+def get_golden_path() -> str:
+    """
+    Returns the snapshot file set in config.json, "data/golden.json.gz" by default.
+
+    Returns:
+    -------
+    str: Path to the snapshot.
+
+    """
+    return get_config().get("golden path", os.path.join("data", "golden.json.gz"))
+
+
+def load_topic_keywords() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Reads the unigram and bigram topic keywords the way the notebook does.
+
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: Unigram and bigram keywords, a topic per column.
+
+    """
+    sheets = []
+    for sheet_name in ("unigrams", "bigrams"):
+        keywords = load_sheet(get_config()["topic excel path"], sheet_name=sheet_name)
+        keywords.drop(1, inplace=True)
+        sheets.append(keywords.iloc[:, 1:])
+
+    unigrams, bigrams = drop_empty_topics(*sheets)
+    unigrams.fillna("nothing", inplace=True)
+    bigrams.fillna("nothing", inplace=True)
+
+    return unigrams, bigrams
+
+
+def load_topic_indexes() -> Tuple[TopicIndex, TopicIndex]:
+    """
+    Builds the unigram and bigram topic indexes of the topic keywords.
+
+    Returns:
+    -------
+    Tuple[TopicIndex, TopicIndex]: Unigram and bigram topic indexes.
+
+    """
+    unigrams, bigrams = load_topic_keywords()
+    return topic_dictionary(unigrams), topic_dictionary(bigrams)
+
+
+def load_notebook_steps(tree: str) -> types.ModuleType:
+    """
+    Imports the text_normalizations module of another checkout of the project.
+
+    Its src directory is imported as a package of its own, so that the relative imports
+    of the module resolve within that checkout and not to the current one.
+
+    Args:
+    ----
+    tree (str): Project directory of the checkout, the one holding its src directory.
+
+    Returns:
+    -------
+    ModuleType: The text_normalizations module of the checkout.
+
+    """
+    package = types.ModuleType("snapshot_tree")
+    package.__path__ = [os.path.join(os.path.abspath(tree), "src")]
+    sys.modules[package.__name__] = package
+
+    return importlib.import_module(f"{package.__name__}.text_normalizations")
+
+
+def topic_index_labels(
+    topic_dic: Any, matrix_creator: Callable[[pd.DataFrame, Any], Any]
+) -> List[str]:
+    """
+    Returns the topic labels of a topic index, in the order of the topic matrix columns.
+
+    Before TopicIndex, topic_dictionary returned a dictionary from keywords to labels and
+    the matrix creators mapped the labels to columns with a table of their own, so the
+    column of every label is found by running matrix_creator over one of its keywords.
+
+    """
+    if isinstance(topic_dic, TopicIndex):
+        return topic_dic.labels
+
+    keywords = {}
+    for keyword, label in topic_dic.items():
+        keywords.setdefault(label, keyword)
+
+    matrix = matrix_creator(
+        pd.DataFrame({"cleaned": list(keywords.values())}), topic_dic
+    )
+    labels = [""] * matrix.shape[1]
+    for label, row in zip(keywords, matrix):
+        labels[int(np.argmax(row))] = label
+
+    return labels
+
+
+def load_shipped_answers() -> Dict[str, pd.DataFrame]:
+    """
+    Reads the non-empty Q30 answers of every population from the shipped files.
+
+    Returns:
+    -------
+    Dict[str, pd.DataFrame]: DataFrame with "id" and "Q30" columns for every population.
+
+    """
+    answers = {}
+    for population, (config_key, id_column) in POPULATIONS.items():
+        dataframe = load_sheet(get_config()[config_key])
+        dataframe = dataframe.dropna(subset=["Q30"])
+        answers[population] = pd.DataFrame(
+            {
+                "id": dataframe[id_column].values.tolist(),
+                "Q30": dataframe.Q30.astype(str).values.tolist(),
+            }
+        )
+
+    return answers
+
+
+def matched_keywords(
+    text: str,
+    unigram_index: TopicIndex,
+    bigram_index: TopicIndex,
+    whole_tokens: bool = False,
+) -> List[str]:
+    """
+    Lists the topic keywords a text uses.
+
+    Unigrams are matched as tokens. Bigrams are searched as regular expressions anywhere
+    in the text, as bigram_topic_matrix_creator does, or as runs of whole tokens with
+    whole_tokens=True, as topic_matrix_creator does.
+
+    Args:
+    ----
+    text (str): Text after topic_cleaner.
+    unigram_index (TopicIndex): Topic index of the unigram keywords.
+    bigram_index (TopicIndex): Topic index of the bigram keywords.
+    whole_tokens (bool): Match bigrams as runs of whole tokens.
+
+    Returns:
+    -------
+    List[str]: The keywords, sorted.
+
+    """
+    tokens = text.split()
+    keywords = set(token for token in tokens if token in unigram_index.keywords)
+
+    for term in bigram_index.keywords:
+        if whole_tokens:
+            length = len(term.split())
+            runs = (
+                " ".join(tokens[i : i + length])
+                for i in range(len(tokens) - length + 1)
+            )
+            if term in runs:
+                keywords.add(term)
+        elif re.search(term, text) is not None:
+            keywords.add(term)
+
+    return sorted(keywords)
+
+
+def topic_labels(matrix: Any, labels: Sequence[str]) -> List[List[str]]:
+    """
+    Turns a dense topic matrix into the labels of the topics of every row.
+
+    """
+    return [
+        [label for label, value in zip(labels, row) if value] for row in matrix.tolist()
+    ]
+
+
+def build_snapshot(steps: Optional[types.ModuleType] = None) -> Dict[str, Any]:
+    """
+    Runs the notebook's steps over the shipped answers and collects every output.
+
+    Only the steps the notebook calls are taken from steps, so that the snapshot can be
+    taken with the code of another checkout, e.g. the commit the golden snapshot is meant
+    to hold the code to. The keywords are still matched with the current code, and the
+    rules stored are the current ones, which check_snapshot attributes later differences to.
+
+    Args:
+    ----
+    steps (Optional[types.ModuleType]): Module with the notebook's steps, the current text_normalizations by default.
+
+    Returns:
+    -------
+    Dict[str, Any]: The normalization type and rules, the topic labels, the stem dictionaries, and for every population the answers, the "cleaned" column after every step of TEXT_STAGES, the keywords and the topics of every answer.
+
+    """
+    steps = steps or text_normalizations
+    unigram_index, bigram_index = load_topic_indexes()
+    unigrams, bigrams = load_topic_keywords()
+    unigram_dic = steps.topic_dictionary(unigrams)
+    bigram_dic = steps.topic_dictionary(bigrams)
+    labels = topic_index_labels(unigram_dic, steps.unigram_topic_matrix_creator)
+
+    frames = {}
+    for population, dataframe in load_shipped_answers().items():
+        dataframe["prepared"] = [
+            steps.abbreviation_creator(steps.text_normalizer(text))
+            for text in dataframe.Q30.values.tolist()
+        ]
+        # unify_citizens_councilors_texts reads the "cleaned" column
+        dataframe["cleaned"] = dataframe.prepared
+        frames[population] = dataframe
+
+    stem_dicts = steps.unify_citizens_councilors_texts(
+        citizens_df=frames["citizens"], councilors_df=frames["councilors"]
+    )
+
+    for dataframe, stem_dict in zip(frames.values(), stem_dicts):
+        dataframe["cleaned"] = [
+            steps.cleaner(text, stem_dict)
+            for text in dataframe.prepared.values.tolist()
+        ]
+
+    # normalize_text_for_topic_analysis cleans the "cleaned" column in place
+    citizens, councilors = steps.normalize_text_for_topic_analysis(
+        frames["citizens"][["prepared"]].rename(columns={"prepared": "cleaned"}),
+        frames["councilors"][["prepared"]].rename(columns={"prepared": "cleaned"}),
+        *stem_dicts,
+    )
+    frames["citizens"]["topic"] = citizens.cleaned.values.tolist()
+    frames["councilors"]["topic"] = councilors.cleaned.values.tolist()
+
+    populations = {}
+    for population, dataframe in frames.items():
+        dataframe["topic_cleaned"] = [
+            steps.topic_cleaner(text) for text in dataframe.topic.values.tolist()
+        ]
+        topic_texts = pd.DataFrame({"cleaned": dataframe.topic_cleaned})
+
+        matrix = np.logical_or(
+            steps.unigram_topic_matrix_creator(topic_texts, unigram_dic),
+            steps.bigram_topic_matrix_creator(topic_texts, bigram_dic),
+        )
+
+        populations[population] = {
+            "ids": dataframe.id.values.tolist(),
+            "Q30": dataframe.Q30.values.tolist(),
+            **{stage: dataframe[stage].values.tolist() for stage in TEXT_STAGES},
+            "keywords": [
+                matched_keywords(text, unigram_index, bigram_index)
+                for text in dataframe.topic_cleaned.values.tolist()
+            ],
+            "topics": topic_labels(matrix, labels),
+        }
+
+    return {
+        "normalization type": get_normalization_type(),
+        "rules": {
+            "abbreviations": [
+                [abbreviation, list(triggers), pattern, replacement]
+                for abbreviation, triggers, pattern, replacement in ABBREVIATION_RULES
+            ],
+            **{section: load_rule_specs(section) for section in RULE_SECTIONS},
+        },
+        "labels": labels,
+        "stem_dicts": dict(zip(POPULATIONS, stem_dicts)),
+        "populations": populations,
+    }
+
+
+def write_snapshot(
+    path: Optional[str] = None, steps: Optional[types.ModuleType] = None
+) -> str:
+    """
+    Stores the outputs for the shipped answers as the golden snapshot.
+
+    Args:
+    ----
+    path (Optional[str]): Snapshot file, the one set in config.json by default.
+    steps (Optional[types.ModuleType]): Module with the notebook's steps, see build_snapshot.
+
+    Returns:
+    -------
+    str: Path to the snapshot.
+
+    """
+    path = path or get_golden_path()
+    document = json.dumps(build_snapshot(steps), ensure_ascii=False, indent=1)
+
+    # A fixed timestamp keeps the file identical when the outputs are
+    with open(path, "wb") as f:
+        with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+            gz.write(document.encode("utf-8"))
+
+    return path
+
+
+def read_snapshot(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Reads a snapshot written by write_snapshot.
+
+    Args:
+    ----
+    path (Optional[str]): Snapshot file, the one set in config.json by default.
+
+    Returns:
+    -------
+    Dict[str, Any]: The snapshot, as build_snapshot returns it.
+
+    """
+    with gzip.open(path or get_golden_path(), "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def describe_rule(rule: Rule) -> str:
+    return f"{rule.section}[{rule.position}] {rule.name}"
+
+
+def abbreviation_rules(table: Sequence[Sequence[Any]]) -> Tuple[Rule, ...]:
+    """
+    Turns a table like ABBREVIATION_RULES into rules, so they can be traced like the others.
+
+    """
+    return tuple(
+        Rule(
+            name=abbreviation,
+            pattern=re.compile(pattern),
+            replacement=replacement,
+            scope="text",
+            section="abbreviations",
+            position=position,
+        )
+        for position, (abbreviation, _, pattern, replacement) in enumerate(table)
+    )
+
+
+def substitute_text(rule: Rule, text: str) -> str:
+    return rule.pattern.sub(rule.replacement, text)
+
+
+def substitute_tokens(rule: Rule, tokens: Tuple[str, ...]) -> Tuple[str, ...]:
+    # One step of apply_rules_sequentially
+    tokens = tuple(rule.pattern.sub(rule.replacement, token) for token in tokens)
+    if rule.drop_short:
+        tokens = tuple(token for token in tokens if len(token) > 1)
+
+    return tokens
+
+
+def fired_rules(
+    state: Any, rules: Sequence[Rule], step: Callable[[Rule, Any], Any]
+) -> List[int]:
+    """
+    Applies rules one by one and returns the positions of the ones that changed the input.
+
+    Args:
+    ----
+    state (Any): Text or tokens the rules start from.
+    rules (Sequence[Rule]): Rules in the order they are applied.
+    step (Callable[[Rule, Any], Any]): Applies one rule, substitute_text or substitute_tokens.
+
+    Returns:
+    -------
+    List[int]: Positions in rules.
+
+    """
+    fired = []
+    for i, rule in enumerate(rules):
+        rewritten = step(rule, state)
+        if rewritten != state:
+            fired.append(i)
+        state = rewritten
+
+    return fired
+
+
+def changed_rule_cause(
+    state: Any,
+    old_rules: Sequence[Rule],
+    new_rules: Sequence[Rule],
+    step: Callable[[Rule, Any], Any],
+) -> Optional[str]:
+    """
+    Finds the rule edit of the normalization rules that changes the output for an input.
+
+    The two lists are aligned on the pattern, replacement, drop_short and populations of
+    their rules, and the first added or edited rule that rewrites the input, or else the
+    first removed or edited rule that rewrote it, is returned.
+
+    Args:
+    ----
+    state (Any): Text or tokens the rules start from.
+    old_rules (Sequence[Rule]): Rules stored in the snapshot.
+    new_rules (Sequence[Rule]): Current rules.
+    step (Callable[[Rule, Any], Any]): Applies one rule, substitute_text or substitute_tokens.
+
+    Returns:
+    -------
+    Optional[str]: Description of the rule, None if no edited rule rewrites the input.
+
+    """
+
+    def key(rule: Rule) -> Tuple:
+        return rule.pattern.pattern, rule.replacement, rule.drop_short, rule.populations
+
+    matcher = difflib.SequenceMatcher(
+        None,
+        [key(rule) for rule in old_rules],
+        [key(rule) for rule in new_rules],
+        False,
+    )
+    removed, added = set(), set()
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            removed.update(range(i1, i2))
+            added.update(range(j1, j2))
+
+    for i in fired_rules(state, new_rules, step):
+        if i in added:
+            return f"{describe_rule(new_rules[i])} (added or edited)"
+    for i in fired_rules(state, old_rules, step):
+        if i in removed:
+            return f"{describe_rule(old_rules[i])} (removed or edited)"
+
+    return None
+
+
+def first_divergent_rule(
+    rules: Sequence[Rule],
+    reference: Callable[[Sequence[Rule]], Any],
+    fast: Callable[[Sequence[Rule]], Any],
+    key: Callable[[Any], Any] = lambda output: output,
+) -> Optional[str]:
+    """
+    Finds the rule from which a faster implementation stops agreeing with the reference.
+
+    Both implementations are run with the first rule, then the first two, and so on,
+    until their outputs differ.
+
+    Args:
+    ----
+    rules (Sequence[Rule]): Rules in the order they are applied.
+    reference (Callable[[Sequence[Rule]], Any]): Output of the reference implementation with the given rules.
+    fast (Callable[[Sequence[Rule]], Any]): Output of the faster implementation with the given rules.
+    key (Callable[[Any], Any]): Part of the outputs that is compared, the whole outputs by default.
+
+    Returns:
+    -------
+    Optional[str]: Description of the rule, None if the outputs agree for every prefix.
+
+    """
+    for end in range(1, len(rules) + 1):
+        if key(reference(rules[:end])) != key(fast(rules[:end])):
+            return describe_rule(rules[end - 1])
+
+    return None
+
+
+def keyword_cause(expected: Sequence[str], actual: Sequence[str]) -> Optional[str]:
+    """
+    Describes the keywords one matching found and the other did not.
+
+    """
+    found = sorted(set(actual) - set(expected))
+    lost = sorted(set(expected) - set(actual))
+    if not found and not lost:
+        return None
+
+    return ", ".join(
+        [f"keyword {keyword!r} found" for keyword in found]
+        + [f"keyword {keyword!r} no longer found" for keyword in lost]
+    )
+
+
+def compare_stem_dicts(
+    stage: str,
+    population: str,
+    expected: Dict[str, List[str]],
+    actual: Dict[str, List[str]],
+    cause: Callable[[List[str]], Optional[str]] = lambda words: None,
+) -> List[Divergence]:
+    """
+    Compares two stem dictionaries stem by stem.
+
+    Args:
+    ----
+    stage (str): Name the divergences are reported under.
+    population (str): Population of the dictionaries.
+    expected (Dict[str, List[str]]): Reference dictionary.
+    actual (Dict[str, List[str]]): Dictionary compared with it.
+    cause (Callable[[List[str]], Optional[str]]): Explains the difference of a stem from the words involved.
+
+    Returns:
+    -------
+    List[Divergence]: One divergence per stem whose words differ, in the order of expected.
+
+    """
+    divergences = []
+    for stem in list(expected) + [stem for stem in actual if stem not in expected]:
+        expected_words = list(expected.get(stem, []))
+        actual_words = list(actual.get(stem, []))
+        if expected_words != actual_words:
+            divergences.append(
+                Divergence(
+                    stage,
+                    population,
+                    stem,
+                    expected_words,
+                    actual_words,
+                    cause(sorted(set(expected_words) | set(actual_words))),
+                )
+            )
+
+    return divergences
+
+
+def check_snapshot(path: Optional[str] = None) -> List[Divergence]:
+    """
+    Runs the current code over the shipped answers and compares every output with the golden snapshot.
+
+    Only the first output that differs is reported for an answer, since the later ones
+    follow from it. A difference is explained by the rule added, edited or removed in the
+    normalization rules since the snapshot that rewrites the answer, by a changed stem
+    dictionary entry, or by the keywords found, and left unexplained when the code of
+    the step changed instead. Topics are compared by matrix column, since their labels
+    are read from the keyword sheet.
+
+    Args:
+    ----
+    path (Optional[str]): Snapshot file, the one set in config.json by default.
+
+    Returns:
+    -------
+    List[Divergence]: The differences, stem dictionaries first.
+
+    """
+    golden = read_snapshot(path)
+    if golden["normalization type"] != get_normalization_type():
+        raise ValueError(
+            f"The snapshot was taken with normalization type "
+            f"{golden['normalization type']!r}, config.json sets {get_normalization_type()!r}"
+        )
+
+    current = build_snapshot()
+
+    # Rules of the snapshot and current rules, compiled apart so that their memos are not shared
+    old_rulesets = {
+        section: compile_rules(golden["rules"][section], section)
+        for section in RULE_SECTIONS
+    }
+    new_rulesets = {
+        section: compile_rules(load_rule_specs(section), section)
+        for section in RULE_SECTIONS
+    }
+    old_abbreviations = abbreviation_rules(golden["rules"]["abbreviations"])
+    new_abbreviations = abbreviation_rules(ABBREVIATION_RULES)
+
+    # Labels of the snapshot renamed to the current labels of the same columns
+    if len(golden["labels"]) == len(current["labels"]):
+        renamed = dict(zip(golden["labels"], current["labels"]))
+    else:
+        renamed = {}
+    for population in POPULATIONS:
+        golden["populations"][population]["topics"] = [
+            [renamed.get(label, label) for label in labels]
+            for labels in golden["populations"][population]["topics"]
+        ]
+
+    divergences = []
+    for population in POPULATIONS:
+        if golden["stem_dicts"][population] == current["stem_dicts"][population]:
+            continue
+
+        # Words of the answers each form of the stem dictionaries was rewritten from
+        sources = {}
+        for word in set(
+            token.lower()
+            for text in current["populations"][population]["prepared"]
+            for token in text.split()
+        ):
+            for ruleset in (old_rulesets["cleaner"], new_rulesets["cleaner"]):
+                form = rewrite_token(word, ruleset)
+                if form is not None:
+                    sources.setdefault(form, set()).add(word)
+
+        def word_cause(forms: List[str]) -> Optional[str]:
+            words = set()
+            for form in forms:
+                words.update(sources.get(form, ()))
+            for word in sorted(words):
+                cause = changed_rule_cause(
+                    (word,),
+                    old_rulesets["cleaner"].rules,
+                    new_rulesets["cleaner"].rules,
+                    substitute_tokens,
+                )
+                if cause is not None:
+                    return f"{cause} on {word!r}"
+            return None
+
+        divergences += compare_stem_dicts(
+            "stem_dict",
+            population,
+            golden["stem_dicts"][population],
+            current["stem_dicts"][population],
+            word_cause,
+        )
+
+    for population in POPULATIONS:
+        expected = golden["populations"][population]
+        actual = current["populations"][population]
+        old_stem_dict = golden["stem_dicts"][population]
+        new_stem_dict = current["stem_dicts"][population]
+
+        if expected["ids"] != actual["ids"]:
+            divergences.append(
+                Divergence(
+                    "ids",
+                    population,
+                    None,
+                    len(expected["ids"]),
+                    len(actual["ids"]),
+                    "the shipped answers changed",
+                )
+            )
+            continue
+
+        for i, row in enumerate(expected["ids"]):
+            for stage in ("Q30",) + TEXT_STAGES + ("topics",):
+                if expected[stage][i] == actual[stage][i]:
+                    continue
+
+                if stage == "Q30":
+                    cause = "the shipped answer changed"
+                elif stage == "prepared":
+                    cause = changed_rule_cause(
+                        text_normalizer(actual["Q30"][i]),
+                        old_abbreviations,
+                        new_abbreviations,
+                        substitute_text,
+                    )
+                elif stage == "cleaned":
+                    cause = changed_rule_cause(
+                        tuple(actual["prepared"][i].split()),
+                        old_rulesets["cleaner"].rules,
+                        new_rulesets["cleaner"].rules,
+                        substitute_tokens,
+                    )
+                    if cause is None:
+                        stems = [
+                            stem
+                            for stem in stem_lookup_keys(actual["prepared"][i])
+                            if old_stem_dict.get(stem) != new_stem_dict.get(stem)
+                        ]
+                        if stems:
+                            cause = f"stem dictionary entry {stems[0]!r}"
+                elif stage == "topic":
+                    cause = changed_rule_cause(
+                        actual["cleaned"][i],
+                        rules_for(old_rulesets["topic analysis"], population),
+                        rules_for(new_rulesets["topic analysis"], population),
+                        substitute_text,
+                    )
+                elif stage == "topic_cleaned":
+                    cause = changed_rule_cause(
+                        actual["topic"][i],
+                        old_rulesets["topic cleaner"].rules,
+                        new_rulesets["topic cleaner"].rules,
+                        substitute_text,
+                    )
+                else:
+                    cause = keyword_cause(
+                        expected["keywords"][i], actual["keywords"][i]
+                    )
+
+                divergences.append(
+                    Divergence(
+                        stage,
+                        population,
+                        row,
+                        expected[stage][i],
+                        actual[stage][i],
+                        cause,
+                    )
+                )
+                break
+
+    return divergences
+
+
+def vectorized_rules(text: str, rules: Sequence[Rule]) -> str:
+    # What apply_topic_rules(backend="vectorized") does to a single answer
+    series = pd.Series([text], dtype=object)
+    for rule in rules:
+        series = series.str.replace(rule.pattern, rule.replacement, regex=True)
+
+    return series.values[0]
+
+
+def reference_cleaner(text: str, stem_dict: Dict[str, List[str]]) -> str:
+    """
+    Gives what cleaner() should, running every cleaning rule over every token with apply_rules_sequentially.
+
+    """
+    tokens = apply_rules_sequentially(text.split(), get_rules("cleaner"))
+    stems = [lemma_stem(token, "stem") for token in tokens]
+
+    return " ".join(
+        stem_dict[stem][0] if stem in stem_dict else stem for stem in stems
+    ).strip()
+
+
+def compare_backends(
+    backends: Optional[Sequence[str]] = None, max_workers: int = 2
+) -> List[Divergence]:
+    """
+    Compares the faster implementations of the notebook's steps with their references, answer by answer, over the shipped answers.
+
+    Every comparison of BACKENDS starts from the outputs of the previous steps:
+
+    - "cleaned": cleaner against the rules run one by one with apply_rules_sequentially
+    - "cleaned[compact]": cleaner looking words up in a StemIndex against the dictionary
+    - "cleaned[parallel]": run_pipeline(["cleaner"]) against the serial step
+    - "topic_cleaned[parallel]": run_pipeline(["cleaner", "topic_normalizer", "topic_cleaner"]) against the serial steps
+    - "stem_dict[compact]" and "stem_dict[streaming]": the StemIndex and stream_stem_dict against unify_citizens_councilors_texts
+    - "topic[vectorized]" and "topic[vocabulary]": the apply_topic_rules backends against backend="apply"
+    - "topics[single pass]": topic_matrix_creator against the unigram and bigram matrices combined
+
+    Differences of the rule engines are explained by the first rule from which the faster
+    implementation disagrees with the reference, and differences of the topic matrices by
+    the keywords only one of them finds.
+
+    Args:
+    ----
+    backends (Optional[Sequence[str]]): Comparisons to run, every one of BACKENDS by default.
+    max_workers (int): Worker processes of the parallel comparisons.
+
+    Returns:
+    -------
+    List[Divergence]: The differences, in the order of BACKENDS.
+
+    """
+    backends = list(backends or BACKENDS)
+    unknown = [backend for backend in backends if backend not in BACKENDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown backends {unknown}, expected any of {list(BACKENDS)}"
+        )
+
+    snapshot = build_snapshot()
+    outputs = snapshot["populations"]
+    unigram_index, bigram_index = load_topic_indexes()
+    cleaner_specs = load_rule_specs("cleaner")
+
+    def cleaner_cause(text: str) -> Optional[str]:
+        tokens = text.split()
+
+        def ruleset(rules: Sequence[Rule]) -> Any:
+            return compile_rules(cleaner_specs[: len(rules)], "cleaner")
+
+        return first_divergent_rule(
+            get_rules("cleaner").rules,
+            lambda rules: apply_rules_sequentially(tokens, ruleset(rules)),
+            lambda rules: rewrite_tokens(tokens, ruleset(rules)),
+        )
+
+    def topic_rules_cause(
+        text: str, population: str, fast: Callable[[str, Sequence[Rule]], str]
+    ) -> Optional[str]:
+        def sequential(rules: Sequence[Rule]) -> str:
+            rewritten = text
+            for rule in rules:
+                rewritten = substitute_text(rule, rewritten)
+            return rewritten
+
+        rules = rules_for(get_rules("topic analysis"), population)
+
+        # The vocabulary backend collapses whitespace, so the words are compared first
+        return first_divergent_rule(
+            rules, sequential, lambda rules: fast(text, rules), str.split
+        ) or first_divergent_rule(rules, sequential, lambda rules: fast(text, rules))
+
+    def stem_index_of(stem_dict: Dict[str, List[str]]) -> StemIndex:
+        return StemIndex.from_pairs(
+            (word, stem) for stem, words in stem_dict.items() for word in words
+        )
+
+    divergences = []
+    for backend in backends:
+        if backend in ("topic[vectorized]", "topic[vocabulary]"):
+            topic_frames = apply_topic_rules(
+                pd.DataFrame({"cleaned": outputs["citizens"]["cleaned"]}),
+                pd.DataFrame({"cleaned": outputs["councilors"]["cleaned"]}),
+                backend[len("topic[") : -1],
+            )
+            fast = (
+                vectorized_rules
+                if backend == "topic[vectorized]"
+                else lambda text, rules: rewrite_texts_by_vocabulary([text], rules)[0]
+            )
+
+        for p, population in enumerate(POPULATIONS):
+            rows = outputs[population]
+            stem_dict = snapshot["stem_dicts"][population]
+
+            if backend.startswith("stem_dict"):
+                if backend == "stem_dict[compact]":
+                    actual_dict = stem_index_of(stem_dict).to_dict()
+                else:
+                    actual_dict = stream_stem_dict(
+                        [pd.DataFrame({"cleaned": rows["prepared"]})]
+                    )
+                divergences += compare_stem_dicts(
+                    backend, population, stem_dict, actual_dict
+                )
+                continue
+
+            # Expected and actual output of every answer, and what explains a difference
+            cause: Callable[[int], Optional[str]] = lambda i: None
+            if backend == "cleaned":
+                expected = [
+                    reference_cleaner(text, stem_dict) for text in rows["prepared"]
+                ]
+                actual = rows["cleaned"]
+                cause = lambda i: cleaner_cause(rows["prepared"][i])
+            elif backend == "cleaned[compact]":
+                stem_index = stem_index_of(stem_dict)
+                expected = rows["cleaned"]
+                actual = [cleaner(text, stem_index) for text in rows["prepared"]]
+            elif backend == "cleaned[parallel]":
+                expected = rows["cleaned"]
+                actual = run_pipeline(
+                    rows["prepared"], ["cleaner"], stem_dict, max_workers
+                )
+            elif backend in ("topic[vectorized]", "topic[vocabulary]"):
+                expected = rows["topic"]
+                actual = topic_frames[p].cleaned.values.tolist()
+                cause = lambda i: topic_rules_cause(
+                    rows["cleaned"][i], population, fast
+                )
+            elif backend == "topic_cleaned[parallel]":
+                expected = rows["topic_cleaned"]
+                actual = run_pipeline(
+                    rows["prepared"],
+                    ["cleaner", "topic_normalizer", "topic_cleaner"],
+                    stem_dict,
+                    max_workers,
+                    population=population,
+                )
+            else:
+                matrix = topic_matrix_creator(
+                    pd.DataFrame({"cleaned": rows["topic_cleaned"]}),
+                    unigram_index,
+                    bigram_index,
+                )
+                expected = rows["topics"]
+                actual = topic_labels(matrix, unigram_index.labels)
+                cause = lambda i: keyword_cause(
+                    rows["keywords"][i],
+                    matched_keywords(
+                        rows["topic_cleaned"][i],
+                        unigram_index,
+                        bigram_index,
+                        whole_tokens=True,
+                    ),
+                )
+
+            for i, row in enumerate(rows["ids"]):
+                if expected[i] != actual[i]:
+                    divergences.append(
+                        Divergence(
+                            backend, population, row, expected[i], actual[i], cause(i)
+                        )
+                    )
+
+    return divergences
+
+
+def print_divergences(divergences: Sequence[Divergence], limit: Optional[int]) -> None:
+    """
+    Prints the divergences, then how many there are of every stage.
+
+    """
+    for divergence in divergences[:limit]:
+        print(
+            f"{divergence.stage} {divergence.population} {divergence.row!r}: "
+            f"{divergence.cause or 'no rule explains it'}"
+        )
+        print(f"    expected: {divergence.expected!r}")
+        print(f"    actual:   {divergence.actual!r}")
+
+    counts = {}
+    for divergence in divergences:
+        key = (divergence.stage, divergence.population)
+        counts[key] = counts.get(key, 0) + 1
+    for (stage, population), count in counts.items():
+        print(f"{stage} {population}: {count} divergences")
+    print(f"{len(divergences)} divergences")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the outputs for the shipped answers with a golden snapshot, "
+        "or the faster implementations with their references."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot_parser = subparsers.add_parser(
+        "snapshot", help="store the current outputs as the golden snapshot"
+    )
+    snapshot_parser.add_argument("--path", help="snapshot file")
+    snapshot_parser.add_argument(
+        "--tree",
+        help="project directory of another checkout whose steps compute the outputs, "
+        "e.g. a git worktree of the commit the snapshot holds the code to",
+    )
+
+    check_parser = subparsers.add_parser(
+        "check", help="compare the current outputs with the golden snapshot"
+    )
+    check_parser.add_argument("--path", help="snapshot file")
+
+    backends_parser = subparsers.add_parser(
+        "backends", help="compare the faster implementations with their references"
+    )
+    backends_parser.add_argument(
+        "backends",
+        nargs="*",
+        metavar="BACKEND",
+        help=f"comparisons among {', '.join(BACKENDS)}, all if none",
+    )
+    backends_parser.add_argument(
+        "--workers", type=int, default=2, help="processes of the parallel comparisons"
+    )
+
+    for subparser in (check_parser, backends_parser):
+        subparser.add_argument(
+            "--limit", type=int, default=20, help="divergences printed in full"
+        )
+    args = parser.parse_args(argv)
+
+    if args.command == "snapshot":
+        steps = load_notebook_steps(args.tree) if args.tree else None
+        print(write_snapshot(args.path, steps))
+        return
+
+    if args.command == "check":
+        divergences = check_snapshot(args.path)
+    else:
+        divergences = compare_backends(args.backends or None, args.workers)
+
+    print_divergences(divergences, args.limit)
+    sys.exit(1 if divergences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List
+
+# Locate config.json one directory above this file
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+config_path = os.path.join(project_root, "config.json")
+
+# Name of the Greek spaCy pipeline used for lemmatization
+SPACY_MODEL = "el_core_news_lg"
+
+# Pipeline components lemmatization depends on, the rest are disabled when lemmatizing
+LEMMA_COMPONENTS = (
+    "tok2vec",
+    "tagger",
+    "morphologizer",
+    "attribute_ruler",
+    "lemmatizer",
+)
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Dict[str, Any]:
+    """
+    Reads config.json once and returns its contents.
+
+    Returns:
+    -------
+    Dict[str, Any]: Parsed configuration.
+
+    """
+    with open(config_path, "r") as config:
+        return json.load(config)
+
+
+def get_normalization_type() -> str:
+    """
+    Returns the word normalization method set in config.json.
+
+    Returns:
+    -------
+    str: Either "stem" or "lemma".
+
+    """
+    return get_config()["normalization type"]
+
+
+@lru_cache(maxsize=None)
+def get_nlp() -> Any:
+    """
+    Loads the Greek spaCy pipeline the first time it is requested.
+
+    Returns:
+    -------
+    spacy.language.Language: The loaded pipeline.
+
+    """
+    import spacy
+
+    return spacy.load(SPACY_MODEL)
+
+
+@lru_cache(maxsize=None)
+def get_stemmer() -> Any:
+    """
+    Creates the GreekStemmer instance the first time it is requested.
+
+    Returns:
+    -------
+    GreekStemmer: Shared stemmer instance.
+
+    """
+    from greek_stemmer import GreekStemmer
+
+    return GreekStemmer()
+
+
+@lru_cache(maxsize=None)
+def ensure_nltk_data() -> None:
+    """
+    Makes sure the NLTK punkt tokenizer is available, downloading it only if it is missing.
+
+    """
+    import nltk
+
+    try:
+        nltk.data.find("tokenizers/punkt")
+    except LookupError:
+        nltk.download("punkt")
+
+
+@lru_cache(maxsize=None)
+def get_stop_words() -> List[str]:
+    """
+    Reads the stopword list the first time it is requested.
+
+    Returns:
+    -------
+    List[str]: A list of stopwords, shared between callers.
+
+    """
+    from .stopwords import initialize_stopwords
+
+    return initialize_stopwords()
+
+
+@lru_cache(maxsize=None)
+def get_stop_word_set(unaccented: bool = False) -> FrozenSet[str]:
+    """
+    Builds a frozen set of the stopwords once, for constant time membership tests.
+
+    Args:
+    ----
+    unaccented (bool): Also include the accent-stripped, lowercase form of every stopword.
+
+    Returns:
+    -------
+    FrozenSet[str]: The stopwords.
+
+    """
+    stop_words = get_stop_words()
+    if not unaccented:
+        return frozenset(stop_words)
+
+    from .text_normalizations import accent_remover
+
+    return frozenset(stop_words) | frozenset(accent_remover(w) for w in stop_words)
+
+
+def warmup(lemma: bool = False) -> None:
+    """
+    Loads every lazily initialized resource up front, e.g. before a long-running worker starts serving.
+
+    Args:
+    ----
+    lemma (bool): Also load the spaCy pipeline and NLTK data, which only lemmatization needs.
+
+    """
+    get_config()
+    get_stemmer()
+    get_stop_words()
+    get_stop_word_set()
+
+    if lemma or get_normalization_type() == "lemma":
+        ensure_nltk_data()
+        get_nlp()
@@ -0,0 +1,428 @@
+import json
+import re
+from functools import lru_cache
+from itertools import groupby
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+from .profiling import record_token, substitute
+from .resources import get_config
+
+# Opening parenthesis of a capturing group
+capturing_group = re.compile(r"(?<!\\)\((?!\?)")
+
+# Runs of whitespace
+whitespace = re.compile(r"\s+")
+
+# Number of rewritten tokens a RuleSet keeps, the oldest being evicted first
+CACHE_SIZE = 1 << 16
+
+
+class Rule(NamedTuple):
+    """
+    A single substitution rule.
+
+    Attributes:
+    ----------
+    name (str): Short name of the rule.
+    pattern (Pattern): Compiled regular expression.
+    replacement (str): Replacement string passed to re.sub.
+    drop_short (bool): Drop strings of length 1 after the substitution.
+    populations (Tuple[str, ...]): Populations the rule applies to, empty for all of them.
+    scope (str): "token" if the rule only looks at one word and its neighbouring spaces, "text" if it spans several words.
+    section (str): Section of the normalization rules file the rule comes from.
+    position (int): Position of the rule in its section.
+
+    """
+
+    name: str
+    pattern: Pattern
+    replacement: str
+    drop_short: bool = False
+    populations: Tuple[str, ...] = ()
+    scope: str = "token"
+    section: str = ""
+    position: int = 0
+
+
+class RuleSet(NamedTuple):
+    """
+    An ordered list of compiled rules plus the state needed to run them token by token.
+
+    Attributes:
+    ----------
+    rules (Tuple[Rule, ...]): Rules in the order they are applied.
+    trigger (Pattern): Alternation of every rule pattern, used to skip tokens no rule can touch.
+    drop_short (bool): Whether any rule drops strings of length 1.
+    cache (Dict[str, Optional[str]]): Rewritten form of the last CACHE_SIZE tokens seen, None if it was dropped.
+
+    """
+
+    rules: Tuple[Rule, ...]
+    trigger: Pattern
+    drop_short: bool
+    cache: Dict[str, Optional[str]]
+
+
+def compile_rules(specs: Iterable[Dict[str, Any]], section: str = "") -> RuleSet:
+    """
+    Compiles rule specifications, as read from the normalization rules file, into a RuleSet.
+
+    Args:
+    ----
+    specs (Iterable[Dict[str, Any]]): Rule specifications in the order they are applied.
+    section (str): Section of the normalization rules file the specifications come from.
+
+    Returns:
+    -------
+    RuleSet: The compiled rules.
+
+    """
+    rules = tuple(
+        Rule(
+            name=spec["name"],
+            pattern=re.compile(spec["pattern"]),
+            replacement=spec["replacement"],
+            drop_short=spec.get("drop_short", False),
+            populations=tuple(spec.get("populations", ())),
+            scope=spec.get("scope", "token"),
+            section=section,
+            position=position,
+        )
+        for position, spec in enumerate(specs)
+    )
+
+    # A token that none of the patterns matches goes through every rule unchanged.
+    # Capturing groups are turned into non-capturing ones, since saving hundreds of
+    # group marks at every position makes the alternation slower than the rules one by one
+    trigger = re.compile(
+        "|".join(
+            "(?:{})".format(capturing_group.sub("(?:", rule.pattern.pattern))
+            for rule in rules
+        )
+    )
+
+    return RuleSet(
+        rules=rules,
+        trigger=trigger,
+        drop_short=any(rule.drop_short for rule in rules),
+        cache={},
+    )
+
+
+@lru_cache(maxsize=None)
+def load_rule_specs(section: str) -> List[Dict[str, Any]]:
+    """
+    Reads one section of the normalization rules file set in config.json.
+
+    Args:
+    ----
+    section (str): Name of the rule section, e.g. "cleaner".
+
+    Returns:
+    -------
+    List[Dict[str, Any]]: Rule specifications in the order they are applied.
+
+    """
+    with open(get_config()["normalization rules path"], "r", encoding="utf-8") as f:
+        rules = json.load(f)
+
+    return rules[section]
+
+
+@lru_cache(maxsize=None)
+def get_rules(section: str) -> RuleSet:
+    """
+    Compiles one section of the normalization rules once and shares it between callers.
+
+    Args:
+    ----
+    section (str): Name of the rule section, e.g. "cleaner".
+
+    Returns:
+    -------
+    RuleSet: The compiled rules.
+
+    """
+    return compile_rules(load_rule_specs(section), section)
+
+
+def rules_for(ruleset: RuleSet, population: str) -> Tuple[Rule, ...]:
+    """
+    Returns the rules that apply to a population, in order.
+
+    Args:
+    ----
+    ruleset (RuleSet): Rules to select from.
+    population (str): Population name, e.g. "citizens" or "councilors".
+
+    Returns:
+    -------
+    Tuple[Rule, ...]: The selected rules.
+
+    """
+    return tuple(
+        rule
+        for rule in ruleset.rules
+        if not rule.populations or population in rule.populations
+    )
+
+
+def apply_rules_sequentially(items: List[str], ruleset: RuleSet) -> List[str]:
+    """
+    Runs every rule over the whole list, one pass per rule. This is the reference implementation.
+
+    Args:
+    ----
+    items (List[str]): Strings to be rewritten.
+    ruleset (RuleSet): Rules to apply.
+
+    Returns:
+    -------
+    List[str]: Rewritten strings, without the ones dropped for being too short.
+
+    """
+    for rule in ruleset.rules:
+        items = [rule.pattern.sub(rule.replacement, item) for item in items]
+
+        # Remove left-over characters of length 1
+        if rule.drop_short:
+            items = [item for item in items if len(item) > 1]
+
+    return items
+
+
+def rewrite_token(token: str, ruleset: RuleSet) -> Optional[str]:
+    """
+    Rewrites a single token, giving the same result as apply_rules_sequentially on [token].
+
+    Args:
+    ----
+    token (str): Token to be rewritten.
+    ruleset (RuleSet): Rules to apply.
+
+    Returns:
+    -------
+    Optional[str]: Rewritten token, or None if a rule dropped it.
+
+    """
+    try:
+        rewritten = ruleset.cache[token]
+    except KeyError:
+        pass
+    else:
+        record_token(ruleset, cached=True, skipped=False)
+        return rewritten
+
+    skipped = ruleset.trigger.search(token) is None
+    record_token(ruleset, cached=False, skipped=skipped)
+
+    if skipped:
+        # No rule matches, only the length filter can apply
+        rewritten = None if ruleset.drop_short and len(token) <= 1 else token
+
+    else:
+        # Some rule matches, so rules may feed each other and run in order
+        rewritten = token
+        for rule in ruleset.rules:
+            rewritten = substitute(rule, rewritten)
+
+            if rule.drop_short and len(rewritten) <= 1:
+                rewritten = None
+                break
+
+    # The RuleSet lives as long as the process, so the cache must not grow with every
+    # new word of a streamed file
+    if len(ruleset.cache) >= CACHE_SIZE:
+        del ruleset.cache[next(iter(ruleset.cache))]
+    ruleset.cache[token] = rewritten
+
+    return rewritten
+
+
+def rewrite_tokens(tokens: Iterable[str], ruleset: RuleSet) -> List[str]:
+    """
+    Rewrites every token in a single pass, skipping the ones a rule dropped.
+
+    Args:
+    ----
+    tokens (Iterable[str]): Tokens to be rewritten.
+    ruleset (RuleSet): Rules to apply.
+
+    Returns:
+    -------
+    List[str]: Rewritten tokens in their original order.
+
+    """
+    rewritten = [rewrite_token(token, ruleset) for token in tokens]
+
+    return [token for token in rewritten if token is not None]
+
+
+def substitute_from(rule: Rule, text: str, pos: int) -> str:
+    """
+    Applies a rule to the part of a text from pos on, as re.sub does once an earlier match has consumed the text before pos.
+
+    Args:
+    ----
+    rule (Rule): Rule to apply.
+    text (str): Text to rewrite.
+    pos (int): Position the search starts at. "^" does not match there, and lookbehinds still see the text before it.
+
+    Returns:
+    -------
+    str: The text with every match of the rule from pos on replaced.
+
+    """
+    # A replacement without group references or escapes is inserted as it is
+    literal = "\\" not in rule.replacement
+
+    pieces = [text[:pos]]
+    end = pos
+    for match in rule.pattern.finditer(text, pos):
+        pieces.append(text[end : match.start()])
+        pieces.append(rule.replacement if literal else match.expand(rule.replacement))
+        end = match.end()
+    pieces.append(text[end:])
+
+    return "".join(pieces)
+
+
+def rewrite_word(
+    token: str, first: bool, last: bool, rules: Sequence[Rule]
+) -> Tuple[str, Optional[int], int]:
+    """
+    Runs token rules over a word padded with the spaces it shares with its neighbours in the text.
+
+    In the full text re.sub consumes a shared space with the first match that covers it,
+    so a rule that consumed the space after a word cannot match the next word from the
+    space before it. The returned bit masks tell, for every rule, whether this happened.
+
+    Args:
+    ----
+    token (str): Word to be rewritten.
+    first (bool): Whether the word starts the text, so there is no space before it.
+    last (bool): Whether the word ends the text, so there is no space after it.
+    rules (Sequence[Rule]): Token rules to apply, in order.
+
+    Returns:
+    -------
+    Tuple[str, Optional[int], int]: The rewritten word with its spaces; the rules whose rewriting of the word changes when the space before it is already consumed, None if the word cannot be rewritten apart from its neighbours; and the rules that consumed the space after it.
+
+    """
+    piece = ("" if first else " ") + token + ("" if last else " ")
+    blocked, consumed = 0, 0
+
+    for i, rule in enumerate(rules):
+        rewritten = substitute(rule, piece)
+
+        # re.sub returns the text itself when nothing matched
+        if rewritten is piece:
+            continue
+
+        spans = [match.span() for match in rule.pattern.finditer(piece)]
+        if spans and spans[0][0] == 0 < spans[0][1] and not first:
+            if substitute_from(rule, piece, 1) != rewritten:
+                blocked |= 1 << i
+        if spans and spans[-1][0] < spans[-1][1] == len(piece) and not last:
+            consumed |= 1 << i
+
+        piece = rewritten
+
+        # A rule that removed a shared space or the whole word changes which words are
+        # neighbours in the text
+        if (
+            (not first and not piece[:1].isspace())
+            or (not last and not piece[-1:].isspace())
+            or not piece.strip()
+        ):
+            return piece, None, consumed
+
+    return piece, blocked, consumed
+
+
+def rewrite_texts_by_vocabulary(texts: List[str], rules: Sequence[Rule]) -> List[str]:
+    """
+    Applies rules to whole texts by rewriting their distinct words once and mapping the texts through the result.
+
+    Consecutive "token" rules run over every distinct (word, first in text, last in text)
+    combination with rewrite_word, padded with the spaces it has in the text, so anchors
+    and whitespace boundaries see the same context as in the full text. The few texts in
+    which a rule consumed the space between two words that it would both rewrite, or in
+    which a rule merged or removed words, run the rules over the whole text instead.
+    "text" rules run over the whole texts. The rewritten texts have their whitespace
+    collapsed to single spaces, so the result is the one of running every rule over every
+    text whenever the rules end with a whitespace collapse, as the "topic analysis" ones do.
+
+    Args:
+    ----
+    texts (List[str]): Texts to be rewritten.
+    rules (Sequence[Rule]): Rules to apply, in order.
+
+    Returns:
+    -------
+    List[str]: Rewritten texts.
+
+    """
+    for scope, segment in groupby(rules, key=lambda rule: rule.scope):
+        segment = list(segment)
+
+        if scope == "text":
+            for rule in segment:
+                texts = [substitute(rule, text) for text in texts]
+            continue
+
+        token_map = {}
+        rewritten_texts = []
+
+        for text in texts:
+            tokens = text.split()
+            pieces = []
+
+            # Spaces at either end of the text are kept with the first and last word
+            starts_text = bool(tokens) and not text[0].isspace()
+            ends_text = bool(tokens) and not text[-1].isspace()
+
+            consumed = 0
+            for i, token in enumerate(tokens):
+                key = (
+                    token,
+                    i == 0 and starts_text,
+                    i == len(tokens) - 1 and ends_text,
+                )
+
+                try:
+                    piece, blocked, next_consumed = token_map[key]
+                except KeyError:
+                    piece, blocked, next_consumed = token_map[key] = rewrite_word(
+                        *key, segment
+                    )
+
+                if blocked is None or blocked & consumed:
+                    break
+
+                pieces.append(piece)
+                consumed = next_consumed
+
+            else:
+                if tokens:
+                    rewritten_texts.append(whitespace.sub(" ", " ".join(pieces)))
+                    continue
+
+            # Texts without words, and texts whose words cannot be rewritten one by one
+            for rule in segment:
+                text = substitute(rule, text)
+            rewritten_texts.append(whitespace.sub(" ", text) if tokens else text)
+
+        texts = rewritten_texts
+
+    return texts
@@ -0,0 +1,179 @@
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+def group_by_stem(pairs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """
+    Groups (word, stem) pairs into a dictionary with stems as keys and their original forms as values.
+
+    Args:
+    ----
+    pairs (Iterable[Tuple[str, str]]): (word, stem) pairs, e.g. the output of normalize_citizens_text.
+
+    Returns:
+    -------
+    Dict[str, List[str]]: Stems in order of first appearance, each with its words in the order they appear.
+
+    """
+    stem_dict = {}
+    for word, stem in pairs:
+        try:
+            stem_dict[stem].append(word)
+        except KeyError:
+            stem_dict[stem] = [word]
+
+    return stem_dict
+
+
+class StemIndex:
+    """
+    Read-only stem -> original forms index stored as two UTF-8 buffers and integer offsets.
+
+    It supports the lookups the pipeline does on the dictionaries returned by
+    unify_citizens_councilors_texts (indexing, "in", len and iteration over the stems),
+    so it can be passed to cleaner() in their place. Keeping every stem and every word
+    in one buffer avoids both a Python object per word and the padding of fixed-width
+    numpy string arrays to the longest word, and UTF-8 keeps a single emoji from widening
+    every character as it would in a str. UTF-8 sorts bytes in code point order, so the
+    stems are in the same order as sorted() puts them.
+
+    Attributes:
+    ----------
+    stems (bytes): Sorted distinct stems encoded as UTF-8, one after the other.
+    stem_bounds (np.ndarray): Start of stem i in stems, followed by len(stems).
+    words (bytes): Original forms grouped by stem encoded as UTF-8, one after the other.
+    word_bounds (np.ndarray): Start of word j in words, followed by len(words).
+    offsets (np.ndarray): Index of the first word of stem i, followed by the total number of words.
+
+    """
+
+    __slots__ = ("stems", "stem_bounds", "words", "word_bounds", "offsets")
+
+    def __init__(
+        self,
+        stems: bytes,
+        stem_bounds: np.ndarray,
+        words: bytes,
+        word_bounds: np.ndarray,
+        offsets: np.ndarray,
+    ):
+        self.stems = stems
+        self.stem_bounds = stem_bounds
+        self.words = words
+        self.word_bounds = word_bounds
+        self.offsets = offsets
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str]]) -> "StemIndex":
+        """
+        Builds the index from (word, stem) pairs, keeping the words of each stem in the order they appear.
+
+        Args:
+        ----
+        pairs (Iterable[Tuple[str, str]]): (word, stem) pairs, e.g. the output of normalize_citizens_text.
+
+        Returns:
+        -------
+        StemIndex: The compact index.
+
+        """
+        stem_dict = group_by_stem(pairs)
+        stems = sorted(stem_dict)
+        encoded_stems = [stem.encode("utf-8") for stem in stems]
+        encoded_words = [
+            word.encode("utf-8") for stem in stems for word in stem_dict[stem]
+        ]
+        offsets = np.cumsum(
+            [0] + [len(stem_dict[stem]) for stem in stems], dtype=np.int64
+        )
+
+        return cls(
+            b"".join(encoded_stems),
+            bounds_of(encoded_stems),
+            b"".join(encoded_words),
+            bounds_of(encoded_words),
+            offsets,
+        )
+
+    def _stem(self, i: int) -> bytes:
+        return self.stems[self.stem_bounds[i] : self.stem_bounds[i + 1]]
+
+    def _position(self, stem: str) -> int:
+        key = stem.encode("utf-8")
+
+        # Binary search over the sorted stems
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self._stem(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(self) or self._stem(low) != key:
+            raise KeyError(stem)
+
+        return low
+
+    def _words(self, start: int, end: int) -> List[str]:
+        bounds = self.word_bounds[start : end + 1].tolist()
+
+        return [
+            self.words[bounds[j] : bounds[j + 1]].decode("utf-8")
+            for j in range(len(bounds) - 1)
+        ]
+
+    def __getitem__(self, stem: str) -> List[str]:
+        i = self._position(stem)
+
+        return self._words(int(self.offsets[i]), int(self.offsets[i + 1]))
+
+    def __contains__(self, stem: object) -> bool:
+        try:
+            self._position(stem)
+        except (KeyError, AttributeError):
+            return False
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self.stem_bounds) - 1
+
+    def __iter__(self) -> Iterator[str]:
+        bounds = self.stem_bounds.tolist()
+
+        return (
+            self.stems[bounds[i] : bounds[i + 1]].decode("utf-8")
+            for i in range(len(self))
+        )
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """
+        Expands the index into a regular dictionary with sorted stems as keys.
+
+        Returns:
+        -------
+        Dict[str, List[str]]: Dictionary with stemmed words as keys and their original forms as values.
+
+        """
+        words = self._words(0, int(self.offsets[-1]))
+        offsets = self.offsets.tolist()
+
+        return {stem: words[offsets[i] : offsets[i + 1]] for i, stem in enumerate(self)}
+
+
+def bounds_of(strings: List[bytes]) -> np.ndarray:
+    """
+    Returns where each string starts once the strings are concatenated, followed by their total length.
+
+    Args:
+    ----
+    strings (List[bytes]): Strings to be concatenated.
+
+    Returns:
+    -------
+    np.ndarray: len(strings) + 1 offsets, as the smallest integer type that holds them.
+
+    """
+    bounds = np.cumsum([0] + [len(string) for string in strings], dtype=np.int64)
+
+    return bounds.astype(np.min_scalar_type(int(bounds[-1])))
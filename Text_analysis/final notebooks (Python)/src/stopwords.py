@@ -1,46 +1,64 @@
-import os
 import pandas as pd
-import json
-from typing import List
+from functools import lru_cache
+from typing import Any, List
 
-# Read config json
-script_dir = os.path.dirname(os.path.abspath(__file__))
+from .ingest import load_sheet
+from .resources import get_config
 
-# Move up one directory to find the config.json file
-project_root = os.path.dirname(script_dir)
-config_path = os.path.join(project_root, "config.json")
 
-with open(config_path, "r") as config:
-    config_dict = json.load(config)
+@lru_cache(maxsize=None)
+def load_stopwords_sheet() -> pd.DataFrame:
+    """
+    Reads the stopwords sheet of the stopwords excel file once.
+
+    Returns:
+    -------
+    pd.DataFrame: The "stopwords" sheet.
+
+    """
+    return load_sheet(get_config()["stopwords excel path"], sheet_name="stopwords")
 
-stopwords_path = config_dict["stopwords excel path"]
 
-# Read stopwords from excel file
-stop_words_df = pd.read_excel(stopwords_path, sheet_name="stopwords")
+@lru_cache(maxsize=None)
+def read_word_list(path: str) -> List[str]:
+    """
+    Reads a txt file with one word per line, skipping empty lines.
 
-# Read additional stopwords from txt file
-additional_stopwords = []
-with open(config_dict["additional_stopwords_path"], "r") as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            additional_stopwords.append(line)
+    Args:
+    ----
+    path (str): Path to the txt file.
 
-# Read stopwords to keep from txt file
-keep_stopwords = []
-with open(config_dict["keep_stopwords_path"], "r") as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            keep_stopwords.append(line)
+    Returns:
+    -------
+    List[str]: The words of the file in order.
 
-# Read additional topic stopwords from txt file
-additional_topic_stopwords = []
-with open(config_dict["additional_topic_stopwords_path"], "r") as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            additional_topic_stopwords.append(line)
+    """
+    words = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                words.append(line)
+
+    return words
+
+
+def __getattr__(name: str) -> Any:
+    # Module level names kept for backwards compatibility, loaded on first access
+    if name == "config_dict":
+        return get_config()
+    if name == "stopwords_path":
+        return get_config()["stopwords excel path"]
+    if name == "stop_words_df":
+        return load_stopwords_sheet()
+    if name == "additional_stopwords":
+        return read_word_list(get_config()["additional_stopwords_path"])
+    if name == "keep_stopwords":
+        return read_word_list(get_config()["keep_stopwords_path"])
+    if name == "additional_topic_stopwords":
+        return read_word_list(get_config()["additional_topic_stopwords_path"])
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def initialize_stopwords() -> List[str]:
@@ -52,12 +70,12 @@ def initialize_stopwords() -> List[str]:
     List[str]: A list of stopwords.
     """
     # Create list of stopwords
-    stop_words = stop_words_df.word.values.tolist()
+    stop_words = load_stopwords_sheet().word.values.tolist()
 
     # Removing/Appending stop words below because they might be usefull
-    for add_stopword in additional_stopwords:
+    for add_stopword in read_word_list(get_config()["additional_stopwords_path"]):
         stop_words.append(add_stopword)
-    for keep_stopword in keep_stopwords:
+    for keep_stopword in read_word_list(get_config()["keep_stopwords_path"]):
         stop_words.remove(keep_stopword)
 
     return stop_words
@@ -73,10 +91,10 @@ def initialize_topic_stopwords() -> List[str]:
 
     """
     # Create list of topic stopwords
-    topic_stop_words = stop_words_df.topic_word.values.tolist()
+    topic_stop_words = load_stopwords_sheet().topic_word.values.tolist()
 
     # Removing/Appending stop words below because they might be usefull
-    for add_stopword in additional_topic_stopwords:
+    for add_stopword in read_word_list(get_config()["additional_topic_stopwords_path"]):
         topic_stop_words.append(add_stopword)
 
     return topic_stop_words
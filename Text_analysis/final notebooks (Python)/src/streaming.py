@@ -0,0 +1,317 @@
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from .profiling import substitute
+from .resources import get_normalization_type
+from .rules import get_rules, rules_for
+from .stem_index import group_by_stem
+from .text_normalizations import (
+    abbreviation_creator,
+    bigram_topic_matrix_creator,
+    cleaner,
+    normalize_words,
+    text_normalizer,
+    topic_cleaner,
+    unigram_topic_matrix_creator,
+)
+from .topics import TopicIndex, as_topic_index
+
+
+def read_responses(
+    path: str,
+    columns: Sequence[str],
+    chunk_size: int = 10000,
+    sheet_name: Union[int, str] = 0,
+) -> Iterator[pd.DataFrame]:
+    """
+    Reads the given columns of a CSV, Parquet or Excel file lazily, chunk_size rows at a time.
+
+    CSV and Parquet files, and .xlsx files through openpyxl's read-only mode, are never
+    loaded whole. The legacy .xls format cannot be read row by row, so .xls files are
+    loaded once and then handed out in chunks.
+
+    Args:
+    ----
+    path (str): Path to a .csv, .parquet, .xlsx or .xls file.
+    columns (Sequence[str]): Columns to read, e.g. an id column and the answers.
+    chunk_size (int): Number of rows per chunk.
+    sheet_name (Union[int, str]): Sheet of an Excel file.
+
+    Returns:
+    -------
+    Iterator[pd.DataFrame]: Chunks of the file, indexed by row number.
+
+    """
+    extension = os.path.splitext(path)[1].lower()
+    columns = list(columns)
+
+    if extension == ".csv":
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size)
+
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunk_size, columns=columns
+        ):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+    elif extension == ".xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            sheet = (
+                workbook.worksheets[sheet_name]
+                if isinstance(sheet_name, int)
+                else workbook[sheet_name]
+            )
+            rows = sheet.iter_rows(values_only=True)
+            header = list(next(rows))
+            positions = [header.index(column) for column in columns]
+
+            start = 0
+            chunk = []
+            for row in rows:
+                chunk.append([row[i] for i in positions])
+                if len(chunk) == chunk_size:
+                    yield pd.DataFrame(
+                        chunk, columns=columns, index=range(start, start + len(chunk))
+                    )
+                    start += len(chunk)
+                    chunk = []
+            if chunk:
+                yield pd.DataFrame(
+                    chunk, columns=columns, index=range(start, start + len(chunk))
+                )
+        finally:
+            workbook.close()
+
+    elif extension == ".xls":
+        dataframe = pd.read_excel(path, sheet_name=sheet_name, usecols=columns)
+        for start in range(0, len(dataframe), chunk_size):
+            yield dataframe.iloc[start : start + chunk_size]
+
+    else:
+        raise ValueError(
+            f"Unsupported file {path!r}, expected .csv, .parquet, .xlsx or .xls"
+        )
+
+
+def prepare_responses(
+    chunks: Iterable[pd.DataFrame], text_column: str
+) -> Iterator[pd.DataFrame]:
+    """
+    Drops empty answers and applies text_normalizer and abbreviation_creator, as the notebook does first.
+
+    Args:
+    ----
+    chunks (Iterable[pd.DataFrame]): Chunks from read_responses.
+    text_column (str): Column holding the answers.
+
+    Returns:
+    -------
+    Iterator[pd.DataFrame]: The chunks with a "cleaned" column.
+
+    """
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=[text_column]).copy()
+        chunk["cleaned"] = [
+            abbreviation_creator(text_normalizer(str(text)))
+            for text in chunk[text_column].values.tolist()
+        ]
+        yield chunk
+
+
+def stream_stem_dict(
+    chunks: Iterable[pd.DataFrame], normalization_type: Optional[str] = None
+) -> Dict[str, List[str]]:
+    """
+    Builds the stem dictionary of a population from prepared chunks, keeping only the distinct words in memory.
+
+    Args:
+    ----
+    chunks (Iterable[pd.DataFrame]): Chunks from prepare_responses.
+    normalization_type (Optional[str]): "stem" or "lemma", the normalization type in config.json by default.
+
+    Returns:
+    -------
+    Dict[str, List[str]]: Dictionary with stemmed words as keys and their original forms as values, as unify_citizens_councilors_texts builds it.
+
+    """
+    vocabulary = set()
+    for chunk in chunks:
+        for text in chunk.cleaned.values.tolist():
+            vocabulary.update(token.lower() for token in text.split())
+
+    return group_by_stem(
+        normalize_words(vocabulary, normalization_type or get_normalization_type())
+    )
+
+
+def normalize_responses(
+    chunks: Iterable[pd.DataFrame], stem_dict: Any, population: str
+) -> Iterator[pd.DataFrame]:
+    """
+    Applies cleaner, the topic analysis rules of the population and topic_cleaner to prepared chunks.
+
+    Args:
+    ----
+    chunks (Iterable[pd.DataFrame]): Chunks from prepare_responses.
+    stem_dict (Any): Stem dictionary of the population.
+    population (str): "citizens" or "councilors", selects the topic analysis rules.
+
+    Returns:
+    -------
+    Iterator[pd.DataFrame]: The chunks with "cleaned" as the topic matrices expect it.
+
+    """
+    rules = rules_for(get_rules("topic analysis"), population)
+
+    for chunk in chunks:
+        texts = []
+        for text in chunk.cleaned.values.tolist():
+            text = cleaner(text, stem_dict)
+            for rule in rules:
+                text = substitute(rule, text)
+            texts.append(topic_cleaner(text))
+
+        chunk["cleaned"] = texts
+        yield chunk
+
+
+def tag_topics(
+    chunks: Iterable[pd.DataFrame],
+    unigram_index: Union[TopicIndex, Dict[str, str]],
+    bigram_index: Union[TopicIndex, Dict[str, str]],
+) -> Iterator[pd.DataFrame]:
+    """
+    Adds a 0/1 column per topic to normalized chunks, set if the answer uses a unigram or a bigram of the topic.
+
+    Args:
+    ----
+    chunks (Iterable[pd.DataFrame]): Chunks from normalize_responses.
+    unigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the unigram keywords.
+    bigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the bigram keywords.
+
+    Returns:
+    -------
+    Iterator[pd.DataFrame]: The chunks with one uint8 column per topic label.
+
+    """
+    labels = as_topic_index(unigram_index).labels
+
+    for chunk in chunks:
+        matrix = unigram_topic_matrix_creator(chunk, unigram_index, output="bool")
+        matrix = bigram_topic_matrix_creator(
+            chunk, bigram_index, output="bool", out=matrix
+        )
+
+        yield pd.concat(
+            [
+                chunk,
+                pd.DataFrame(matrix.astype("uint8"), columns=labels, index=chunk.index),
+            ],
+            axis=1,
+        )
+
+
+def write_topic_rows(chunks: Iterable[pd.DataFrame], path: str) -> int:
+    """
+    Writes chunks to a CSV or Parquet file as they arrive, so only one chunk is in memory at a time.
+
+    Args:
+    ----
+    chunks (Iterable[pd.DataFrame]): Chunks from tag_topics.
+    path (str): Output .csv or .parquet file, overwritten if it exists.
+
+    Returns:
+    -------
+    int: Number of rows written.
+
+    """
+    rows = 0
+
+    if path.lower().endswith(".parquet"):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return rows
+
+    for chunk in chunks:
+        chunk.to_csv(
+            path, mode="w" if rows == 0 else "a", header=rows == 0, index=False
+        )
+        rows += len(chunk)
+
+    return rows
+
+
+def run_streaming_pipeline(
+    source_path: str,
+    text_column: str,
+    population: str,
+    output_path: str,
+    unigram_index: Union[TopicIndex, Dict[str, str]],
+    bigram_index: Union[TopicIndex, Dict[str, str]],
+    id_columns: Sequence[str] = (),
+    stem_dict: Optional[Any] = None,
+    chunk_size: int = 10000,
+) -> int:
+    """
+    Runs the whole topic pipeline over a file of answers and writes one topic row per answer, chunk by chunk.
+
+    Without a stem_dict the source is read twice: once to build the stem dictionary from
+    its distinct words, and once to normalize and tag the answers.
+
+    Args:
+    ----
+    source_path (str): Path to a .csv, .parquet, .xlsx or .xls file with the answers.
+    text_column (str): Column holding the answers.
+    population (str): "citizens" or "councilors", selects the topic analysis rules.
+    output_path (str): Output .csv or .parquet file.
+    unigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the unigram keywords.
+    bigram_index (Union[TopicIndex, Dict[str, str]]): Topic index of the bigram keywords.
+    id_columns (Sequence[str]): Columns copied to the output next to the answers, e.g. the respondent id.
+    stem_dict (Optional[Any]): Stem dictionary of the population, built from the source if not given.
+    chunk_size (int): Number of answers per chunk.
+
+    Returns:
+    -------
+    int: Number of rows written.
+
+    """
+    columns = list(id_columns) + [text_column]
+
+    if stem_dict is None:
+        stem_dict = stream_stem_dict(
+            prepare_responses(
+                read_responses(source_path, columns, chunk_size), text_column
+            )
+        )
+
+    chunks = prepare_responses(
+        read_responses(source_path, columns, chunk_size), text_column
+    )
+    chunks = normalize_responses(chunks, stem_dict, population)
+    chunks = tag_topics(chunks, unigram_index, bigram_index)
+
+    return write_topic_rows(chunks, output_path)
@@ -1,43 +1,140 @@
-import os
 import pandas as pd
 import re
 import numpy as np
-from greek_stemmer import GreekStemmer
-import nltk
-import spacy
 import warnings
-import json
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .cache import load_cached, stem_dicts_key, store_cached
+from .matching import KeywordMatcher, is_literal
+from .profiling import profiled, substitute
+from .resources import (
+    LEMMA_COMPONENTS,
+    get_config,
+    get_nlp,
+    get_normalization_type,
+    get_stemmer,
+    get_stop_word_set,
+    get_stop_words,
+    warmup,
+)
+from .rules import get_rules, rewrite_texts_by_vocabulary, rewrite_tokens, rules_for
+from .stem_index import StemIndex, group_by_stem
+from .topics import TopicIndex, as_topic_index
 
-from .stopwords import initialize_stopwords
+# Disable warnings
+warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-# Read stopwords
-stop_words = initialize_stopwords()
+# Number of distinct words whose stem or lemma is kept in memory
+WORD_CACHE_SIZE = 1 << 16
+
+# Accented Greek letters and their unaccented forms
+ACCENTS = str.maketrans("άέήίόύώϊϋΐΰ", "αεηιουωιυιυ")
+
+# Latin letters typed in Greek answers and the Greek letters replacing them
+LATIN_TO_GREEK = str.maketrans(
+    {
+        "a": "α",
+        "b": "μπ",
+        "d": "δ",
+        "e": "ε",
+        "f": "φ",
+        "g": "γ",
+        "h": "χ",
+        "i": "ι",
+        "k": "κ",
+        "l": "λ",
+        "m": "μ",
+        "n": "ν",
+        "o": "ο",
+        "p": "π",
+        "r": "ρ",
+        "s": "σ",
+        "t": "τ",
+        "u": "υ",
+        "v": "β",
+        "w": "ω",
+        "y": "υ",
+        "z": "ζ",
+    }
+)
 
-# Read config json
-# Read config json
-script_dir = os.path.dirname(os.path.abspath(__file__))
+# Both tables, so that text_normalizer translates lowercase text once
+GREEK_TABLE = {**ACCENTS, **LATIN_TO_GREEK}
 
-# Move up one directory to find the config.json file
-project_root = os.path.dirname(script_dir)
-config_path = os.path.join(project_root, "config.json")
-with open(config_path, "r") as config:
-    config_dict = json.load(config)
+# Punctuation marks text_normalizer replaces with spaces, all but %
+PUNCTUATION = "!\"#$&'()*+,-./:;<=>?@[\\]^_`{|}~"
 
-# Assign paths to variables
-normalization_type = config_dict["normalization type"]
+# Punctuation marks after "!", which goes before the digits are removed
+LATE_PUNCTUATION = str.maketrans(dict.fromkeys(PUNCTUATION[1:], " "))
 
-# Disable warnings
-warnings.filterwarnings("ignore", category=DeprecationWarning)
+WHITESPACE = re.compile(r"\s+")
+
+# Digits except patterns with 1%
+DIGITS = re.compile(r"(?![0-9]+\s?\%)[0-9]")
+
+# Abbreviations abbreviation_creator writes, in the order the rules run, each with words
+# one of which every match contains, the pattern rewritten and its replacement
+ABBREVIATION_RULES = [
+    # εναςτιςεκατο, ενα τις 100, ενα στις 100, μια τις 100, μια στις 100, 1 τις εκατο, 1 στις εκατο, 1/100 and 0.01
+    ("1%", ("εναςτιςεκατο",), r"εναςτιςεκατο", "1%"),
+    (
+        "1%",
+        ("ενα", "μια", "1"),
+        r"(ενα\s?τ[α-ω]+\s?εκατο)|(ενα\s?στ[α-ω]+\s?εκατο)|(μια\s?τ[α-ω]+\s?εκατο)|(μια\s?στ[α-ω]+\s?εκατο)|(ενα\s?τ[α-ω]+\s?100)|(ενα\s?στ[α-ω]+\s?100)|(μια\s?τ[α-ω]+\s?100)|(μια\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1/100)|(0.01)|(0,01)",
+        " 1% ",
+    ),
+    # Variations of χρυση αυγη
+    (
+        "χα",
+        ("χρυσ",),
+        r"(χρυσ[αυγιτης|αυγιτες|\s?αυγη]+\s?)|(χρυσ[η|ες]+\s?αυγ[η|ες]+)",
+        "χα",
+    ),
+    # Variations of ευρωπαικη ενωση
+    ("εε", ("ευρωπαικ",), r"ευρωπαικ[η|ης]+\sενωσ[η|εις]+", "εε"),
+    # Variations of ηνωμενες πολιτειες
+    (
+        "ηπα",
+        ("ηνωμενε", "αμερικ"),
+        r"(ηνωμενε[σ|ς]+\s?πολιτειε[σ|ς]+\s?((της)?\s?αμερικη[σ|ς]+)?)|(αμερικη)|(αμερικανοι)|(αμερικανακια)|(αμερικανακι)",
+        "ηπα",
+    ),
+    # Variations of ηνωμενα αραβικα εμιρατα
+    ("ηαε", ("εμιρατα",), r"(ηνωμενα)?\s*(αραβικα)?\s*εμιρατα", "ηαε"),
+    # Variations of μη κυβερνητικες οργανωσεις
+    (
+        "μκο",
+        ("κυβερνητικ",),
+        r"(μη\s*κυβερνητικε[σ|ς]+\s*οργανωσει[σ|ς]+)|(μη\s*κυβερνητικη\s*οργανωση)",
+        "μκο",
+    ),
+]
+
+# Abbreviations that are kept as they are instead of being stemmed or lemmatized
+ABBREVIATIONS = frozenset(abbreviation for abbreviation, _, _, _ in ABBREVIATION_RULES)
+
+# Compiled rules of ABBREVIATION_RULES
+ABBREVIATION_PATTERNS = [
+    (triggers, re.compile(pattern), replacement)
+    for _, triggers, pattern, replacement in ABBREVIATION_RULES
+]
 
-# Download punkt from nltk
-nltk.download("punkt")
 
-# Load Greek corpus from spacy
-nlp = spacy.load("el_core_news_lg")
+def __getattr__(name: str) -> Any:
+    # Module level resources are loaded on first access instead of at import time
+    if name == "stop_words":
+        return get_stop_words()
+    if name == "config_dict":
+        return get_config()
+    if name == "normalization_type":
+        return get_normalization_type()
+    if name == "nlp":
+        return get_nlp()
+    if name == "stemmer":
+        return get_stemmer()
 
-# Create instance of GreekStemmer
-stemmer = GreekStemmer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Defining functions
@@ -58,25 +155,79 @@ def accent_remover(text: str) -> str:
     cleaned_text = text.lower()
 
     # Removing accents
-    cleaned_text = re.sub("ά", "α", cleaned_text)
-    cleaned_text = re.sub("έ", "ε", cleaned_text)
-    cleaned_text = re.sub("ή", "η", cleaned_text)
-    cleaned_text = re.sub("ί", "ι", cleaned_text)
-    cleaned_text = re.sub("ό", "ο", cleaned_text)
-    cleaned_text = re.sub("ύ", "υ", cleaned_text)
-    cleaned_text = re.sub("ώ", "ω", cleaned_text)
-    cleaned_text = re.sub("ϊ", "ι", cleaned_text)
-    cleaned_text = re.sub("ϋ", "υ", cleaned_text)
-    cleaned_text = re.sub("ΐ", "ι", cleaned_text)
-    cleaned_text = re.sub("ΰ", "υ", cleaned_text)
+    cleaned_text = cleaned_text.translate(ACCENTS)
 
     return cleaned_text
 
 
+# Characters around a stopword in every pattern of stop_word_remover
+STOP_WORD_DELIMITERS = re.compile(r"[\s.]+")
+
+
+@lru_cache(maxsize=8)
+def compile_stop_words(
+    stop_words: Tuple[str, ...],
+) -> Tuple[List[Tuple[Any, Any, Any]], Dict[str, List[int]], List[int]]:
+    """
+    Compiles the patterns stop_word_remover runs for every stopword, once per stopword list.
+
+    Every pattern requires whitespace, a dot or the start of the text around the stopword,
+    so the words of a stopword without regular expression metacharacters are whole tokens
+    of any text it matches. Such a stopword is indexed under its first word, accented and
+    unaccented, and its patterns only run on texts that contain that word. The other
+    stopwords always run.
+
+    Args:
+    ----
+    stop_words (Tuple[str, ...]): Stop words, in the order they are removed.
+
+    Returns:
+    -------
+    Tuple[List[Tuple[Any, Any, Any]], Dict[str, List[int]], List[int]]: The three compiled
+    patterns of every stopword, the positions of the stopwords matching every token, and
+    the positions of the stopwords to run on every text.
+
+    """
+    patterns = []
+    token_index = {}
+    always = []
+
+    for i, stop_word in enumerate(stop_words):
+        unaccented = accent_remover(stop_word)
+        patterns.append(
+            (
+                re.compile(
+                    rf"(\s+{stop_word}\s+)|(^{stop_word}\s+)|(\.\s?{stop_word}\s+)|(\s+{stop_word}\.\s?)"
+                ),
+                re.compile(
+                    rf"(\s+{unaccented}\s+)|(^{unaccented}\s+)|(\.\s?{unaccented}\s+)|(\s+{unaccented}\.\s?)"
+                ),
+                re.compile(rf"\s{stop_word}\s"),
+            )
+        )
+
+        # Any token of a stopword is a whole token of the texts it matches
+        tokens = [
+            next((token for token in STOP_WORD_DELIMITERS.split(word) if token), None)
+            for word in (stop_word, unaccented)
+        ]
+        if is_literal(stop_word) and None not in tokens:
+            for token in set(tokens):
+                token_index.setdefault(token, []).append(i)
+        else:
+            always.append(i)
+
+    return patterns, token_index, always
+
+
+@profiled
 def stop_word_remover(text: str, stop_words: List[str]) -> str:
     """
     Removes stop words from the input text.
 
+    Only the stopwords occurring in the text are applied, with the patterns compiled once
+    by compile_stop_words, in the order of stop_words.
+
     Args:
     ----
     text (str): Input text to be cleaned.
@@ -87,25 +238,24 @@ def stop_word_remover(text: str, stop_words: List[str]) -> str:
     str: Cleaned text with stop words removed.
 
     """
+    patterns, token_index, always = compile_stop_words(tuple(stop_words))
+
+    # Removing stop words only ever splits tokens, so the ones in the text are all that can match
+    candidates = set(always)
+    for token in STOP_WORD_DELIMITERS.split(text):
+        candidates.update(token_index.get(token, ()))
+
     cleaned_text = text
 
-    for i in range(len(stop_words)):
+    for i in sorted(candidates):
         # Removing stop words
-        cleaned_text = re.sub(
-            f"(\s+{stop_words[i]}\s+)|(^{stop_words[i]}\s+)|(\.\s?{stop_words[i]}\s+)|(\s+{stop_words[i]}\.\s?)",
-            " ",
-            cleaned_text,
-        )
-        cleaned_text = re.sub(
-            f"(\s+{accent_remover(stop_words[i])}\s+)|(^{accent_remover(stop_words[i])}\s+)|(\.\s?{accent_remover(stop_words[i])}\s+)|(\s+{accent_remover(stop_words[i])}\.\s?)",
-            " ",
-            cleaned_text,
-        )
-        cleaned_text = re.sub(f"\s{stop_words[i]}\s", " ", cleaned_text)
+        for pattern in patterns[i]:
+            cleaned_text = pattern.sub(" ", cleaned_text)
 
     return cleaned_text
 
 
+@profiled
 def text_normalizer(text: str) -> str:
     """
     Normalizes the input text by removing accents, substituting Latin characters with Greek letters,
@@ -122,58 +272,26 @@ def text_normalizer(text: str) -> str:
     # Converting all characters to lowercase
     cleaned_text = text.lower()
 
-    # Removing accents
-    cleaned_text = accent_remover(cleaned_text)
-
-    # Substituting all latin characters with Greek letters
-    # More specifically it substitutes only the patterns --> e.g. siziτηση and συζητηsi
-    rgx = re.findall(r"([a-zA-z]+[α-ωΑ-Ω]+)|([α-ωΑ-Ω]+[a-zA-z]+)", cleaned_text)
-    if type(rgx) == list:
-        cleaned_text = re.sub("a", "α", cleaned_text)
-        cleaned_text = re.sub("b", "μπ", cleaned_text)
-        cleaned_text = re.sub("d", "δ", cleaned_text)
-        cleaned_text = re.sub("e", "ε", cleaned_text)
-        cleaned_text = re.sub("f", "φ", cleaned_text)
-        cleaned_text = re.sub("g", "γ", cleaned_text)
-        cleaned_text = re.sub("h", "χ", cleaned_text)
-        cleaned_text = re.sub("i", "ι", cleaned_text)
-        cleaned_text = re.sub("k", "κ", cleaned_text)
-        cleaned_text = re.sub("l", "λ", cleaned_text)
-        cleaned_text = re.sub("m", "μ", cleaned_text)
-        cleaned_text = re.sub("n", "ν", cleaned_text)
-        cleaned_text = re.sub("o", "ο", cleaned_text)
-        cleaned_text = re.sub("p", "π", cleaned_text)
-        cleaned_text = re.sub("r", "ρ", cleaned_text)
-        cleaned_text = re.sub("s", "σ", cleaned_text)
-        cleaned_text = re.sub("t", "τ", cleaned_text)
-        cleaned_text = re.sub("u", "υ", cleaned_text)
-        cleaned_text = re.sub("v", "β", cleaned_text)
-        cleaned_text = re.sub("w", "ω", cleaned_text)
-        cleaned_text = re.sub("s", "σ", cleaned_text)
-        cleaned_text = re.sub("y", "υ", cleaned_text)
-        cleaned_text = re.sub("z", "ζ", cleaned_text)
+    # Removing accents and substituting all latin characters with Greek letters
+    cleaned_text = cleaned_text.translate(GREEK_TABLE)
 
     # Removing punctuation marks except --> %
-    for punc in "!\"#$&'()*+,-./:;<=>?@[\\]^_`{|}~":
-        cleaned_text = re.sub(f"\{punc}", " ", cleaned_text)
+    # Digits are removed once "!" is gone, as the first round of the former loop over
+    # the punctuation marks did, and the other marks only after that
+    cleaned_text = WHITESPACE.sub(" ", cleaned_text.replace("!", " ")).strip()
 
-        # Removing multiple spaces
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    # Removing digits except patterns with 1%
+    cleaned_text = DIGITS.sub(" ", cleaned_text)
 
-        cleaned_text = cleaned_text.strip()
+    cleaned_text = cleaned_text.translate(LATE_PUNCTUATION)
 
-        # Removing accents
-        cleaned_text = accent_remover(cleaned_text)
-
-        # Removing digits except patterns with 1%
-        cleaned_text = re.sub(r"(?![0-9]+\s?\%)[0-9]", " ", cleaned_text)
-
-        # Removing multiple spaces
-        cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    # Removing multiple spaces
+    cleaned_text = WHITESPACE.sub(" ", cleaned_text).strip()
 
     return cleaned_text
 
 
+@profiled
 def abbreviation_creator(text: str) -> str:
     """
     Converts variations of certain phrases to their abbreviations.
@@ -187,45 +305,127 @@ def abbreviation_creator(text: str) -> str:
     str: Converted text with abbreviations.
 
     """
-    # Substituting ενα τις 100, ενα στις 100, μια τις 100, μια στις 100, 1 τις εκατο, 1 στις εκατο, 1/100 and 0.01 to 1%
-    cleaned_text = re.sub("εναςτιςεκατο", "1%", text)
-    cleaned_text = re.sub(
-        r"(ενα\s?τ[α-ω]+\s?εκατο)|(ενα\s?στ[α-ω]+\s?εκατο)|(μια\s?τ[α-ω]+\s?εκατο)|(μια\s?στ[α-ω]+\s?εκατο)|(ενα\s?τ[α-ω]+\s?100)|(ενα\s?στ[α-ω]+\s?100)|(μια\s?τ[α-ω]+\s?100)|(μια\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1/100)|(0.01)|(0,01)",
-        " 1% ",
-        cleaned_text,
-    )
+    cleaned_text = text
 
-    # Converting variations of χρυση αυγη to χα
-    cleaned_text = re.sub(
-        r"(χρυσ[αυγιτης|αυγιτες|\s?αυγη]+\s?)|(χρυσ[η|ες]+\s?αυγ[η|ες]+)",
-        "χα",
-        cleaned_text,
-    )
+    # Converting variations of 1%, χρυση αυγη, ευρωπαικη ενωση, ηνωμενες πολιτειες,
+    # ηνωμενα αραβικα εμιρατα and μη κυβερνητικες οργανωσεις to their abbreviations.
+    # A rule runs only when the text contains one of its words, looked up in the text as
+    # the previous rules left it, since a replacement can complete a word
+    for triggers, pattern, replacement in ABBREVIATION_PATTERNS:
+        if any(trigger in cleaned_text for trigger in triggers):
+            cleaned_text = pattern.sub(replacement, cleaned_text)
 
-    # Converting variations of ευρωπαικη ενωση to εε
-    cleaned_text = re.sub(r"ευρωπαικ[η|ης]+\sενωσ[η|εις]+", "εε", cleaned_text)
+    # Removing multiple spaces
+    cleaned_text = WHITESPACE.sub(" ", cleaned_text)
 
-    # Converting variations of ηνωμενες πολιτειες to ηπα
-    cleaned_text = re.sub(
-        r"(ηνωμενε[σ|ς]+\s?πολιτειε[σ|ς]+\s?((της)?\s?αμερικη[σ|ς]+)?)|(αμερικη)|(αμερικανοι)|(αμερικανακια)|(αμερικανακι)",
-        "ηπα",
-        cleaned_text,
-    )
+    return cleaned_text
 
-    # Converting variations of ηνωμενα αραβικα εμιρατα to ηαε
-    cleaned_text = re.sub(r"(ηνωμενα)?\s*(αραβικα)?\s*εμιρατα", "ηαε", cleaned_text)
 
-    # Converting variations of μη κυβερνητικες οργανωσεις to μκο
-    cleaned_text = re.sub(
-        r"(μη\s*κυβερνητικε[σ|ς]+\s*οργανωσει[σ|ς]+)|(μη\s*κυβερνητικη\s*οργανωση)",
-        "μκο",
-        cleaned_text,
-    )
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def stem_word(word: str) -> str:
+    """
+    Stems a single word, remembering the most recently used words.
 
-    # Removing multiple spaces
-    cleaned_text = re.sub(r"\s+", " ", cleaned_text)
+    Args:
+    ----
+    word (str): Lowercase word to be stemmed.
 
-    return cleaned_text
+    Returns:
+    -------
+    str: Lowercase stem.
+
+    """
+    return get_stemmer().stem(word.upper()).lower()
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def lemmatize_word(word: str) -> Tuple[str, ...]:
+    """
+    Lemmatizes a single word with the spaCy pipeline, remembering the most recently used words.
+
+    Args:
+    ----
+    word (str): Word to be lemmatized.
+
+    Returns:
+    -------
+    Tuple[str, ...]: Lemmas of the tokens spaCy splits the word into.
+
+    """
+    return tuple(str(token.lemma_) for token in get_nlp()(word))
+
+
+def word_cache_info() -> Dict[str, Any]:
+    """
+    Returns the hit and miss counters of the stemming and lemmatization memo.
+
+    Returns:
+    -------
+    Dict[str, Any]: functools cache info for "stem" and "lemma".
+
+    """
+    return {"stem": stem_word.cache_info(), "lemma": lemmatize_word.cache_info()}
+
+
+@profiled
+def lemmatize_texts(
+    texts: List[str], batch_size: Optional[int] = None, n_process: Optional[int] = None
+) -> List[str]:
+    """
+    Lemmatizes many texts at once, giving the same result as lemma_stem(text, "lemma") for each of them.
+
+    Every distinct word is lemmatized once. The words are streamed through nlp.pipe with
+    only the components lemmatization needs enabled.
+
+    Args:
+    ----
+    texts (List[str]): Texts to be lemmatized.
+    batch_size (Optional[int]): Number of words per nlp.pipe batch, "lemma batch size" in config.json by default.
+    n_process (Optional[int]): Number of processes nlp.pipe uses, "lemma processes" in config.json by default.
+
+    Returns:
+    -------
+    List[str]: Lemmatized texts in the order of texts.
+
+    """
+    config_dict = get_config()
+    if batch_size is None:
+        batch_size = config_dict.get("lemma batch size", 1000)
+    if n_process is None:
+        n_process = config_dict.get("lemma processes", 1)
+
+    # "1%" is left to the lemmatizer, as in lemma_stem
+    abbreviations = ABBREVIATIONS - {"1%"}
+    words = sorted(
+        set(
+            token
+            for text in texts
+            for token in text.split()
+            if token not in abbreviations
+        )
+    )
+
+    nlp = get_nlp()
+    disable = [name for name in nlp.pipe_names if name not in LEMMA_COMPONENTS]
+    lemmas = {
+        word: " ".join(str(token.lemma_) for token in doc)
+        for word, doc in zip(
+            words,
+            nlp.pipe(
+                words, batch_size=batch_size, n_process=n_process, disable=disable
+            ),
+        )
+    }
+
+    # If token is in the abbreviation list, don't apply lemmatization
+    return [
+        re.sub(
+            r"\s+",
+            " ",
+            " ".join(lemmas.get(token, token) for token in text.split()),
+        )
+        for text in texts
+    ]
 
 
 def lemma_stem(text: str, word_normalization: str) -> str:
@@ -242,35 +442,23 @@ def lemma_stem(text: str, word_normalization: str) -> str:
     str: Stemmed or lemmatized text.
 
     """
+    tokens = text.split()
+
     # Stem or lemma
     if word_normalization == "stem":
-        # Removing accents
-        cleaned_text = text
-        f = []
-
         # If token is in the abbreviation list, don't apply stemming
-        for i in range(len(cleaned_text.split())):
-            if cleaned_text.split()[i] in ["μκο", "ηπα", "χα", "ηαε", "εε", "1%"]:
-                f.append(cleaned_text.split()[i])
-                continue
-
-            else:
-                f.append(stemmer.stem(cleaned_text.split()[i].upper()).lower())
+        f = [token if token in ABBREVIATIONS else stem_word(token) for token in tokens]
 
     elif word_normalization == "lemma":
-        cleaned_text = text
         f = []
 
         # If token is in the abbreviation list, don't apply lemmatization
-        for i in range(len(cleaned_text.split())):
-            if cleaned_text.split()[i] in ["μκο", "ηπα", "χα", "ηαε", "εε"]:
-                f.append(cleaned_text.split()[i])
-                continue
-
+        for token in tokens:
+            # "1%" is left to the lemmatizer
+            if token in ABBREVIATIONS and token != "1%":
+                f.append(token)
             else:
-                doc = nlp(cleaned_text.split()[i])
-                for token in doc:
-                    f.append(str(token.lemma_))
+                f.extend(lemmatize_word(token))
 
     else:
         return print(
@@ -287,6 +475,27 @@ def lemma_stem(text: str, word_normalization: str) -> str:
     return cleaned_text
 
 
+def stem_lookup_keys(text: str) -> List[str]:
+    """
+    Returns the tokens cleaner() looks up in the stem dictionary, in the order of the text.
+
+    Args:
+    ----
+    text (str): Input text to be cleaned.
+
+    Returns:
+    -------
+    List[str]: Tokens rewritten by the cleaning rules and stemmed.
+
+    """
+    # Tokenize text and rewrite every token through the compiled cleaning rules
+    cleaned_text = rewrite_tokens(text.split(), get_rules("cleaner"))
+
+    # Apply stemming
+    return [lemma_stem(text, "stem") for text in cleaned_text]
+
+
+@profiled
 def cleaner(text: str, stem_dict: Dict[str, str]) -> str:
     """
     Cleans the input text by removing unwanted characters, normalizing certain words,
@@ -301,1947 +510,652 @@ def cleaner(text: str, stem_dict: Dict[str, str]) -> str:
     str: Cleaned text with unwanted characters removed and certain words normalized.
 
     """
-    # Tokenize text
-    cleaned_text = text.split()
+    fin = []
 
-    # Remove "´""
-    cleaned_text = [re.sub(r"´", " ", text) for text in cleaned_text]
+    # Apply stemming where it is possible
+    for token in stem_lookup_keys(text):
+        try:
+            fin.append(stem_dict[token][0])
+        except:
+            fin.append(token)
 
-    # Converting variations of λαθρομεταναστης to λαθρο
-    cleaned_text = [
-        re.sub(
-            r"(^λαθρ[α-ω]{,8}\s?)|(\s?λαθρ[α-ω]{,8}$)|(\s?λαθρ[α-ω]{,8}\s?)",
-            " λαθρο ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    return " ".join(fin).strip()
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Converting variations of χωρανε to _χωρανε
-    cleaned_text = [
-        re.sub(
-            r"(\s?χωραει$)|(^χωραει\s?)|(\s?χωραει\s?)|(^χωρανε\s?)|(\s?χωρανε$)|(\s?χωρανε\s?)|(^χωρο\s?)|(\s?χωρο$)|(\s?χωρο\s?)|(^χωροι\s?)|(\s?χωροι$)|(\s?χωροι\s?)|(^χωρος\s?)|(\s?χωρος$)|(\s?χωρος\s?)|(^χωρου\s?)|(\s?χωρου$)|(\s?χωρου\s?)|(^χωρους\s?)|(\s?χωρους$)|(\s?χωρους\s?)",
-            " _χωρανε ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+@profiled
+def topic_cleaner(text: str) -> str:
+    """
+    Cleans the input text by removing unwanted characters, normalizing certain words,
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Args:
+    ----
+    text (str): Input text to be cleaned.
 
-    # Converting χρημα variations to χρημα
-    cleaned_text = [
-        re.sub(
-            r"(χρημ[α-ω]{,8}$)|(^χρημ[α-ω]{,8}\s?)|(\s?χρημ[α-ω]{,8}\s?)",
-            " χρηματα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Returns:
+    -------
+    str: Cleaned text with unwanted characters removed and certain words normalized.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    """
+    # Convert text to string
+    text = str(text)
 
-    # Converting ανθρωπια variations to _ανθρωπια
-    cleaned_text = [
-        re.sub(r"(^ανθρωπια\s?)|(\s?ανθρωπια$)|(\s?ανθρωπια\s?)", " _ανθρωπια ", text)
-        for text in cleaned_text
-    ]
+    # Convert variations of words to the form the topic keywords use, with the
+    # "topic cleaner" section of the normalization rules
+    cleaned_text = text
+    for rule in get_rules("topic cleaner").rules:
+        cleaned_text = substitute(rule, cleaned_text)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Tokenize text
+    cleaned_text = cleaned_text.split()
 
-    # Converting κανονας variations to κανονας
-    cleaned_text = [
-        re.sub(
-            r"(^κανον[α-ω]{,8})|(\s?κανον[α-ω]{,8}$)|(\s?κανον[α-ω]{,8}\s?)",
-            " κανονας ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    # Remove stopwords
+    stop_words = get_stop_word_set()
+    cleaned_text = [t for t in cleaned_text if t not in stop_words]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Connect tokens
+    cleaned_text = " ".join(cleaned_text)
 
-    # Converting χωρα variations to χωρα
-    cleaned_text = [
-        re.sub(
-            r"(^χωρα\s)|(\sχωρα$)|(\sχωρα\s)|(^χωρες\s)|(\sχωρες$)|(\sχωρες\s)|(^χωρας\s)|(\sχωρας$)|(\sχωρας\s)|(^χωρων\s)|(\sχωρων$)|(\sχωρων\s)",
-            " χωρα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    # Remove multiple spaces
+    cleaned_text = re.sub(r"\s{2,}", " ", cleaned_text)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    return cleaned_text
 
-    # Converting πολυ variations to _πολυ
-    cleaned_text = [
-        re.sub(
-            r"(^πολυ\s?)|(\s?πολυ$)|(\s?πολυ\s?)|(^πολλες\s?)|(\s?πολλες$)|(\s?πολλες\s?)|(^πολλα\s?)|(\s?πολλα$)|(\s?πολλα\s?)|(^πολλοι\s?)|(\s?πολλοι$)|(\s?πολλοι\s?)",
-            " _πολυ ",
-            text,
-        )
-        for text in cleaned_text
-    ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+def topic_dictionary(dataframe: pd.DataFrame, multi_topic: bool = False) -> TopicIndex:
+    """
+    Creates a topic index with keywords as keys and the ids of their topics as values.
 
-    # Converting στιγμα variations to _στιγμα
-    cleaned_text = [
-        re.sub(
-            r"(^στιγμα[α-ω]{,8}\s?)|(\s?στιγμα[α-ω]{,8}$)|(\s?στιγμα[α-ω]{,8}\s?)",
-            " _στιγμα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Every column of the DataFrame is a topic, labelled by its first row, with one keyword
+    per following row. Cells holding "nothing" are skipped. A keyword listed under several
+    topics refers to all of them with multi_topic=True, otherwise only to the last one.
+
+    Args:
+    ----
+    dataframe (pd.DataFrame): DataFrame containing the keywords and their corresponding topics.
+    multi_topic (bool): Keep every topic of a keyword instead of the last one.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    TopicIndex: Topic labels and the topic ids of every keyword.
 
-    # Converting covid variations to covid
-    cleaned_text = [
-        re.sub(
-            r"(^cοβ[α-ωa-z]{,3}\s?)|(\s?cοβ[α-ωa-z]{,3}$)|(\s?cοβ[α-ωa-z]{,3}\s?)",
-            " covid ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    """
+    labels = [str(label).strip() for label in dataframe.iloc[0].values.tolist()]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Collect the topics of every keyword, in column order
+    topics = {}
+    for topic_id in range(dataframe.shape[1]):
+        for term in dataframe.iloc[1:, topic_id].values.tolist():
+            if not isinstance(term, str) or term == "nothing":
+                continue
 
-    # Remove "¨"
-    cleaned_text = [re.sub(r"¨", " ", text) for text in cleaned_text]
+            # Replace underscore character with a space character
+            term = re.sub(r"\_", " ", term)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+            if multi_topic:
+                topic_ids = topics.setdefault(term, [])
+                if topic_id not in topic_ids:
+                    topic_ids.append(topic_id)
+            else:
+                topics[term] = [topic_id]
 
-    # Remove "¨"
-    cleaned_text = [re.sub(r"΄΄", " ", text) for text in cleaned_text]
+    return TopicIndex(
+        labels=labels,
+        keywords={term: np.array(topic_ids) for term, topic_ids in topics.items()},
+    )
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Remove "«"
-    cleaned_text = [re.sub(r"«", " ", text) for text in cleaned_text]
+def drop_empty_topics(
+    unigrams: pd.DataFrame, bigrams: pd.DataFrame
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Drops the topics that have no keyword in either the unigram or the bigram sheet.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Both DataFrames hold one topic per column, labelled by its first row, as topic_dictionary
+    reads them. A topic is kept in both as long as one of them lists a keyword for it, so
+    that the two topic indexes have the same topics in the same order. Run it before the
+    empty cells are filled.
 
-    # Remove "»"
-    cleaned_text = [re.sub(r"»", " ", text) for text in cleaned_text]
+    Args:
+    ----
+    unigrams (pd.DataFrame): Unigram keywords, with the same columns as bigrams.
+    bigrams (pd.DataFrame): Bigram keywords.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]: The unigram and bigram keywords of the topics with keywords.
 
-    # Converting αγαθα variations to αγαθα
-    cleaned_text = [
-        re.sub(
-            r"(^αγαθ[α-ω]{,2}\s?)|(\s?αγαθ[α-ω]{,2}$)|(\s?αγαθ[α-ω]{,2}\s?)",
-            " αγαθα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    """
+    has_keywords = unigrams.iloc[1:].notna().any() | bigrams.iloc[1:].notna().any()
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    return unigrams.loc[:, has_keywords].copy(), bigrams.loc[:, has_keywords].copy()
 
-    # Converting αγανακτηση variations to αγανακτηση
-    cleaned_text = [
-        re.sub(
-            r"(^αγανακτ[α-ω]{,8}\s?)|(\s?αγανακτ[α-ω]{,8}$)|(\s?αγανακτ[α-ω]{,8}\s?)",
-            " αγανακτηση ",
-            text,
-        )
-        for text in cleaned_text
-    ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+def write_topic_masks(
+    masks: List[int], n_topics: int, output: str = "float", out: Optional[Any] = None
+) -> Any:
+    """
+    Turns per-row topic bitmasks into a topic matrix, OR-ing them into out if it is given.
 
-    # Remove cατερινγκ variations
-    cleaned_text = [
-        re.sub(
-            r"(^cατερινγ\s?)|(\s?cατερινγ$)|(\s?cατερινγ\s?)|(^cομ\s?)|(\s?cομ$)|(\s?cομ\s?)",
-            " ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Args:
+    ----
+    masks (List[int]): Bitmask of the topics of every row, bit i set for topic column i.
+    n_topics (int): Number of topic columns.
+    output (str): "float" for a float64 matrix of 0s and 1s, "bool" for a boolean matrix, "packed" for a uint8 matrix with 8 topics per byte as np.packbits lays them out, or "csr" for a boolean scipy.sparse.csr_matrix.
+    out (Optional[Any]): Matrix of the same output type and number of rows to update instead of a new one.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    Any: Matrix with shape (length of dataset, number of topics), (length of dataset, number of topics / 8) when packed.
 
-    # Remove all numbers except those refering to %
-    cleaned_text = [
-        re.sub(
-            r"(^[0-9]{2,3}\s?%\s?)|(\s?[0-9]{2,3}\s?%$)|(\s?[0-9]{2,3}\s?%\s?)",
-            " % ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    """
+    if output == "csr":
+        from scipy.sparse import csr_matrix
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+        indices = []
+        indptr = [0]
+        for mask in masks:
+            indices.extend(column for column in range(n_topics) if mask >> column & 1)
+            indptr.append(len(indices))
 
-    # Converting αγαπη variations to αγαπη
-    cleaned_text = [
-        re.sub(
-            r"(^αγαπ[α-ω]{,8}\s?)|(\s?αγαπ[α-ω]{,8}$)|(\s?αγαπ[α-ω]{,8}\s?)",
-            " αγαπη ",
-            text,
+        matrix = csr_matrix(
+            (np.ones(len(indices), dtype=bool), indices, indptr),
+            shape=(len(masks), n_topics),
         )
-        for text in cleaned_text
-    ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+        # Sparse matrices cannot be updated in place without changing their structure
+        return matrix if out is None else (out + matrix).astype(bool)
 
-    # Converting αγγλια variations to αγγλια
-    cleaned_text = [
-        re.sub(
-            r"(^αγγλ[α-ω]{,8}\s?)|(\s?αγγλ[α-ω]{,8}$)|(\s?αγγλ[α-ω]{,8}\s?)",
-            " αγγλια ",
-            text,
+    if output == "float":
+        matrix = np.zeros((len(masks), n_topics)) if out is None else out
+    elif output == "bool":
+        matrix = np.zeros((len(masks), n_topics), dtype=bool) if out is None else out
+    elif output == "packed":
+        matrix = (
+            np.zeros((len(masks), (n_topics + 7) // 8), dtype=np.uint8)
+            if out is None
+            else out
+        )
+    else:
+        raise ValueError(
+            f"Unknown output {output!r}, expected 'float', 'bool', 'packed' or 'csr'"
         )
-        for text in cleaned_text
-    ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    for row, mask in enumerate(masks):
+        column = 0
+        while mask:
+            if mask & 1:
+                if output == "packed":
+                    matrix[row, column >> 3] |= 0x80 >> (column & 7)
+                else:
+                    matrix[row, column] = 1
+            mask >>= 1
+            column += 1
 
-    # Converting εγκατελειψαν variations to εγκατελειψαν
-    cleaned_text = [
-        re.sub(
-            r"(^αγκατελειψαν\s?)|(\s?αγκατελειψαν$)|(\s?αγκατελειψαν\s?)",
-            " εγκατελειψαν ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    return matrix
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Converting αγνοια variations to αγνοια
-    cleaned_text = [
-        re.sub(
-            r"(^αγνο[α-ω]{2,8}\s?)|(\s?αγνο[α-ω]{2,8}$)|(\s?αγνο[α-ω]{2,8}\s?)",
-            " αγνοια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+@profiled
+def unigram_topic_matrix_creator(
+    dataframe: pd.DataFrame,
+    topic_dic: Union[TopicIndex, Dict[str, str]],
+    output: str = "float",
+    out: Optional[Any] = None,
+) -> np.ndarray:
+    """
+    Returns a matrix with 0s and 1s, where the value 1 means that a respondent uses a unigram keyword, thus refers to a topic
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Args:
+    ----
+    dataframe (pd.DataFrame): Input DataFrame containing the cleaned text.
+    topic_dic (Union[TopicIndex, Dict[str, str]]): Topic index from topic_dictionary, or a dictionary where the keys are keywords and the values are the topics.
+    output (str): Matrix type, one of "float", "bool", "packed" or "csr", see write_topic_masks.
+    out (Optional[Any]): Matrix of the same type, e.g. from bigram_topic_matrix_creator, to OR the topics into.
 
-    # Converting αγνωστο variations to αγνωστο
-    cleaned_text = [
-        re.sub(
-            r"(^αγνωστ[α-ω]{1,8}\s?)|(\s?αγνωστ[α-ω]{1,8}$)|(\s?αγνωστ[α-ω]{1,8}\s?)",
-            " αγνωστο ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Returns:
+    -------
+    np.ndarray: Matrix with shape (length of dataset, number of topics).
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    """
+    # Create 1d numpy array containing cleaned text
+    text = dataframe.cleaned.values.tolist()
 
-    # Converting αγωνα variations to αγωνα
-    cleaned_text = [
-        re.sub(r"(^αγονα\s?)|(\s?αγονα$)|(\s?αγονα\s?)", " αγωνα ", text)
-        for text in cleaned_text
-    ]
+    # Bit of the topic columns of every term
+    topic_index = as_topic_index(topic_dic)
+    term_masks = topic_index.masks()
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Iterate through texts, marking the topics of every term of the text
+    masks = []
+    for t in text:
+        found = 0
+        for term in t.split():
+            found |= term_masks.get(term, 0)
+        masks.append(found)
 
-    # Converting αγορα variations to αγορα
-    cleaned_text = [
-        re.sub(
-            r"(^αγορ[α-ω]{1}ς )|( αγορ[α-ω]{1}ς$)|( αγορ[α-ω]{1}ς )", " αγορα ", text
-        )
-        for text in cleaned_text
-    ]
+    return write_topic_masks(masks, len(topic_index.labels), output, out)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Converting αγροτικο variations to αγροτικο
-    cleaned_text = [
-        re.sub(
-            r"(^αγρο[α-ω]{,8}\s?)|(\s?αγρο[α-ω]{,8}$)|(\s?αγρο[α-ω]{,8}\s?)",
-            " αγροτικο ",
-            text,
-        )
-        for text in cleaned_text
-    ]
-
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
-
-    # Converting αγωνες variations to αγωνα
-    cleaned_text = [
-        re.sub(
-            r"(^αγωνες\s?)|(\s?αγωνες$)|(\s?αγωνες\s?)|(^αγωνιζεσαι\s?)|(\s?αγωνιζεσαι$)|(\s?αγωνιζεσαι\s?)|(^αγωνιζεται\s?)|(\s?αγωνιζεται$)|(\s?αγωνιζεται\s?)|(^αγωνιζομαστε\s?)|(\s?αγωνιζομαστε$)|(\s?αγωνιζομαστε\s?)|(^αγωνισθουν\s?)|(\s?αγωνισθουν$)|(\s?αγωνισθουν\s?)|(^αγωνιστηκε\s?)|(\s?αγωνιστηκε$)|(\s?αγωνιστηκε\s?)|(^αγωνιστουμε\s?)|(\s?αγωνιστουμε$)|(\s?αγωνιστουμε\s?)|(^αγωνιστουν\s?)|(\s?αγωνιστουν$)|(\s?αγωνιστουν\s?)|(^αγωνας\s?)|(\s?αγωνας$)|(\s?αγωνας\s?)",
-            " αγωνα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
-
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
-
-    # Converting αδεια variations to αδεια
-    cleaned_text = [
-        re.sub(r"(^αδειας\s?)|(\s?αδειας$)|(\s?αδειας\s?)", " αδεια ", text)
-        for text in cleaned_text
-    ]
+@profiled
+def bigram_topic_matrix_creator(
+    dataframe: pd.DataFrame,
+    topic_dic: Union[TopicIndex, Dict[str, str]],
+    output: str = "float",
+    out: Optional[Any] = None,
+) -> np.ndarray:
+    """
+    Returns a matrix with 0s and 1s, where the value 1 means that a respondent uses a bigram keyword, thus refers to a topic
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Args:
+    ----
+    dataframe (pd.DataFrame): Input DataFrame containing the cleaned text.
+    topic_dic (Union[TopicIndex, Dict[str, str]]): Topic index from topic_dictionary, or a dictionary where the keys are keywords and the values are the topics.
+    output (str): Matrix type, one of "float", "bool", "packed" or "csr", see write_topic_masks.
+    out (Optional[Any]): Matrix of the same type, e.g. from unigram_topic_matrix_creator, to OR the topics into.
 
-    # Converting αδελφικες variations to αδελφια
-    cleaned_text = [
-        re.sub(
-            r"(^αδελφικες\s?)|(\s?αδελφικες$)|(\s?αδελφικες\s?)|(^αδελφους\s?)|(\s?αδελφους$)|(\s?αδελφους\s?)|(^αδελφο\s?)|(\s?αδελφο$)|(\s?αδελφο\s?)|(^αδερφες\s?)|(\s?αδερφες$)|(\s?αδερφες\s?)|(^αδερφια\s?)|(\s?αδερφια$)|(\s?αδερφια\s?)",
-            " αδελφια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Returns:
+    -------
+    np.ndarray: Matrix with shape (length of dataset, number of topics).
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    """
+    # Create 1d numpy array containing cleaned text
+    text = dataframe.cleaned.values.tolist()
 
-    # Converting αδιαβλητα variations to αδιαβλητα
-    cleaned_text = [
-        re.sub(
-            r"(^αδιαβλητ[α-ω]{,3}\s?)|(\s?αδιαβλητ[α-ω]{,3}$)|(\s?αδιαβλητ[α-ω]{,3}\s?)",
-            " αδιαβλητα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    # Bit of the topic columns of every term
+    topic_index = as_topic_index(topic_dic)
+    term_masks = topic_index.masks()
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
-    cleaned_text = [
-        re.sub(
-            r"(^αδιαπραγματε[α-ω]{,8}\s?)|(\s?αδιαπραγματε[α-ω]{,8}$)|(\s?αδιαπραγματε[α-ω]{,8}\s?)",
-            " αδιαπραγματευτο ",
-            text,
-        )
-        for text in cleaned_text
+    # Literal terms are found together in one scan of each text, the rest as regular expressions
+    matcher = KeywordMatcher(
+        {term: mask for term, mask in term_masks.items() if is_literal(term)}
+    )
+    patterns = [
+        (re.compile(term), mask)
+        for term, mask in term_masks.items()
+        if not is_literal(term)
     ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Iterate through texts, marking the topics of the terms found in the text
+    masks = []
+    for t in text:
+        found = matcher.match(t)
+        for pattern, mask in patterns:
+            if pattern.search(t) is not None:
+                found |= mask
+        masks.append(found)
 
-    # Converting αδιαφανεια variations to αδιαφανεια
-    cleaned_text = [
-        re.sub(
-            r"(^αδιαφαν[α-ω]{,8}\s?)|(\s?αδιαφαν[α-ω]{,8}$)|(\s?αδιαφαν[α-ω]{,8}\s?)",
-            " αδιαφανεια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    return write_topic_masks(masks, len(topic_index.labels), output, out)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Converting αδιαφορια variations to αδιαφορια
-    cleaned_text = [
-        re.sub(
-            r"(^αδιαφορ[α-ω]{,8}\s?)|(\s?αδιαφορ[α-ω]{,8}$)|(\s?αδιαφορ[α-ω]{,8}\s?)",
-            " αδιαφορια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+@profiled
+def topic_matrix_creator(
+    dataframe: pd.DataFrame,
+    unigram_dic: Union[TopicIndex, Dict[str, str]],
+    bigram_dic: Union[TopicIndex, Dict[str, str]],
+    output: str = "float",
+) -> np.ndarray:
+    """
+    Returns a matrix with 0s and 1s, where the value 1 means that a respondent uses a unigram or a bigram keyword of a topic
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Every text is tokenized once. Each token is looked up in the unigrams and each run
+    of consecutive tokens in the bigrams, both through hash maps, so no regular
+    expression is involved. Bigrams only match whole tokens, unlike
+    bigram_topic_matrix_creator which also finds them inside longer words, e.g.
+    "νομιμη μεταναστευση" in "παρανομιμη μεταναστευσεις".
 
-    # Converting αδικο variations to αδικο
-    cleaned_text = [
-        re.sub(
-            r"(^αδικ[α-ω]{,8}\s?)|(\s?αδικ[α-ω]{,8}\$)|(\s?αδικ[α-ω]{,8}\s?)",
-            " αδικο ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Args:
+    ----
+    dataframe (pd.DataFrame): Input DataFrame containing the cleaned text.
+    unigram_dic (Union[TopicIndex, Dict[str, str]]): Topic index of the unigram keywords, or a dictionary where the keys are keywords and the values are the topics.
+    bigram_dic (Union[TopicIndex, Dict[str, str]]): Topic index of the bigram keywords, or a dictionary where the keys are keywords and the values are the topics.
+    output (str): Matrix type, one of "float", "bool", "packed" or "csr", see write_topic_masks.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    np.ndarray: Matrix with shape (length of dataset, number of topics).
 
-    # Converting αδικο variations to αδικο
-    cleaned_text = [
-        re.sub(r"(^αδικοες\s?)|(\s?αδικοες$)|(\s?αδικοες\s?)", " αδικο ", text)
-        for text in cleaned_text
-    ]
+    """
+    # Create 1d numpy array containing cleaned text
+    text = dataframe.cleaned.values.tolist()
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    unigram_index = as_topic_index(unigram_dic)
+    bigram_index = as_topic_index(bigram_dic)
+    if unigram_index.labels != bigram_index.labels:
+        raise ValueError("The unigram and bigram topics differ")
+
+    # Bit of the topic columns of every unigram and of every bigram, as a tuple of tokens
+    unigram_masks = unigram_index.masks()
+    bigram_masks = {}
+    for term, mask in bigram_index.masks().items():
+        tokens = tuple(term.split())
+        bigram_masks[tokens] = bigram_masks.get(tokens, 0) | mask
+    lengths = sorted(set(len(tokens) for tokens in bigram_masks))
+
+    # Iterate through texts, marking the topics of every token and run of tokens
+    masks = []
+    for t in text:
+        tokens = t.split()
+        found = 0
+        for i, token in enumerate(tokens):
+            found |= unigram_masks.get(token, 0)
+            for length in lengths:
+                found |= bigram_masks.get(tuple(tokens[i : i + length]), 0)
+        masks.append(found)
+
+    return write_topic_masks(masks, len(unigram_index.labels), output)
+
+
+@profiled
+def binarize_topic_matrices(*matrices: np.ndarray) -> np.ndarray:
+    """
+    Combines topic matrices of the same shape into one, where a topic is marked if any of them marks it.
 
-    # Converting αδρανεια variations to αδρανεια
-    cleaned_text = [
-        re.sub(
-            r"(^αδραν[α-ω]{,8}\s?)|(\s?αδραν[α-ω]{,8}$)|(\s?αδραν[α-ω]{,8}\s?)",
-            " αδρανεια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Args:
+    ----
+    *matrices (np.ndarray): Dense matrices from the topic matrix creators, e.g. the unigram and bigram matrices.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    np.ndarray: Matrix of 0s and 1s with the shape and dtype of the first matrix.
 
-    # Converting αδυναμια variations to αδυναμια
-    cleaned_text = [
-        re.sub(
-            r"(^αδυναμ[α-ω]{,8}\s?)|(\s?αδυναμ[α-ω]{,8}$)|(\s?αδυναμ[α-ω]{,8}\s?)",
-            " αδυναμια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    """
+    dtype = matrices[0].dtype
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    # Bits are OR-ed as they are, so packed matrices are combined too
+    if dtype == bool or np.issubdtype(dtype, np.integer):
+        return np.bitwise_or.reduce(matrices)
 
-    # Converting αδυνατο variations to αδυνατο
-    cleaned_text = [
-        re.sub(
-            r"(^αδυνατ[α-ω]{,8}\s?)|(\s?αδυνατ[α-ω]{,8}$)|(\s?αδυνατ[α-ω]{,8}\s?)",
-            " αδυνατο ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    return np.logical_or.reduce(matrices).astype(dtype)
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
 
-    # Converting αηδια variations to αηδια
-    cleaned_text = [
-        re.sub(
-            r"(^αηδ[α-ω]{,8}\s?)|(\s?αηδ[α-ω]{,8}$)|(\s?αηδ[α-ω]{,8}\s?)",
-            " αηδια ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+def normalize_vocabulary(
+    text_analysis: pd.DataFrame, normalization_type: str
+) -> List[Tuple[str, str]]:
+    """
+    Builds the distinct vocabulary of the cleaned texts, normalizes it with the cleaning rules and stems or lemmatizes every word.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Args:
+    ----
+    text_analysis (pd.DataFrame): Input DataFrame containing the text to be cleaned.
+    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
 
-    # Converting ανθρωπινα variations to ανθρωπινα
-    cleaned_text = [
-        re.sub(
-            r"(^αθρωπιν[α-ω]{,8}\s?)|(\s?αθρωπιν[α-ω]{,8}$)|(\s?αθρωπιν[α-ω]{,8}\s?)",
-            " ανθρωπινα ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    Returns:
+    -------
+    List[Tuple[str, str]]: Sorted (word, stemmed or lemmatized word) pairs.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    """
+    # adding texts to a list
+    texts = text_analysis.cleaned.values.tolist()
 
-    # Remove typos
-    cleaned_text = [
-        re.sub(
-            r"(^ιπχον\s?)|(\s?ιπχον$)|(\s?ιπχον\s?)|(^ισικαου\s?)|(\s?ισικαου$)|(\s?ισικαου\s?)",
-            " ",
-            text,
-        )
-        for text in cleaned_text
-    ]
+    # lowercasing each token and removing duplicates
+    vocabulary = set(token.lower() for text in texts for token in text.split())
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    return normalize_words(vocabulary, normalization_type)
 
-    # Remove typos
-    cleaned_text = [
-        re.sub(r"(^υουρ\s?)|(\s?υουρ$)|(\s?υουρ\s?)", " ", text)
-        for text in cleaned_text
-    ]
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+@profiled
+def normalize_words(
+    vocabulary: Iterable[str], normalization_type: str
+) -> List[Tuple[str, str]]:
+    """
+    Normalizes distinct lowercase words with the cleaning rules and stems or lemmatizes every result.
 
-    # Remove multiple spaces
-    cleaned_text = [re.sub(r"\s+", " ", text) for text in cleaned_text]
+    Args:
+    ----
+    vocabulary (Iterable[str]): Distinct lowercase words.
+    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
 
-    # Remove left-over characters of length 1
-    cleaned_text = [text for text in cleaned_text if len(text) > 1]
+    Returns:
+    -------
+    List[Tuple[str, str]]: Sorted (word, stemmed or lemmatized word) pairs.
 
-    # Apply stemming
-    cleaned_text = [lemma_stem(text, "stem") for text in cleaned_text]
+    """
+    # applying the cleaning rules once per distinct token and removing duplicates
+    vocabulary = set(rewrite_tokens(vocabulary, get_rules("cleaner")))
 
-    fin = []
+    # stemming or lemmatizing the texts, lemmas are computed in batches
+    if normalization_type == "lemma":
+        vocabulary = list(vocabulary)
+        vocabulary = list(zip(vocabulary, lemmatize_texts(vocabulary)))
+    else:
+        vocabulary = [
+            (text, lemma_stem(text, normalization_type)) for text in vocabulary
+        ]
 
-    # Apply stemming where it is possible
-    for token in cleaned_text:
-        try:
-            fin.append(stem_dict[token][0])
-        except:
-            fin.append(token)
+    # sorting the text
+    vocabulary.sort()
 
-    return " ".join(fin).strip()
+    return vocabulary
 
 
-def topic_cleaner(text: str) -> str:
+def normalize_citizens_text(
+    text_analysis: pd.DataFrame, normalization_type: str
+) -> List[str]:
     """
     Cleans the input text by removing unwanted characters, normalizing certain words,
 
     Args:
     ----
-    text (str): Input text to be cleaned.
+    text_analysis (pd.DataFrame): Input DataFrame containing the text to be cleaned.
+    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
 
     Returns:
     -------
-    str: Cleaned text with unwanted characters removed and certain words normalized.
+    List[str]: List of cleaned text strings.
 
     """
-    # Convert text to string
-    text = str(text)
-
-    # Convert ενα τις εκατο variations to ενα τις εκατο
-    cleaned_text = re.sub(
-        r"(1\s?%)|(ενα\s?τ[α-ω]+\s?εκατο)|(ενα\s?στ[α-ω]+\s?εκατο)|(μια\s?τ[α-ω]+\s?εκατο)|(μια\s?στ[α-ω]+\s?εκατο)|(ενα\s?τ[α-ω]+\s?100)|(ενα\s?στ[α-ω]+\s?100)|(μια\s?τ[α-ω]+\s?100)|(μια\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1\s?τ[α-ω]+\s?100)|(1\s?στ[α-ω]+\s?100)|(1/100)|(0.01)|(0,01)",
-        " ενα τις εκατο ",
-        text,
-    )
-
-    # Convert πολυ variations to πολυ
-    cleaned_text = re.sub(r"\s_πολυ\s", " πολυ ", cleaned_text)
-
-    # Convert απολυτως variations to απολυτως
-    cleaned_text = re.sub(r"\sα πολυ τως\s", " απολυτως ", cleaned_text)
-
-    # Convert διαβιωσης variations to διαβιωσης
-    cleaned_text = re.sub(r"\sδιαβιωσεις\s", " διαβιωσης ", cleaned_text)
-
-    # Convert διαβιωση variations to διαβιωση
-    cleaned_text = re.sub(r"\sδιαβιωσης\s", " διαβιωση ", cleaned_text)
-
-    # Convert διαβισωσης variations to διαβιωσης
-    cleaned_text = re.sub(r"\sδιαβιωση\s", " διαβιωσης ", cleaned_text)
-
-    # Convert ελεγχομενη variations to ελεγχομενη
-    cleaned_text = re.sub(r"\sελεγχεται\s", " ελεγχομενη ", cleaned_text)
-
-    # Convert παιδι variations to παιδι
-    cleaned_text = re.sub(r"\sπαιδια\s", " παιδι ", cleaned_text)
-
-    # Convert ελεγχομενη variations to ελεγχομενη
-    cleaned_text = re.sub(r"\sελεγχομενα\s", " ελεγχομενη ", cleaned_text)
-
-    # Convert μορφωση variations to μορφωση
-    cleaned_text = re.sub(r"\sμορφωσει\s", " μορφωση ", cleaned_text)
+    return normalize_vocabulary(text_analysis, normalization_type)
 
-    # Convert διασφαλιζε variations to διασφαλιζε
-    cleaned_text = re.sub(r"\sδιασφαλιζει\s", " διασφαλιζε ", cleaned_text)
 
-    # Convert διασφαλιζε variations to διασφαλιζει
-    cleaned_text = re.sub(r"\sδιασφαλιζε\s", " διασφαλιζει ", cleaned_text)
-
-    # Convert εισβολεα variations to εισβολεα
-    cleaned_text = re.sub(r"\sεισβολεας\s", " εισβολεα ", cleaned_text)
-
-    # Convert εισβολεα variations to εισβολεας
-    cleaned_text = re.sub(r"\sεισβολεα\s", " εισβολεας ", cleaned_text)
-
-    # Convert νησι variations to νησι
-    cleaned_text = re.sub(r"\sνησια\s", " νησι ", cleaned_text)
-
-    # Convert νησι variations to νησια
-    cleaned_text = re.sub(r"\sνησι\s", " νησια ", cleaned_text)
-
-    # Convert ανθρωπινες variations to ανθρωπινες
-    cleaned_text = re.sub(r"\sανθρωπινα\s", " ανθρωπινες ", cleaned_text)
-
-    # Convert μουσουλμανο variations to μουσουλμανο
-    cleaned_text = re.sub(r"\sμουσουλμανοι\s", " μουσουλμανο ", cleaned_text)
-
-    # Convert μουσουλμανοι variations to μουσουλμανοι
-    cleaned_text = re.sub(r"\sμουσουλμανο\s", " μουσουλμανοι ", cleaned_text)
-
-    # Convert νομος variations to νομο
-    cleaned_text = re.sub(r"\sνομος\s", " νομο ", cleaned_text)
-
-    # Convert νομο variations to νομος
-    cleaned_text = re.sub(r"\sνομο\s", " νομος ", cleaned_text)
-
-    # Convert μορφωση variations to μορφωση
-    cleaned_text = re.sub(r"\sμορφωσε\s", " μορφωση ", cleaned_text)
-
-    # Convert περιθαλψη variations to περιθαλψη
-    cleaned_text = re.sub(r"\sπεριθαλψει\s", " περιθαλψη ", cleaned_text)
-
-    # Convert κανονα variations to κανονα
-    cleaned_text = re.sub(r"\sκανονας\s", " κανονα ", cleaned_text)
-
-    # Convert κανονα variations to κανονας
-    cleaned_text = re.sub(r"\sκανονα\s", " κανονας ", cleaned_text)
-
-    # Convert τηρηση variations to τηρηση
-    cleaned_text = re.sub(r"\sτηρηθουν\s", " τηρηση ", cleaned_text)
-
-    # Convert κλειστες variations to κλειστες
-    cleaned_text = re.sub(r"\sα κλειστες\s", " κλειστες ", cleaned_text)
-
-    # Convert εξοδο variations to εξοδο
-    cleaned_text = re.sub(r"\sεξοδα\s", " εξοδο ", cleaned_text)
-
-    # Convert προσωρινα variations to προσωρινα
-    cleaned_text = re.sub(r"\sπροσωρινες\s", " προσωρινα ", cleaned_text)
-
-    # Convert ποσοστο variations to %
-    cleaned_text = re.sub(r"\sποσοστο\s", " % ", cleaned_text)
-
-    # Convert κλειστες variations to κλειστες
-    cleaned_text = re.sub(r"\sγικλειστες\s", " κλειστες ", cleaned_text)
-
-    # Convert σηκωνει variations to σηκωνει
-    cleaned_text = re.sub(r"\sσηκωσει\s", " σηκωνει ", cleaned_text)
-
-    # Convert κλειστες variations to κλειστες
-    cleaned_text = re.sub(r"\sμικλειστες\s", " κλειστες ", cleaned_text)
-
-    # Convert απελαση variations to απελαση
-    cleaned_text = re.sub(r"\sαπελασει\s", " απελαση ", cleaned_text)
-
-    # Convert ενταξη variations to ενταξη
-    cleaned_text = re.sub(r"\sεντασσει\s", " ενταξη ", cleaned_text)
-
-    # Convert τηρηση variations to τηρηση
-    cleaned_text = re.sub(r"\sτηρει\s", " τηρηση ", cleaned_text)
-
-    # Convert ενσωματωση variations to ενσωματωση
-    cleaned_text = re.sub(r"\sενσωματωθει\s", " ενσωματωση ", cleaned_text)
-
-    # Convert εγκληματιες variations to εγκληματιες
-    cleaned_text = re.sub(r"\sεγκληματιας\s", " εγκληματιες ", cleaned_text)
-
-    # Convert βοηθεια variations to βοηθεια
-    cleaned_text = re.sub(r"\sβοηθα\s", " βοηθεια ", cleaned_text)
-
-    # Convert επιβαλλουν variations to επιβαλλουν
-    cleaned_text = re.sub(r"\sεπιβαλλει\s", " επιβαλλουν ", cleaned_text)
-
-    # Convert αναγνωρισμενοι variations to αναγνωρισμενοι
-    cleaned_text = re.sub(r"\sαναγνωρισμενες\s", " αναγνωρισμενοι ", cleaned_text)
-
-    # Tokenize text
-    cleaned_text = cleaned_text.split()
-
-    # Remove stopwords
-    cleaned_text = [t for t in cleaned_text if t not in stop_words]
-
-    # Connect tokens
-    cleaned_text = " ".join(cleaned_text)
-
-    # Remove multiple spaces
-    cleaned_text = re.sub(r"\s{2,}", " ", cleaned_text)
-
-    return cleaned_text
-
-
-def topic_dictionary(dataframe: pd.DataFrame) -> Dict[str, str]:
+def normalize_councilors_text(
+    text_analysis: pd.DataFrame, normalization_type: str
+) -> List[str]:
     """
-    Creates a dictionary with keywords as keys and topics as values.
+    Cleans the input text by removing unwanted characters, normalizing certain words,
 
     Args:
     ----
-    dataframe (pd.DataFrame): DataFrame containing the keywords and their corresponding topics.
+    text_analysis (pd.DataFrame): Input DataFrame containing the text to be cleaned.
+    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
 
     Returns:
     -------
-    Dict[str, str]: Dictionary with keywords as keys and topics as values.
+    List[str]: List of cleaned text strings.
 
     """
-    # Store every column to a 1d numpy array
-    Worthiness = dataframe.iloc[1:, 0].values.tolist()
-    Humanitarian = dataframe.iloc[1:, 1].values.tolist()
-    Economic = dataframe.iloc[1:, 2].values.tolist()
-    Cultural = dataframe.iloc[1:, 3].values.tolist()
-    Security = dataframe.iloc[1:, 4].values.tolist()
-    Fairness = dataframe.iloc[1:, 5].values.tolist()
-    Institutiοnal = dataframe.iloc[1:, 6].values.tolist()
-    Assimilation = dataframe.iloc[1:, 7].values.tolist()
-    Public = dataframe.iloc[1:, 8].values.tolist()
-
-    # Replace underscore character with a space character if this term is not "nothing"
-    Worthiness = [re.sub(r"\_", " ", term) for term in Worthiness if term != "nothing"]
-    Humanitarian = [
-        re.sub(r"\_", " ", term) for term in Humanitarian if term != "nothing"
-    ]
-    Economic = [re.sub(r"\_", " ", term) for term in Economic if term != "nothing"]
-    Cultural = [re.sub(r"\_", " ", term) for term in Cultural if term != "nothing"]
-    Security = [re.sub(r"\_", " ", term) for term in Security if term != "nothing"]
-    Fairness = [re.sub(r"\_", " ", term) for term in Fairness if term != "nothing"]
-    Institutiοnal = [
-        re.sub(r"\_", " ", term) for term in Institutiοnal if term != "nothing"
-    ]
-    Assimilation = [
-        re.sub(r"\_", " ", term) for term in Assimilation if term != "nothing"
-    ]
-    Public = [re.sub(r"\_", " ", term) for term in Public if term != "nothing"]
-
-    # Initialize a dictionary
-    dictionary = {}
-
-    # Iterate through every column
-    for term in Worthiness:
-        # Iteratively update key-value pairs of the dictionary
-        dictionary[f"{term}"] = "Identity Characteristics"
-
-    for term in Humanitarian:
-        dictionary[f"{term}"] = "Legal rationale"
-
-    for term in Economic:
-        dictionary[f"{term}"] = "Cultural/ Social  concerns"
-
-    for term in Cultural:
-        dictionary[f"{term}"] = "Public order concerns"
-
-    for term in Security:
-        dictionary[f"{term}"] = "Economic concerns"
-
-    for term in Fairness:
-        dictionary[f"{term}"] = "Humanitarian concerns"
-
-    for term in Institutiοnal:
-        dictionary[f"{term}"] = "Mobility concerns"
+    return normalize_vocabulary(text_analysis, normalization_type)
 
-    for term in Assimilation:
-        dictionary[f"{term}"] = "Trust in authorities"
 
-    for term in Public:
-        dictionary[f"{term}"] = "Fairness"
-
-    return dictionary
-
-
-def unigram_topic_matrix_creator(
-    dataframe: pd.DataFrame, topic_dic: Dict[str, str]
-) -> np.ndarray:
+@profiled
+def unify_citizens_councilors_texts(
+    citizens_df: pd.DataFrame,
+    councilors_df: pd.DataFrame,
+    compact: bool = False,
+    cache: bool = False,
+) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
     """
-    Returns a matrix with 0s and 1s, where the value 1 means that a respondent uses a unigram keyword, thus refers to a topic
+    Unify the citizens and councilors texts into dictionaries with stemmed words as keys and their original forms as values.
+
+    The stems are keyed in order of their first original form, alphabetically, and each
+    stem lists its original forms alphabetically, so the output does not depend on hashing.
+    With compact=True a StemIndex is returned for each population instead of a dictionary.
+    It is looked up the same way and takes several times less memory, but about as
+    much disk space once pickled.
+    With cache=True the result is stored in the cache directory set in config.json and
+    reused as long as the texts, the stopword files, the normalization rules and the
+    normalization type are unchanged.
 
     Args:
     ----
-    dataframe (pd.DataFrame): Input DataFrame containing the cleaned text.
-    topic_dic (Dict[str, str]): Dictionary where the keys are keywords and the values are the topics.
+    citizens_df (pd.DataFrame): DataFrame containing citizens text data.
+    councilors_df (pd.DataFrame): DataFrame containing councilors text data.
+    compact (bool): Return StemIndex objects instead of dictionaries.
+    cache (bool): Reuse the dictionaries stored on disk by a previous run with the same inputs.
 
     Returns:
     -------
-    np.ndarray: Matrix with shape (length of dataset, number of topics).
+    Tuple[Dict[str, List[str]], Dict[str, List[str]]]: Dictionaries with stemmed words as keys and their original forms as values for citizens and councilors.
 
     """
-    # Create 1d numpy array containing cleaned text
-    text = dataframe.cleaned.values.tolist()
-
-    # Initialize topic matrix with zeros
-    matrix = np.zeros((len(text), 9))
-
-    # Initialize topic dictionary
-    dictionary = {
-        "Identity Characteristics": 0,
-        "Legal rationale": 1,
-        "Cultural/ Social  concerns": 2,
-        "Public order concerns": 3,
-        "Economic concerns": 4,
-        "Humanitarian concerns": 5,
-        "Mobility concerns": 6,
-        "Trust in authorities": 7,
-        "Fairness": 8,
-    }
+    if cache:
+        key = stem_dicts_key(
+            citizens_df.cleaned.values.tolist(),
+            councilors_df.cleaned.values.tolist(),
+            compact,
+        )
+        stem_dicts = load_cached("stem_dicts", key)
+        if stem_dicts is not None:
+            return stem_dicts
 
-    # Iterate through texts
-    for row in range(matrix.shape[0]):
-        # Tokenize text
-        t = text[row].split()
+    # Create citizens and councilors lists
+    citizens = normalize_citizens_text(
+        text_analysis=citizens_df, normalization_type=get_normalization_type()
+    )
+    councilors = normalize_councilors_text(
+        text_analysis=councilors_df, normalization_type=get_normalization_type()
+    )
 
-        # For every term in the text
-        for term in t:
-            # Try to map it to a topic or multiple topics
-            try:
-                x = topic_dic[term]
-                x = dictionary[x]
-                matrix[row, x] = 1
+    if compact:
+        stem_dicts = StemIndex.from_pairs(citizens), StemIndex.from_pairs(councilors)
+    else:
+        # Grouping the words under their stems in a single pass over each corpus
+        stem_dicts = group_by_stem(citizens), group_by_stem(councilors)
 
-                # Else do nothing
-            except:
-                pass
+    if cache:
+        store_cached("stem_dicts", key, stem_dicts)
 
-    return matrix
+    return stem_dicts
 
 
-def bigram_topic_matrix_creator(
-    dataframe: pd.DataFrame, topic_dic: Dict[str, str]
-) -> np.ndarray:
+@profiled
+def topic_normalizer(text: str, population: str) -> str:
     """
-    Returns a matrix with 0s and 1s, where the value 1 means that a respondent uses a bigram keyword, thus refers to a topic
+    Applies the "topic analysis" section of the normalization rules to a single response,
+    as apply_topic_rules does with backend="apply".
 
     Args:
     ----
-    dataframe (pd.DataFrame): Input DataFrame containing the cleaned text.
-    topic_dic (Dict[str, str]): Dictionary where the keys are keywords and the values are the topics.
+    text (str): Response after cleaner().
+    population (str): Population of the response, "citizens" or "councilors".
 
     Returns:
     -------
-    np.ndarray: Matrix with shape (length of dataset, number of topics).
+    str: The rewritten response.
 
     """
-    # Create 1d numpy array containing cleaned text
-    text = dataframe.cleaned.values.tolist()
-
-    # Get terms from dictionary (meaning its keys)
-    terms = list(topic_dic.keys())
-
-    # Initialize topic matrix with zeros
-    matrix = np.zeros((len(text), 9))
-
-    # Initialize topic dictionary
-    dictionary = {
-        "Identity Characteristics": 0,
-        "Legal rationale": 1,
-        "Cultural/ Social  concerns": 2,
-        "Public order concerns": 3,
-        "Economic concerns": 4,
-        "Humanitarian concerns": 5,
-        "Mobility concerns": 6,
-        "Trust in authorities": 7,
-        "Fairness": 8,
-    }
+    for rule in rules_for(get_rules("topic analysis"), population):
+        text = substitute(rule, text)
 
-    # Iterate through texts
-    for row in range(matrix.shape[0]):
-        # Get text
-        t = text[row]
-        # Iterate through terms
-        for term in terms:
-            # Find all occurrences
-            x = re.findall(term, t)
-
-            # If the matched term has length > 1
-            if len(x) > 0:
-                # Update topic dictionary
-                x = topic_dic[term]
-                x = dictionary[x]
-                matrix[row, x] = 1
-
-            else:
-                # Else, ignore it
-                pass
-
-    return matrix
+    return text
 
 
-def normalize_citizens_text(
-    text_analysis: pd.DataFrame, normalization_type: str
-) -> List[str]:
+@profiled
+def apply_topic_rules(
+    text_analysis: pd.DataFrame,
+    councilors_spelled: pd.DataFrame,
+    backend: str = "apply",
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Cleans the input text by removing unwanted characters, normalizing certain words,
+    Applies the "topic analysis" section of the normalization rules to the cleaned responses.
+
+    With backend="apply" every rule runs over every response with Series.apply, one pass
+    per rule and population. With backend="vectorized" the two populations are concatenated
+    and every rule runs once over the column with Series.str.replace, restricted to the rows
+    of the populations it applies to. With object dtype, Series.str.replace still calls
+    re.sub once per row, so this is only about 1.3 times faster than "apply" on the Q30
+    answers repeated 100 times. With backend="vocabulary" the rules run once per distinct
+    word and the responses are rebuilt from the rewritten words, see
+    rewrite_texts_by_vocabulary, which is about 16 times faster there. All three give the
+    same result.
 
     Args:
     ----
-    text_analysis (pd.DataFrame): Input DataFrame containing the text to be cleaned.
-    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
+    text_analysis (pd.DataFrame): Citizens text data, with a "cleaned" column.
+    councilors_spelled (pd.DataFrame): Councilors text data, with a "cleaned" column.
+    backend (str): One of "apply", "vectorized" or "vocabulary".
 
     Returns:
     -------
-    List[str]: List of cleaned text strings.
+    Tuple[pd.DataFrame, pd.DataFrame]: The DataFrames for citizens and councilors, with "cleaned" rewritten.
 
     """
-    # Using regular expressions to clean the text
+    if backend not in ("apply", "vectorized", "vocabulary"):
+        raise ValueError(
+            f"Unknown backend {backend!r}, expected 'apply', 'vectorized' or 'vocabulary'"
+        )
 
-    # adding texts to a list
-    citizens = text_analysis.cleaned.values.tolist()
+    ruleset = get_rules("topic analysis")
 
-    # creating a list for each text, thus a list of lists
-    citizens = [text.split() for text in citizens]
+    if backend == "vectorized":
+        # Object dtype keeps the substitutions on Python's re engine
+        combined = pd.Series(
+            text_analysis.cleaned.tolist() + councilors_spelled.cleaned.tolist(),
+            dtype=object,
+        )
+        population = np.array(
+            ["citizens"] * len(text_analysis) + ["councilors"] * len(councilors_spelled)
+        )
 
-    # lowercasing each text
-    citizens = [text.lower() for t in citizens for text in t]
+        for rule in ruleset.rules:
+            if not rule.populations or set(population) <= set(rule.populations):
+                combined = combined.str.replace(
+                    rule.pattern, rule.replacement, regex=True
+                )
+            else:
+                mask = np.isin(population, rule.populations)
+                combined[mask] = combined[mask].str.replace(
+                    rule.pattern, rule.replacement, regex=True
+                )
 
-    # removing duplicates
-    citizens = list(set(citizens))
+        text_analysis["cleaned"] = combined.values[: len(text_analysis)].tolist()
+        councilors_spelled["cleaned"] = combined.values[len(text_analysis) :].tolist()
 
-    # removing --> ´
-    citizens = [re.sub(r"´", " ", text) for text in citizens]
+        return text_analysis, councilors_spelled
 
-    # Substituting λαθρο variations with λαθρο
-    citizens = [
-        re.sub(
-            r"(^λαθρ[α-ω]{,8}\s?)|(\s?λαθρ[α-ω]{,8}$)|(\s?λαθρ[α-ω]{,8}\s?)",
-            " λαθρο ",
-            text,
-        )
-        for text in citizens
-    ]
+    for population, dataframe in (
+        ("citizens", text_analysis),
+        ("councilors", councilors_spelled),
+    ):
+        rules = rules_for(ruleset, population)
 
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
+        if backend == "vocabulary":
+            dataframe["cleaned"] = rewrite_texts_by_vocabulary(
+                dataframe.cleaned.values.tolist(), rules
+            )
+            continue
 
-    # Substituting χωραει variations with _χωρανε
-    citizens = [
-        re.sub(
-            r"(\s?χωραει$)|(^χωραει\s?)|(\s?χωραει\s?)|(^χωρανε\s?)|(\s?χωρανε$)|(\s?χωρανε\s?)|(^χωρο\s?)|(\s?χωρο$)|(\s?χωρο\s?)|(^χωροι\s?)|(\s?χωροι$)|(\s?χωροι\s?)|(^χωρος\s?)|(\s?χωρος$)|(\s?χωρος\s?)|(^χωρου\s?)|(\s?χωρου$)|(\s?χωρου\s?)|(^χωρους\s?)|(\s?χωρους$)|(\s?χωρους\s?)",
-            " _χωρανε ",
-            text,
-        )
-        for text in citizens
-    ]
+        for rule in rules:
+            dataframe["cleaned"] = dataframe.cleaned.apply(
+                lambda x: substitute(rule, x)
+            )
 
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
+    return text_analysis, councilors_spelled
 
-    # Substituting χρημ variations with χρηματα
-    citizens = [
-        re.sub(
-            r"(χρημ[α-ω]{,8}$)|(^χρημ[α-ω]{,8}\s?)|(\s?χρημ[α-ω]{,8}\s?)",
-            " χρηματα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting ανθρωπια variations with _ανθρωπια
-    citizens = [
-        re.sub(r"(^ανθρωπια\s?)|(\s?ανθρωπια$)|(\s?ανθρωπια\s?)", " _ανθρωπια ", text)
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting κανον variations with κανονας
-    citizens = [
-        re.sub(
-            r"(^κανον[α-ω]{,8})|(\s?κανον[α-ω]{,8}$)|(\s?κανον[α-ω]{,8}\s?)",
-            " κανονας ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting χωρα variations χωρα
-    citizens = [
-        re.sub(
-            r"(^χωρα\s)|(\sχωρα$)|(\sχωρα\s)|(^χωρες\s)|(\sχωρες$)|(\sχωρες\s)|(^χωρας\s)|(\sχωρας$)|(\sχωρας\s)|(^χωρων\s)|(\sχωρων$)|(\sχωρων\s)",
-            " χωρα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting πολυ variations with _πολυ
-    citizens = [
-        re.sub(
-            r"(^πολυ\s?)|(\s?πολυ$)|(\s?πολυ\s?)|(^πολλες\s?)|(\s?πολλες$)|(\s?πολλες\s?)|(^πολλα\s?)|(\s?πολλα$)|(\s?πολλα\s?)|(^πολλοι\s?)|(\s?πολλοι$)|(\s?πολλοι\s?)",
-            " _πολυ ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting στιγμα variations with _στιγμα
-    citizens = [
-        re.sub(
-            r"(^στιγμα[α-ω]{,8}\s?)|(\s?στιγμα[α-ω]{,8}$)|(\s?στιγμα[α-ω]{,8}\s?)",
-            " _στιγμα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # Substituting covid variations with covid
-    citizens = [
-        re.sub(
-            r"(^cοβ[α-ωa-z]{,3}\s?)|(\s?cοβ[α-ωa-z]{,3}$)|(\s?cοβ[α-ωa-z]{,3}\s?)",
-            " covid ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing ¨
-    citizens = [re.sub(r"¨", " ", text) for text in citizens]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing ΄΄
-    citizens = [re.sub(r"΄΄", " ", text) for text in citizens]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # removing «
-    citizens = [re.sub(r"«", " ", text) for text in citizens]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # removing »
-    citizens = [re.sub(r"»", " ", text) for text in citizens]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting covid variations with covid
-    citizens = [
-        re.sub(
-            r"(^αγαθ[α-ω]{,2}\s?)|(\s?αγαθ[α-ω]{,2}$)|(\s?αγαθ[α-ω]{,2}\s?)",
-            " αγαθα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγανακτηση variations with αγανακτηση
-    citizens = [
-        re.sub(
-            r"(^αγανακτ[α-ω]{,8}\s?)|(\s?αγανακτ[α-ω]{,8}$)|(\s?αγανακτ[α-ω]{,8}\s?)",
-            " αγανακτηση ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Removing cατερινγ
-    citizens = [
-        re.sub(
-            r"(^cατερινγ\s?)|(\s?cατερινγ$)|(\s?cατερινγ\s?)|(^cομ\s?)|(\s?cομ$)|(\s?cομ\s?)",
-            " ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting number% variations with %
-    citizens = [
-        re.sub(
-            r"(^[0-9]{2,3}\s?%\s?)|(\s?[0-9]{2,3}\s?%$)|(\s?[0-9]{2,3}\s?%\s?)",
-            " % ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγαπη variations with αγαπη
-    citizens = [
-        re.sub(
-            r"(^αγαπ[α-ω]{,8}\s?)|(\s?αγαπ[α-ω]{,8}$)|(\s?αγαπ[α-ω]{,8}\s?)",
-            " αγαπη ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγγλια variations with αγγλια
-    citizens = [
-        re.sub(
-            r"(^αγγλ[α-ω]{,8}\s?)|(\s?αγγλ[α-ω]{,8}$)|(\s?αγγλ[α-ω]{,8}\s?)",
-            " αγγλια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting εγκατελειπω variations with εγκατελειψαν
-    citizens = [
-        re.sub(
-            r"(^αγκατελειψαν\s?)|(\s?αγκατελειψαν$)|(\s?αγκατελειψαν\s?)",
-            " εγκατελειψαν ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγνοια variations with αγνοια
-    citizens = [
-        re.sub(
-            r"(^αγνο[α-ω]{2,8}\s?)|(\s?αγνο[α-ω]{2,8}$)|(\s?αγνο[α-ω]{2,8}\s?)",
-            " αγνοια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγνωστο variations with αγνωστο
-    citizens = [
-        re.sub(
-            r"(^αγνωστ[α-ω]{1,8}\s?)|(\s?αγνωστ[α-ω]{1,8}$)|(\s?αγνωστ[α-ω]{1,8}\s?)",
-            " αγνωστο ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγωνα variations with αγωνα
-    citizens = [
-        re.sub(r"(^αγονα\s?)|(\s?αγονα$)|(\s?αγονα\s?)", " αγωνα ", text)
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγορα variations with αγορα
-    citizens = [
-        re.sub(
-            r"(^αγορ[α-ω]{1}ς )|( αγορ[α-ω]{1}ς$)|( αγορ[α-ω]{1}ς )", " αγορα ", text
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγροτικο variations with αγροτικο
-    citizens = [
-        re.sub(
-            r"(^αγρο[α-ω]{,8}\s?)|(\s?αγρο[α-ω]{,8}$)|(\s?αγρο[α-ω]{,8}\s?)",
-            " αγροτικο ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αγωνα variations with αγωνα
-    citizens = [
-        re.sub(
-            r"(^αγωνες\s?)|(\s?αγωνες$)|(\s?αγωνες\s?)|(^αγωνιζεσαι\s?)|(\s?αγωνιζεσαι$)|(\s?αγωνιζεσαι\s?)|(^αγωνιζεται\s?)|(\s?αγωνιζεται$)|(\s?αγωνιζεται\s?)|(^αγωνιζομαστε\s?)|(\s?αγωνιζομαστε$)|(\s?αγωνιζομαστε\s?)|(^αγωνισθουν\s?)|(\s?αγωνισθουν$)|(\s?αγωνισθουν\s?)|(^αγωνιστηκε\s?)|(\s?αγωνιστηκε$)|(\s?αγωνιστηκε\s?)|(^αγωνιστουμε\s?)|(\s?αγωνιστουμε$)|(\s?αγωνιστουμε\s?)|(^αγωνιστουν\s?)|(\s?αγωνιστουν$)|(\s?αγωνιστουν\s?)|(^αγωνας\s?)|(\s?αγωνας$)|(\s?αγωνας\s?)",
-            " αγωνα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδεια variations with αδεια
-    citizens = [
-        re.sub(r"(^αδειας\s?)|(\s?αδειας$)|(\s?αδειας\s?)", " αδεια ", text)
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδελφια variations with αδελφια
-    citizens = [
-        re.sub(
-            r"(^αδελφικες\s?)|(\s?αδελφικες$)|(\s?αδελφικες\s?)|(^αδελφους\s?)|(\s?αδελφους$)|(\s?αδελφους\s?)|(^αδελφο\s?)|(\s?αδελφο$)|(\s?αδελφο\s?)|(^αδερφες\s?)|(\s?αδερφες$)|(\s?αδερφες\s?)|(^αδερφια\s?)|(\s?αδερφια$)|(\s?αδερφια\s?)",
-            " αδελφια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
 
-    # Substituting αδιαβλητα variations with αδιαβλητα
-    citizens = [
-        re.sub(
-            r"(^αδιαβλητ[α-ω]{,3}\s?)|(\s?αδιαβλητ[α-ω]{,3}$)|(\s?αδιαβλητ[α-ω]{,3}\s?)",
-            " αδιαβλητα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδιαπραγματευτο variations with αδιαπραγματευτο
-    citizens = [
-        re.sub(
-            r"(^αδιαπραγματε[α-ω]{,8}\s?)|(\s?αδιαπραγματε[α-ω]{,8}$)|(\s?αδιαπραγματε[α-ω]{,8}\s?)",
-            " αδιαπραγματευτο ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδιαφανεια variations with αδιαφανεια
-    citizens = [
-        re.sub(
-            r"(^αδιαφαν[α-ω]{,8}\s?)|(\s?αδιαφαν[α-ω]{,8}$)|(\s?αδιαφαν[α-ω]{,8}\s?)",
-            " αδιαφανεια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδιαφορια variations with αδιαφορια
-    citizens = [
-        re.sub(
-            r"(^αδιαφορ[α-ω]{,8}\s?)|(\s?αδιαφορ[α-ω]{,8}$)|(\s?αδιαφορ[α-ω]{,8}\s?)",
-            " αδιαφορια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδικο variations with αδικο
-    citizens = [
-        re.sub(
-            r"(^αδικ[α-ω]{,8}\s?)|(\s?αδικ[α-ω]{,8}\$)|(\s?αδικ[α-ω]{,8}\s?)",
-            " αδικο ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδικο variations with αδικο
-    citizens = [
-        re.sub(r"(^αδικοες\s?)|(\s?αδικοες$)|(\s?αδικοες\s?)", " αδικο ", text)
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδρανεια variations with αδρανεια
-    citizens = [
-        re.sub(
-            r"(^αδραν[α-ω]{,8}\s?)|(\s?αδραν[α-ω]{,8}$)|(\s?αδραν[α-ω]{,8}\s?)",
-            " αδρανεια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδυναμια variations with αδυναμια
-    citizens = [
-        re.sub(
-            r"(^αδυναμ[α-ω]{,8}\s?)|(\s?αδυναμ[α-ω]{,8}$)|(\s?αδυναμ[α-ω]{,8}\s?)",
-            " αδυναμια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αδυνατο variations with αδυνατο
-    citizens = [
-        re.sub(
-            r"(^αδυνατ[α-ω]{,8}\s?)|(\s?αδυνατ[α-ω]{,8}$)|(\s?αδυνατ[α-ω]{,8}\s?)",
-            " αδυνατο ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting αηδια variations with αηδια
-    citizens = [
-        re.sub(
-            r"(^αηδ[α-ω]{,8}\s?)|(\s?αηδ[α-ω]{,8}$)|(\s?αηδ[α-ω]{,8}\s?)",
-            " αηδια ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Substituting ανθρωπινα variations with ανθρωπινα
-    citizens = [
-        re.sub(
-            r"(^αθρωπιν[α-ω]{,8}\s?)|(\s?αθρωπιν[α-ω]{,8}$)|(\s?αθρωπιν[α-ω]{,8}\s?)",
-            " ανθρωπινα ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Removing ιπχον variations
-    citizens = [
-        re.sub(
-            r"(^ιπχον\s?)|(\s?ιπχον$)|(\s?ιπχον\s?)|(^ισικαου\s?)|(\s?ισικαου$)|(\s?ισικαου\s?)",
-            " ",
-            text,
-        )
-        for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # Removing υουρ variations
-    citizens = [
-        re.sub(r"(^υουρ\s?)|(\s?υουρ$)|(\s?υουρ\s?)", " ", text) for text in citizens
-    ]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # removing double spaces
-    citizens = [re.sub(r"\s+", " ", text) for text in citizens]
-
-    # removing strings of length 1
-    citizens = [text for text in citizens if len(text) > 1]
-
-    # removing duplicates
-    citizens = list(set(citizens))
-
-    # stemming the texts
-    citizens = [(text, lemma_stem(text, normalization_type)) for text in citizens]
-
-    # sorting the text
-    citizens.sort()
-
-    return citizens
-
-
-def normalize_councilors_text(
-    text_analysis: pd.DataFrame, normalization_type: str
-) -> List[str]:
+@profiled
+def normalize_text_for_topic_analysis(
+    text_analysis: pd.DataFrame,
+    councilors_spelled: pd.DataFrame,
+    stem_dict_1: Dict[str, List[str]],
+    stem_dict_2: Dict[str, List[str]],
+    backend: str = "apply",
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Cleans the input text by removing unwanted characters, normalizing certain words,
+    Normalize the text for topic analysis by applying various cleaning and normalization steps.
+    This includes removing unwanted characters, normalizing certain words, and stemming.
+
+    The substitutions are the "topic analysis" section of the normalization rules file,
+    see apply_topic_rules for the available backends.
 
     Args:
     ----
-    text_analysis (pd.DataFrame): Input DataFrame containing the text to be cleaned.
-    normalization_type (str): Normalization type to be used, either "stem" for stemming or "lemma" for lemmatization.
+    text_analysis (pd.DataFrame): Citizens text data.
+    councilors_spelled (pd.DataFrame): Councilors text data.
+    stem_dict_1 (Dict[str, List[str]]): Dictionary with stemmed words as keys and their original forms as values for citizens.
+    stem_dict_2 (Dict[str, List[str]]): Dictionary with stemmed words as keys and their original forms as values for councilors.
+    backend (str): One of "apply", "vectorized" or "vocabulary", see apply_topic_rules.
 
     Returns:
     -------
-    List[str]: List of cleaned text strings.
-
-    """
-    # Similar as for Citizens (above), but for corpus 2 (councilors)
-    councilors = text_analysis.cleaned.values.tolist()
-    councilors = [text.split() for text in councilors]
-    councilors = [text.lower() for t in councilors for text in t]
-    councilors = list(set(councilors))
-    councilors = [re.sub(r"´", " ", text) for text in councilors]
-    councilors = [
-        re.sub(
-            r"(^λαθρ[α-ω]{,8}\s?)|(\s?λαθρ[α-ω]{,8}$)|(\s?λαθρ[α-ω]{,8}\s?)",
-            " λαθρο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(\s?χωραει$)|(^χωραει\s?)|(\s?χωραει\s?)|(^χωρανε\s?)|(\s?χωρανε$)|(\s?χωρανε\s?)|(^χωρο\s?)|(\s?χωρο$)|(\s?χωρο\s?)|(^χωροι\s?)|(\s?χωροι$)|(\s?χωροι\s?)|(^χωρος\s?)|(\s?χωρος$)|(\s?χωρος\s?)|(^χωρου\s?)|(\s?χωρου$)|(\s?χωρου\s?)|(^χωρους\s?)|(\s?χωρους$)|(\s?χωρους\s?)",
-            " _χωρανε ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(χρημ[α-ω]{,8}$)|(^χρημ[α-ω]{,8}\s?)|(\s?χρημ[α-ω]{,8}\s?)",
-            " χρηματα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(r"(^ανθρωπια\s?)|(\s?ανθρωπια$)|(\s?ανθρωπια\s?)", " _ανθρωπια ", text)
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(^κανον[α-ω]{,8})|(\s?κανον[α-ω]{,8}$)|(\s?κανον[α-ω]{,8}\s?)",
-            " κανονας ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(^χωρα\s)|(\sχωρα$)|(\sχωρα\s)|(^χωρες\s)|(\sχωρες$)|(\sχωρες\s)|(^χωρας\s)|(\sχωρας$)|(\sχωρας\s)|(^χωρων\s)|(\sχωρων$)|(\sχωρων\s)",
-            " χωρα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(^πολυ\s?)|(\s?πολυ$)|(\s?πολυ\s?)|(^πολλες\s?)|(\s?πολλες$)|(\s?πολλες\s?)|(^πολλα\s?)|(\s?πολλα$)|(\s?πολλα\s?)|(^πολλοι\s?)|(\s?πολλοι$)|(\s?πολλοι\s?)",
-            " _πολυ ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(^στιγμα[α-ω]{,8}\s?)|(\s?στιγμα[α-ω]{,8}$)|(\s?στιγμα[α-ω]{,8}\s?)",
-            " _στιγμα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [
-        re.sub(
-            r"(^cοβ[α-ωa-z]{,3}\s?)|(\s?cοβ[α-ωa-z]{,3}$)|(\s?cοβ[α-ωa-z]{,3}\s?)",
-            " covid ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [re.sub(r"¨", " ", text) for text in councilors]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = [re.sub(r"΄΄", " ", text) for text in councilors]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [re.sub(r"«", " ", text) for text in councilors]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [re.sub(r"»", " ", text) for text in councilors]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγαθ[α-ω]{,2}\s?)|(\s?αγαθ[α-ω]{,2}$)|(\s?αγαθ[α-ω]{,2}\s?)",
-            " αγαθα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγανακτ[α-ω]{,8}\s?)|(\s?αγανακτ[α-ω]{,8}$)|(\s?αγανακτ[α-ω]{,8}\s?)",
-            " αγανακτηση ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^cατερινγ\s?)|(\s?cατερινγ$)|(\s?cατερινγ\s?)|(^cομ\s?)|(\s?cομ$)|(\s?cομ\s?)",
-            " ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^[0-9]{2,3}\s?%\s?)|(\s?[0-9]{2,3}\s?%$)|(\s?[0-9]{2,3}\s?%\s?)",
-            " % ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγαπ[α-ω]{,8}\s?)|(\s?αγαπ[α-ω]{,8}$)|(\s?αγαπ[α-ω]{,8}\s?)",
-            " αγαπη ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγγλ[α-ω]{,8}\s?)|(\s?αγγλ[α-ω]{,8}$)|(\s?αγγλ[α-ω]{,8}\s?)",
-            " αγγλια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγκατελειψαν\s?)|(\s?αγκατελειψαν$)|(\s?αγκατελειψαν\s?)",
-            " εγκατελειψαν ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγνο[α-ω]{2,8}\s?)|(\s?αγνο[α-ω]{2,8}$)|(\s?αγνο[α-ω]{2,8}\s?)",
-            " αγνοια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγνωστ[α-ω]{1,8}\s?)|(\s?αγνωστ[α-ω]{1,8}$)|(\s?αγνωστ[α-ω]{1,8}\s?)",
-            " αγνωστο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(r"(^αγονα\s?)|(\s?αγονα$)|(\s?αγονα\s?)", " αγωνα ", text)
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγορ[α-ω]{1}ς )|( αγορ[α-ω]{1}ς$)|( αγορ[α-ω]{1}ς )", " αγορα ", text
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγρο[α-ω]{,8}\s?)|(\s?αγρο[α-ω]{,8}$)|(\s?αγρο[α-ω]{,8}\s?)",
-            " αγροτικο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αγωνες\s?)|(\s?αγωνες$)|(\s?αγωνες\s?)|(^αγωνιζεσαι\s?)|(\s?αγωνιζεσαι$)|(\s?αγωνιζεσαι\s?)|(^αγωνιζεται\s?)|(\s?αγωνιζεται$)|(\s?αγωνιζεται\s?)|(^αγωνιζομαστε\s?)|(\s?αγωνιζομαστε$)|(\s?αγωνιζομαστε\s?)|(^αγωνισθουν\s?)|(\s?αγωνισθουν$)|(\s?αγωνισθουν\s?)|(^αγωνιστηκε\s?)|(\s?αγωνιστηκε$)|(\s?αγωνιστηκε\s?)|(^αγωνιστουμε\s?)|(\s?αγωνιστουμε$)|(\s?αγωνιστουμε\s?)|(^αγωνιστουν\s?)|(\s?αγωνιστουν$)|(\s?αγωνιστουν\s?)|(^αγωνας\s?)|(\s?αγωνας$)|(\s?αγωνας\s?)",
-            " αγωνα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(r"(^αδειας\s?)|(\s?αδειας$)|(\s?αδειας\s?)", " αδεια ", text)
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδελφικες\s?)|(\s?αδελφικες$)|(\s?αδελφικες\s?)|(^αδελφους\s?)|(\s?αδελφους$)|(\s?αδελφους\s?)|(^αδελφο\s?)|(\s?αδελφο$)|(\s?αδελφο\s?)|(^αδερφες\s?)|(\s?αδερφες$)|(\s?αδερφες\s?)|(^αδερφια\s?)|(\s?αδερφια$)|(\s?αδερφια\s?)",
-            " αδελφια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδιαβλητ[α-ω]{,3}\s?)|(\s?αδιαβλητ[α-ω]{,3}$)|(\s?αδιαβλητ[α-ω]{,3}\s?)",
-            " αδιαβλητα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδιαπραγματε[α-ω]{,8}\s?)|(\s?αδιαπραγματε[α-ω]{,8}$)|(\s?αδιαπραγματε[α-ω]{,8}\s?)",
-            " αδιαπραγματευτο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδιαφαν[α-ω]{,8}\s?)|(\s?αδιαφαν[α-ω]{,8}$)|(\s?αδιαφαν[α-ω]{,8}\s?)",
-            " αδιαφανεια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδιαφορ[α-ω]{,8}\s?)|(\s?αδιαφορ[α-ω]{,8}$)|(\s?αδιαφορ[α-ω]{,8}\s?)",
-            " αδιαφορια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδικ[α-ω]{,8}\s?)|(\s?αδικ[α-ω]{,8}\$)|(\s?αδικ[α-ω]{,8}\s?)",
-            " αδικο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(r"(^αδικοες\s?)|(\s?αδικοες$)|(\s?αδικοες\s?)", " αδικο ", text)
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδραν[α-ω]{,8}\s?)|(\s?αδραν[α-ω]{,8}$)|(\s?αδραν[α-ω]{,8}\s?)",
-            " αδρανεια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδυναμ[α-ω]{,8}\s?)|(\s?αδυναμ[α-ω]{,8}$)|(\s?αδυναμ[α-ω]{,8}\s?)",
-            " αδυναμια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αδυνατ[α-ω]{,8}\s?)|(\s?αδυνατ[α-ω]{,8}$)|(\s?αδυνατ[α-ω]{,8}\s?)",
-            " αδυνατο ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αηδ[α-ω]{,8}\s?)|(\s?αηδ[α-ω]{,8}$)|(\s?αηδ[α-ω]{,8}\s?)",
-            " αηδια ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^αθρωπιν[α-ω]{,8}\s?)|(\s?αθρωπιν[α-ω]{,8}$)|(\s?αθρωπιν[α-ω]{,8}\s?)",
-            " ανθρωπινα ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(
-            r"(^ιπχον\s?)|(\s?ιπχον$)|(\s?ιπχον\s?)|(^ισικαου\s?)|(\s?ισικαου$)|(\s?ισικαου\s?)",
-            " ",
-            text,
-        )
-        for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [
-        re.sub(r"(^υουρ\s?)|(\s?υουρ$)|(\s?υουρ\s?)", " ", text) for text in councilors
-    ]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [re.sub(r"\s+", " ", text) for text in councilors]
-    councilors = [text for text in councilors if len(text) > 1]
-    councilors = list(set(councilors))
-    councilors = [(text, lemma_stem(text, normalization_type)) for text in councilors]
-    councilors.sort()
-
-    return councilors
-
-
-def unify_citizens_councilors_texts(
-    citizens_df: pd.DataFrame, councilors_df: pd.DataFrame
-) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
-    """
-    Unify the citizens and councilors texts into dictionaries with stemmed words as keys and their original forms as values.
-
-    Args:
-    ----
-    citizens_df (pd.DataFrame): DataFrame containing citizens text data.
-    councilors_df (pd.DataFrame): DataFrame containing councilors text data.
-
-    Returns:
-    -------
-    Tuple[Dict[str, List[str]], Dict[str, List[str]]]: Dictionaries with stemmed words as keys and their original forms as values for citizens and councilors.
-
-    """
-    # Create citizens and councilors lists
-    citizens = normalize_citizens_text(
-        text_analysis=citizens_df, normalization_type=normalization_type
-    )
-    councilors = normalize_councilors_text(
-        text_analysis=councilors_df, normalization_type=normalization_type
-    )
-
-    # Creating a list with the stemmed words
-    distinct_keys_1 = list(set([text[1] for text in citizens]))
-    stem_dict_1 = {}
-
-    # Iterating both on the stemmed words and the corpuses in order to substitute each word with its stem
-    for i in range(len(distinct_keys_1)):
-        c = []
-        for j in range(len(citizens)):
-            if citizens[j][1] == distinct_keys_1[i]:
-                c.append(citizens[j][0])
-
-        stem_dict_1[f"{distinct_keys_1[i]}"] = c
-        c = []
-
-    # The same as above
-    distinct_keys_2 = list(set([text[1] for text in councilors]))
-    stem_dict_2 = {}
-
-    for i in range(len(distinct_keys_2)):
-        c = []
-        for j in range(len(councilors)):
-            if councilors[j][1] == distinct_keys_2[i]:
-                c.append(councilors[j][0])
-
-        stem_dict_2[f"{distinct_keys_2[i]}"] = c
-
-        c = []
-
-    return stem_dict_1, stem_dict_2
-
-
-def normalize_text_for_topic_analysis(
-    text_analysis: pd.DataFrame,
-    councilors_spelled: pd.DataFrame,
-    stem_dict_1: Dict[str, List[str]],
-    stem_dict_2: Dict[str, List[str]],
-) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """
-    Normalize the text for topic analysis by applying various cleaning and normalization steps.
-    This includes removing unwanted characters, normalizing certain words, and stemming.
-
-    Args:
-    ----
-    text_analysis (pd.DataFrame): Citizens text data.
-    councilors_spelled (pd.DataFrame): Councilors text data.
-    stem_dict_1 (Dict[str, List[str]]): Dictionary with stemmed words as keys and their original forms as values for citizens.
-    stem_dict_2 (Dict[str, List[str]]): Dictionary with stemmed words as keys and their original forms as values for councilors.
-
-    Returns:
-    -------
-    Tuple[pd.DataFrame, pd.DataFrame]: Normalized DataFrames for citizens and councilors for topic analysis.
+    Tuple[pd.DataFrame, pd.DataFrame]: Normalized DataFrames for citizens and councilors for topic analysis.
 
     """
     # Applying the cleaning function to the responses
@@ -2252,1270 +1166,4 @@ def normalize_text_for_topic_analysis(
         lambda x: cleaner(x, stem_dict_2)
     )
 
-    # Substituting χωρανε variations with χωρανε
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^_χωρανε\s?)|(\s?_χωρανε$)|(\s?_χωρανε\s?)", " χωρανε ", x)
-    )
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^_χωρανε\s?)|(\s?_χωρανε$)|(\s?_χωρανε\s?)", " χωρανε ", x)
-    )
-
-    # Substituting ποσοστα variations with %
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^ποσοστα\s)|(\sποσοστα$)|(\sποσοστα\s)", " % ", x)
-    )
-
-    # Substituting ποσοστα variations with %
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^ποσοστο\s)|(\sποσοστο$)|(\sποσοστο\s)", " % ", x)
-    )
-
-    # Substituting στιγμα variations with στιγμα
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^_στιγμα\s)|(\s_στιγμα$)|(\s_στιγμα\s)", " στιγμα ", x)
-    )
-
-    # Substituting στιγμα variations with στιγμα
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^_στιγμα\s)|(\s_στιγμα$)|(\s_στιγμα\s)", " στιγμα ", x)
-    )
-
-    # Substituting τοπικα variations with τοπικη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^τοπικα\s)|(\sτοπικα$)|(\sτοπικα\s)", " τοπικη ", x)
-    )
-
-    # Substituting double spaces variations with space
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting double spaces variations with space
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting μεταναστε variations with μεταναστε
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^μεταναστες)|(μεταναστες$)|(μεταναστες)", "μεταναστε", x)
-    )
-
-    # Substituting μεταναστες variations with μεταναστες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^μεταναστε)|(μεταναστε$)|(μεταναστε)", "μεταναστες", x)
-    )
-
-    # Substituting μεταναστες variations with μεταναστες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^μεταναστες)|(μεταναστες$)|(μεταναστες)", "μεταναστε", x)
-    )
-
-    # Substituting μεταναστες variations with μεταναστες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^μεταναστε)|(μεταναστε$)|(μεταναστε)", "μεταναστες", x)
-    )
-
-    # Substituting δημος variations with δημ
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^δημος)|(δημος$)|(δημος)", "δημ", x)
-    )
-
-    # Substituting δημ variations with δημος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^δημ)|(δημ$)|(δημ)", "δημος", x)
-    )
-
-    # Substituting δημ variations with δημος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^δημος)|(δημος$)|(δημος)", "δημ", x)
-    )
-
-    # Substituting δημ variations with δημος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^δημ)|(δημ$)|(δημ)", "δημος", x)
-    )
-
-    # Substituting προσφυγας variations with προσφυγα
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^προσφυγας)|(προσφυγας$)|(προσφυγας)", "προσφυγα", x)
-    )
-
-    # Substituting προσφυγα variations with προσφυγας
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^προσφυγα)|(προσφυγα$)|(προσφυγα)", "προσφυγας", x)
-    )
-
-    # Substituting προσφυγα variations with προσφυγας
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^προσφυγας)|(προσφυγας$)|(προσφυγας)", "προσφυγα", x)
-    )
-
-    # Substituting προσφυγα variations with προσφυγας
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^προσφυγα)|(προσφυγα$)|(προσφυγα)", "προσφυγας", x)
-    )
-
-    # Substituting λαθρο variations with λαθρο
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^λαθρ[α-ω]{1,8}\s?)|(\s?λαθρ[α-ω]{1,8}$)|(\s?λαθρ[α-ω]{1,8}\s?)",
-            " λαθρο ",
-            x,
-        )
-    )
-
-    # Substituting λαθρο variations with λαθρο
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^λαθρ[α-ω]{1,8}\s?)|(\s?λαθρ[α-ω]{1,8}$)|(\s?λαθρ[α-ω]{1,8}\s?)",
-            " λαθρο ",
-            x,
-        )
-    )
-
-    # Substituting μεταναστες variations with μεταναστες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μεταναστ[α-ω]{1,8}\s?)|(\s?μεταναστ[α-ω]{1,8}$)|(\s?μεταναστ[α-ω]{1,8}\s?)",
-            " μεταναστες ",
-            x,
-        )
-    )
-
-    # Substituting μεταναστες variations with μεταναστες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μεταναστ[α-ω]{1,8}\s?)|(\s?μεταναστ[α-ω]{1,8}$)|(\s?μεταναστ[α-ω]{1,8}\s?)",
-            " μεταναστες ",
-            x,
-        )
-    )
-
-    # Substituting προσφυγας variations with προσφυγας
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προσφυγ[α-ω]{1,8}\s?)|(\s?προσφυγ[α-ω]{1,8}$)|(\s?προσφυγ[α-ω]{1,8}\s?)",
-            " προσφυγας ",
-            x,
-        )
-    )
-
-    # Substituting προσφυγας variations with προσφυγας
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προσφυγ[α-ω]{1,8}\s?)|(\s?προσφυγ[α-ω]{1,8}$)|(\s?προσφυγ[α-ω]{1,8}\s?)",
-            " προσφυγας ",
-            x,
-        )
-    )
-
-    # Substituting δημος variations with δημος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δημο[α-ω]{1,9}\s?)|(\s?δημο[α-ω]{1,9}$)|(\s?δημο[α-ω]{1,9}\s?)",
-            " δημος ",
-            x,
-        )
-    )
-
-    # Substituting δημος variations with δημος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δημο[α-ω]{1,9}\s?)|(\s?δημο[α-ω]{1,9}$)|(\s?δημο[α-ω]{1,9}\s?)",
-            " δημος ",
-            x,
-        )
-    )
-
-    # Substituting οικονομικοι variations with οικονομικοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οικονομ[α-ω]{,8}\s?)|(\s?οικονομ[α-ω]{,8}$)|(\s?οικονομ[α-ω]{,8}\s?)",
-            " οικονομικοι ",
-            x,
-        )
-    )
-
-    # Substituting οικονομικοι variations with οικονομικοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οικονομ[α-ω]{,8}\s?)|(\s?οικονομ[α-ω]{,8}$)|(\s?οικονομ[α-ω]{,8}\s?)",
-            " οικονομικοι ",
-            x,
-        )
-    )
-
-    # Substituting κλειστες variations with κλειστες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^κλειστ[α-ω]{,8}\s?)|(\s?κλειστ[α-ω]{,8}$)|(\s?κλειστ[α-ω]{,8}\s?)",
-            " κλειστες ",
-            x,
-        )
-    )
-
-    # Substituting κλειστες variations with κλειστες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^κλειστ[α-ω]{,8}\s?)|(\s?κλειστ[α-ω]{,8}$)|(\s?κλειστ[α-ω]{,8}\s?)",
-            " κλειστες ",
-            x,
-        )
-    )
-
-    # Removing double spaces
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Removing double spaces
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting εκπαιδευση variations with εκπαιδευση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^εκπαιδ[α-ω]{,8}\s?)|(\sεκπαιδ[α-ω]{,8}$)|(\sεκπαιδ[α-ω]{,8}\s?)",
-            " εκπαιδευση ",
-            x,
-        )
-    )
-
-    # Substituting εκπαιδευση variations with εκπαιδευση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^εκπαιδ[α-ω]{,8}\s?)|(\s?εκπαιδ[α-ω]{,8}$)|(\s?εκπαιδ[α-ω]{,8}\s?)",
-            " εκπαιδευση ",
-            x,
-        )
-    )
-
-    # Substituting μεγαλωνουν variations with μεγαλωνουν
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μεγαλω[α-ω]{,8}\s)|(\sμεγαλω[α-ω]{,8}$)|(\sμεγαλω[α-ω]{,8}\s)",
-            " μεγαλωνουν ",
-            x,
-        )
-    )
-
-    # Substituting μεγαλωνουν variations with μεγαλωνουν
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μεγαλω[α-ω]{,8}\s)|(\sμεγαλω[α-ω]{,8}$)|(\sμεγαλω[α-ω]{,8}\s)",
-            " μεγαλωνουν ",
-            x,
-        )
-    )
-
-    # Substituting ενσωματωση variations with ενσωματωση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ενσωματωσ[α-ω]{,8}\s)|(\sενσωματωσ[α-ω]{,8}$)|(\sενσωματωσ[α-ω]{,8}\s)",
-            " ενσωματωση ",
-            x,
-        )
-    )
-
-    # Substituting ενσωματωση variations with ενσωματωση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ενσωματωσ[α-ω]{,8}\s)|(\sενσωματωσ[α-ω]{,8}$)|(\sενσωματωσ[α-ω]{,8}\s)",
-            " ενσωματωση ",
-            x,
-        )
-    )
-
-    # Substituting ασυλο variations with ασυλο
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ασυλ[α-ω]{,8}\s)|(\sασυλ[α-ω]{,8}$)|(\sασυλ[α-ω]{,8}\s)", " ασυλο ", x
-        )
-    )
-
-    # Substituting ασυλο variations with ασυλο
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ασυλ[α-ω]{,8}\s)|(\sασυλ[α-ω]{,8}$)|(\sασυλ[α-ω]{,8}\s)", " ασυλο ", x
-        )
-    )
-
-    # Substituting διαβιωση variations with διαβιωση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^διαβιω[α-ω]{,8}\s)|(\sδιαβιω[α-ω]{,8}$)|(\sδιαβιω[α-ω]{,8}\s)",
-            " διαβιωση ",
-            x,
-        )
-    )
-
-    # Substituting διαβιωση variations with διαβιωση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^διαβιω[α-ω]{,8}\s)|(\sδιαβιω[α-ω]{,8}$)|(\sδιαβιω[α-ω]{,8}\s)",
-            " διαβιωση ",
-            x,
-        )
-    )
-
-    # Substituting κατοικια variations with κατοικια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^κατοικ[α-ω]{,8}\s)|(\sκατοικ[α-ω]{,8}$)|(\sκατοικ[α-ω]{,8}\s)",
-            " κατοικια ",
-            x,
-        )
-    )
-
-    # Substituting κατοικια variations with κατοικια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^κατοικ[α-ω]{,8}\s)|(\sκατοικ[α-ω]{,8}$)|(\sκατοικ[α-ω]{,8}\s)",
-            " κατοικια ",
-            x,
-        )
-    )
-
-    # Substituting οικογενεια variations with οικογενεια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οικογεν[α-ω]{,8}\s)|(\sοικογεν[α-ω]{,8}$)|(\sοικογεν[α-ω]{,8}\s)",
-            " οικογενεια ",
-            x,
-        )
-    )
-
-    # Substituting οικογενεια variations with οικογενεια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οικογεν[α-ω]{,8}\s)|(\sοικογεν[α-ω]{,8}$)|(\sοικογεν[α-ω]{,8}\s)",
-            " οικογενεια ",
-            x,
-        )
-    )
-
-    # Substituting αντισταθμιστικα variations with αντισταθμιστικα
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αντισταθμιστηκα[α-ω]{,8}\s)|(\sαντισταθμιστηκα[α-ω]{,8}$)|(\sαντισταθμιστηκα[α-ω]{,8}\s)",
-            " αντισταθμιστικα ",
-            x,
-        )
-    )
-
-    # Substituting ενταξη variations with ενταξη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ενταχ[α-ω]{,8}\s)|(\sενταχ[α-ω]{,8}$)|(\sενταχ[α-ω]{,8}\s)",
-            " ενταξη ",
-            x,
-        )
-    )
-
-    # Substituting ενταξη variations with ενταξη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ενταχ[α-ω]{,8}\s)|(\sενταχ[α-ω]{,8}$)|(\sενταχ[α-ω]{,8}\s)",
-            " ενταξη ",
-            x,
-        )
-    )
-
-    # Substituting πολιτισμος variations with πολιτισμος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πολιτισμ[α-ω]{,8}\s)|(\sπολιτισμ[α-ω]{,8}$)|(\sπολιτισμ[α-ω]{,8}\s)",
-            " πολιτισμος ",
-            x,
-        )
-    )
-
-    # Substituting πολιτισμος variations with πολιτισμος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πολιτισμ[α-ω]{,8}\s)|(\sπολιτισμ[α-ω]{,8}$)|(\sπολιτισμ[α-ω]{,8}\s)",
-            " πολιτισμος ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελασ[α-ω]{,8}\s)|(\sαπελασ[α-ω]{,8}$)|(\sαπελασ[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελασ[α-ω]{,8}\s)|(\sαπελασ[α-ω]{,8}$)|(\sαπελασ[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting πολεμος variations with πολεμος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πολεμ[α-ω]{,8}\s)|(\sπολεμ[α-ω]{,8}$)|(\sπολεμ[α-ω]{,8}\s)",
-            " πολεμος ",
-            x,
-        )
-    )
-
-    # Substituting πολεμος variations with πολεμος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πολεμ[α-ω]{,8}\s)|(\sπολεμ[α-ω]{,8}$)|(\sπολεμ[α-ω]{,8}\s)",
-            " πολεμος ",
-            x,
-        )
-    )
-
-    # Substituting πραγματικος variations with πραγματικος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πραγματι[α-ω]{,8}\s)|(\sπραγματι[α-ω]{,8}$)|(\sπραγματι[α-ω]{,8}\s)",
-            " πραγματικος ",
-            x,
-        )
-    )
-
-    # Substituting πραγματικος variations with πραγματικος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^πραγματι[α-ω]{,8}\s)|(\sπραγματι[α-ω]{,8}$)|(\sπραγματι[α-ω]{,8}\s)",
-            " πραγματικος ",
-            x,
-        )
-    )
-
-    # Substituting σεβονται variations with σεβονται
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σεβεσ[α-ω]{,8}\s)|(\sσεβεσ[α-ω]{,8}$)|(\sσεβεσ[α-ω]{,8}\s)",
-            " σεβονται ",
-            x,
-        )
-    )
-
-    # Substituting σεβονται variations with σεβονται
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σεβεσ[α-ω]{,8}\s)|(\sσεβεσ[α-ω]{,8}$)|(\sσεβεσ[α-ω]{,8}\s)",
-            " σεβονται ",
-            x,
-        )
-    )
-
-    # Substituting μουσουλμανοι variations with μουσουλμανοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μουσουλμ[α-ω]{,8}\s)(\sμουσουλμ[α-ω]{,8}$)(\sμουσουλμ[α-ω]{,8}\s)",
-            " μουσουλμανοι ",
-            x,
-        )
-    )
-
-    # Substituting μουσουλμανοι variations with μουσουλμανοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μουσουλμ[α-ω]{,8}\s)|(\sμουσουλμ[α-ω]{,8}$)|(\sμουσουλμ[α-ω]{,8}\s)",
-            " μουσουλμανοι ",
-            x,
-        )
-    )
-
-    # Substituting περιθαλψη variations with περιθαλψη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^περιθαλψ[α-ω]{,8}\s)|(\sπεριθαλψ[α-ω]{,8}$)|(\sπεριθαλψ[α-ω]{,8}\s)",
-            " περιθαλψη ",
-            x,
-        )
-    )
-
-    # Substituting περιθαλψη variations with περιθαλψη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^περιθαλψ[α-ω]{,8}\s)|(\sπεριθαλψ[α-ω]{,8}$)|(\sπεριθαλψ[α-ω]{,8}\s)",
-            " περιθαλψη ",
-            x,
-        )
-    )
-
-    # Substituting ολοι variations with ολοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ολ[α-ω]{,2}\s)|(\sολ[α-ω]{,2}$)|(\sολ[α-ω]{,2}\s)", " ολοι ", x
-        )
-    )
-
-    # Substituting ολοι variations with ολοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ολ[α-ω]{,2}\s)|(\sολ[α-ω]{,2}$)|(\sολ[α-ω]{,2}\s)", " ολοι ", x
-        )
-    )
-
-    # Substituting ανθρωπινες variations with ανθρωπινες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανθρωπιν[α-ω]{,8}\s)|(\sανθρωπιν[α-ω]{,8}$)|(\sανθρωπιν[α-ω]{,8}\s)",
-            " ανθρωπινες ",
-            x,
-        )
-    )
-
-    # Substituting ανθρωπινες variations with ανθρωπινες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανθρωπιν[α-ω]{,8}\s)|(\sανθρωπιν[α-ω]{,8}$)|(\sανθρωπιν[α-ω]{,8}\s)",
-            " ανθρωπινες ",
-            x,
-        )
-    )
-
-    # Substituting κρατος variations with κρατος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^κρατη\s)|(\sκρατη$)|(\sκρατη\s)", " κρατος ", x)
-    )
-
-    # Substituting κρατος variations with κρατος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^κρατη\s)|(\sκρατη$)|(\sκρατη\s)", " κρατος ", x)
-    )
-
-    # Substituting σχεδια variations with σχεδια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σχεδι[α-ω]{,8}\s)|(\sσχεδι[α-ω]{,8}$)|(\sσχεδι[α-ω]{,8}\s)",
-            " σχεδια ",
-            x,
-        )
-    )
-
-    # Substituting σχεδια variations with σχεδια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σχεδι[α-ω]{,8}\s)|(\sσχεδι[α-ω]{,8}$)|(\sσχεδι[α-ω]{,8}\s)",
-            " σχεδια ",
-            x,
-        )
-    )
-
-    # Substituting προελευση variations with προελευση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προελευσ[α-ω]{,8}\s)|(\sπροελευσ[α-ω]{,8}$)|(\sπροελευσ[α-ω]{,8}\s)",
-            " προελευση ",
-            x,
-        )
-    )
-
-    # Substituting προελευση variations with προελευση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προελευσ[α-ω]{,8}\s)|(\sπροελευσ[α-ω]{,8}$)|(\sπροελευσ[α-ω]{,8}\s)",
-            " προελευση ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελα[α-ω]{,8}\s)|(\sαπελα[α-ω]{,8}$)|(\sαπελα[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελα[α-ω]{,8}\s)|(\sαπελα[α-ω]{,8}$)|(\sαπελα[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting εθνικος variations with εθνικος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^εθνη\s)|(\sεθνη$)|(\sεθνη\s)", " εθνικος ", x)
-    )
-
-    # Substituting εθνικος variations with εθνικος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^εθνη\s)|(\sεθνη$)|(\sεθνη\s)", " εθνικος ", x)
-    )
-
-    # Substituting εμπολεμη variations with εμπολεμη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^εμπολεμ[α-ω]{,8}\s)|(\sεμπολεμ[α-ω]{,8}$)|(\sεμπολεμ[α-ω]{,8}\s)",
-            " εμπολεμη ",
-            x,
-        )
-    )
-
-    # Substituting εμπολεμη variations with εμπολεμη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^εμπολεμ[α-ω]{,8}\s)|(\sεμπολεμ[α-ω]{,8}$)|(\sεμπολεμ[α-ω]{,8}\s)",
-            " εμπολεμη ",
-            x,
-        )
-    )
-
-    # Substituting ελληνας variations with ελληνας
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ελλην[α-ω]{,8}\s)|(\sελλην[α-ω]{,8}$)|(\sελλην[α-ω]{,8}\s)",
-            " ελληνας ",
-            x,
-        )
-    )
-
-    # Substituting ελληνας variations with ελληνας
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ελλην[α-ω]{,8}\s)|(\sελλην[α-ω]{,8}$)|(\sελλην[α-ω]{,8}\s)",
-            " ελληνας ",
-            x,
-        )
-    )
-
-    # Substituting ανθρωπινες variations with ανθρωπινες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανθρωπιν[α-ω]{,8}\s)|(\sανθρωπιν[α-ω]{,8}$)|(\sανθρωπιν[α-ω]{,8}\s)",
-            " ανθρωπινες ",
-            x,
-        )
-    )
-
-    # Substituting ανθρωπινες variations with ανθρωπινες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανθρωπιν[α-ω]{,8}\s)|(\sανθρωπιν[α-ω]{,8}$)|(\sανθρωπιν[α-ω]{,8}\s)",
-            " ανθρωπινες ",
-            x,
-        )
-    )
-
-    # Removing double spaces
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Removing double spaces
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting χριστιανοι variations with χριστιανοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^χριστιαν[α-ω]{,8}\s)|(\sχριστιαν[α-ω]{,8}$)|(\sχριστιαν[α-ω]{,8}\s)",
-            " χριστιανοι ",
-            x,
-        )
-    )
-
-    # Substituting χριστιανοι variations with χριστιανοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^χριστιαν[α-ω]{,8}\s)|(\sχριστιαν[α-ω]{,8}$)|(\sχριστιαν[α-ω]{,8}\s)",
-            " χριστιανοι ",
-            x,
-        )
-    )
-
-    # Substituting νομος variations with νομος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^νομικ[α-ω]{,8}\s)|(\sνομικ[α-ω]{,8}$)|(\sνομικ[α-ω]{,8}\s)",
-            " νομος ",
-            x,
-        )
-    )
-
-    # Substituting νομος variations with νομος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^νομικ[α-ω]{,8}\s)|(\sνομικ[α-ω]{,8}$)|(\sνομικ[α-ω]{,8}\s)",
-            " νομος ",
-            x,
-        )
-    )
-
-    # Substituting αφγανισταν variations with αφγανισταν
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αφγαν[α-ω]{,8}\s)|(\sαφγαν[α-ω]{,8}$)|(\sαφγαν[α-ω]{,8}\s)",
-            " αφγανισταν ",
-            x,
-        )
-    )
-
-    # Substituting αφγανισταν variations with αφγανισταν
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αφγαν[α-ω]{,8}\s)|(\sαφγαν[α-ω]{,8}$)|(\sαφγαν[α-ω]{,8}\s)",
-            " αφγανισταν ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελα[α-ω]{,8}\s)|(\sαπελα[α-ω]{,8}$)|(\sαπελα[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting απελαση variations with απελαση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^απελα[α-ω]{,8}\s)|(\sαπελα[α-ω]{,8}$)|(\sαπελα[α-ω]{,8}\s)",
-            " απελαση ",
-            x,
-        )
-    )
-
-    # Substituting ανοικτη variations with ανοικτη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανοιχτα[α-ω]{,8}\s)|(\sανοιχτα[α-ω]{,8}$)|(\sανοιχτα[α-ω]{,8}\s)",
-            " ανοικτη ",
-            x,
-        )
-    )
-
-    # Substituting ανοικτη variations with ανοικτη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανοιχτα[α-ω]{,8}\s)|(\sανοιχτα[α-ω]{,8}$)|(\sανοιχτα[α-ω]{,8}\s)",
-            " ανοικτη ",
-            x,
-        )
-    )
-
-    # Removing double spaces
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Removing double spaces
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting ποινικο variations with ποινικο
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^ποινες\s)|(\sποινες$)|(\sποινες\s)", " ποινικο ", x)
-    )
-
-    # Substituting ποινικο variations with ποινικο
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^ποινες\s)|(\sποινες$)|(\sποινες\s)", " ποινικο ", x)
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^χαρτι\s)|(\sχαρτι$)|(\sχαρτι\s)", " χαρτια ", x)
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^χαρτι\s)|(\sχαρτι$)|(\sχαρτι\s)", " χαρτια ", x)
-    )
-
-    # Substituting ελληνικη variations with ελληνικη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ελλην[α-ω]{,8}\s)|(\sελλην[α-ω]{,8}$)|(\sελλην[α-ω]{,8}\s)",
-            " ελληνικη ",
-            x,
-        )
-    )
-
-    # Substituting ελληνικη variations with ελληνικη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ελλην[α-ω]{,8}\s)|(\sελλην[α-ω]{,8}$)|(\sελλην[α-ω]{,8}\s)",
-            " ελληνικη ",
-            x,
-        )
-    )
-
-    # Substituting οφελη variations with οφελη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οφελ[α-ω]{,8}\s)|(\sοφελ[α-ω]{,8}$)|(\sοφελ[α-ω]{,8}\s)", " οφελη ", x
-        )
-    )
-
-    # Substituting οφελη variations with οφελη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^οφελ[α-ω]{,8}\s)|(\sοφελ[α-ω]{,8}$)|(\sοφελ[α-ω]{,8}\s)", " οφελη ", x
-        )
-    )
-
-    # Substituting ανθρωπια variations with ανθρωπια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^_ανθρωπια\s)|(\s_ανθρωπια$)|(\s_ανθρωπια\s)", " ανθρωπια ", x
-        )
-    )
-
-    # Substituting ανθρωπια variations with ανθρωπια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^_ανθρωπια\s)|(\s_ανθρωπια$)|(\s_ανθρωπια\s)", " ανθρωπια ", x
-        )
-    )
-
-    # Removing double spaces
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Removing double spaces
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Substituting ηθα variations with ηθα
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^ηθη\s)|(\sηθη$)|(\sηθη\s)", " ηθα ", x)
-    )
-
-    # Substituting ηθα variations with ηθα
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^ηθη\s)|(\sηθη$)|(\sηθη\s)", " ηθα ", x)
-    )
-
-    # Substituting ηθη variations with ηθη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^ηθα\s)|(\sηθα$)|(\sηθα\s)", " ηθη ", x)
-    )
-
-    # Substituting ηθη variations with ηθη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^ηθα\s)|(\sηθα$)|(\sηθα\s)", " ηθη ", x)
-    )
-
-    # Substituting δομες variations with δομες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^δομη\s)|(\sδομη$)|(\sδομη\s)", " δομες ", x)
-    )
-
-    # Substituting δομες variations with δομες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^δομη\s)|(\sδομη$)|(\sδομη\s)", " δομες ", x)
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^χαρτη\s)|(\sχαρτη$)|(\sχαρτη\s)", " χαρτια ", x)
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^χαρτη\s)|(\sχαρτη$)|(\sχαρτη\s)", " χαρτια ", x)
-    )
-
-    # Substituting πληρουν variations with πληρουν
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^πληρει\s)|(\sπληρει$)|(\sπληρει\s)", " πληρουν ", x)
-    )
-
-    # Substituting πληρουν variations with πληρουν
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^πληρει\s)|(\sπληρει$)|(\sπληρει\s)", " πληρουν ", x)
-    )
-
-    # Substituting προυποθεσεις variations with προυποθεσεις
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προυποθ[α-ω]{,8}\s)|(\sπρουποθ[α-ω]{,8}$)|(\sπρουποθ[α-ω]{,8}\s)",
-            " προυποθεσεις ",
-            x,
-        )
-    )
-
-    # Substituting προυποθεσεις variations with προυποθεσεις
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προυποθ[α-ω]{,8}\s)|(\sπρουποθ[α-ω]{,8}$)|(\sπρουποθ[α-ω]{,8}\s)",
-            " προυποθεσεις ",
-            x,
-        )
-    )
-
-    # Substituting μουσουλμανοι variations with μουσουλμανοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μουσουλμ[α-ω]{,8}\s)|(\sμουσουλμ[α-ω]{,8}$)|(\sμουσουλμ[α-ω]{,8}\s)",
-            " μουσουλμανοι ",
-            x,
-        )
-    )
-
-    # Substituting μουσουλμανοι variations with μουσουλμανοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μουσουλμ[α-ω]{,8}\s)|(\sμουσουλμ[α-ω]{,8}$)|(\sμουσουλμ[α-ω]{,8}\s)",
-            " μουσουλμανοι ",
-            x,
-        )
-    )
-
-    # Substituting αξιοπρεπεια variations with αξιοπρεπεια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αξιοπρεπ[α-ω]{,8}\s)|(\sαξιοπρεπ[α-ω]{,8}$)|(\sαξιοπρεπ[α-ω]{,8}\s)",
-            " αξιοπρεπεια ",
-            x,
-        )
-    )
-
-    # Substituting αξιοπρεπεια variations with αξιοπρεπεια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αξιοπρεπ[α-ω]{,8}\s)|(\sαξιοπρεπ[α-ω]{,8}$)|(\sαξιοπρεπ[α-ω]{,8}\s)",
-            " αξιοπρεπεια ",
-            x,
-        )
-    )
-
-    # Substituting καταλληλες variations with καταλληλες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^καταλληλ[α-ω]{,8}\s)|(\sκαταλληλ[α-ω]{,8}$)|(\sκαταλληλ[α-ω]{,8}\s)",
-            " καταλληλες ",
-            x,
-        )
-    )
-
-    # Substituting καταλληλες variations with καταλληλες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^καταλληλ[α-ω]{,8}\s)|(\sκαταλληλ[α-ω]{,8}$)|(\sκαταλληλ[α-ω]{,8}\s)",
-            " καταλληλες ",
-            x,
-        )
-    )
-
-    # Substituting φτωχεια variations with φτωχεια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^φτωχ[α-ω]{,8}\s)|(\sφτωχ[α-ω]{,8}$)|(\sφτωχ[α-ω]{,8}\s)", " φτωχεια ", x
-        )
-    )
-
-    # Substituting φτωχεια variations with φτωχεια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^φτωχ[α-ω]{,8}\s)|(\sφτωχ[α-ω]{,8}$)|(\sφτωχ[α-ω]{,8}\s)", " φτωχεια ", x
-        )
-    )
-
-    # Substituting προυπολογισμος variations with προυπολογισμος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προυπολογισμ[α-ω]{,8}\s)|(\sπρουπολογισμ[α-ω]{,8}$)|(\sπρουπολογισμ[α-ω]{,8}\s)",
-            " προυπολογισμος ",
-            x,
-        )
-    )
-
-    # Substituting προυπολογισμος variations with προυπολογισμος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^προυπολογισμ[α-ω]{,8}\s)|(\sπρουπολογισμ[α-ω]{,8}$)|(\sπρουπολογισμ[α-ω]{,8}\s)",
-            " προυπολογισμος ",
-            x,
-        )
-    )
-
-    # Substituting σεβασμος variations with σεβασμος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σεβασμ[α-ω]{,8}\s)|(\sσεβασμ[α-ω]{,8}$)|(\sσεβασμ[α-ω]{,8}\s)",
-            " σεβασμος ",
-            x,
-        )
-    )
-
-    # Substituting σεβασμος variations with σεβασμος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^σεβασμ[α-ω]{,8}\s)|(\sσεβασμ[α-ω]{,8}$)|(\sσεβασμ[α-ω]{,8}\s)",
-            " σεβασμος ",
-            x,
-        )
-    )
-
-    # Substituting υγειονομικη variations with υγειονομικη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^υγειονομ[α-ω]{,8}\s)|(\sυγειονομ[α-ω]{,8}$)|(\sυγειονομ[α-ω]{,8}\s)",
-            " υγειονομικη ",
-            x,
-        )
-    )
-
-    # Substituting υγειονομικη variations with υγειονομικη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^υγειονομ[α-ω]{,8}\s)|(\sυγειονομ[α-ω]{,8}$)|(\sυγειονομ[α-ω]{,8}\s)",
-            " υγειονομικη ",
-            x,
-        )
-    )
-
-    # Substituting παιδια variations with παιδια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^παιδ[ι|ακ][α-ω]{,8}\s)|(\sπαιδ[ι|ακ][α-ω]{,8}$)|(\sπαιδ[ι|ακ][α-ω]{,8}\s)",
-            " παιδια ",
-            x,
-        )
-    )
-
-    # Substituting παιδια variations with παιδια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^παιδ[ι|ακ][α-ω]{,8}\s)|(\sπαιδ[ι|ακ][α-ω]{,8}$)|(\sπαιδ[ι|ακ][α-ω]{,8}\s)",
-            " παιδια ",
-            x,
-        )
-    )
-
-    # Substituting ομαλη variations with ομαλη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ομαλ[α-ω]{,8}\s)|(\sομαλ[α-ω]{,8}$)|(\sομαλ[α-ω]{,8}\s)", " ομαλη ", x
-        )
-    )
-
-    # Substituting ομαλη variations with ομαλη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ομαλ[α-ω]{,8}\s)|(\sομαλ[α-ω]{,8}$)|(\sομαλ[α-ω]{,8}\s)", " ομαλη ", x
-        )
-    )
-
-    # Substituting δυτικος variations with δυτικος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δυτι[α-ω]{,8}\s)|(\sδυτι[α-ω]{,8}$)|(\sδυτι[α-ω]{,8}\s)", " δυτικος ", x
-        )
-    )
-
-    # Substituting δυτικος variations with δυτικος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δυτι[α-ω]{,8}\s)|(\sδυτι[α-ω]{,8}$)|(\sδυτι[α-ω]{,8}\s)", " δυτικος ", x
-        )
-    )
-
-    # Substituting ευρωπη variations with ευρωπη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ευρωπ[α-ω]{,8}\s)|(\sευρωπ[α-ω]{,8}$)|(\sευρωπ[α-ω]{,8}\s)",
-            " ευρωπη ",
-            x,
-        )
-    )
-
-    # Substituting ευρωπη variations with ευρωπη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ευρωπ[α-ω]{,8}\s)|(\sευρωπ[α-ω]{,8}$)|(\sευρωπ[α-ω]{,8}\s)",
-            " ευρωπη ",
-            x,
-        )
-    )
-
-    # Substituting ποσοστωσεις variations with ποσοστωσεις
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ποσοστ[α-ω]{,8}\s)|(\sποσοστ[α-ω]{,8}$)|(\sποσοστ[α-ω]{,8}\s)",
-            " ποσοστωσεις ",
-            x,
-        )
-    )
-
-    # Substituting ποσοστωσεις variations with ποσοστωσεις
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ποσοστ[α-ω]{,8}\s)|(\sποσοστ[α-ω]{,8}$)|(\sποσοστ[α-ω]{,8}\s)",
-            " ποσοστωσεις ",
-            x,
-        )
-    )
-
-    # Substituting δαπανες variations with δαπανες
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δαπαν[α-ω]{,8}\s)|(\sδαπαν[α-ω]{,8}$)|(\sδαπαν[α-ω]{,8}\s)",
-            " δαπανες ",
-            x,
-        )
-    )
-
-    # Substituting δαπανες variations with δαπανες
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^δαπαν[α-ω]{,8}\s)|(\sδαπαν[α-ω]{,8}$)|(\sδαπαν[α-ω]{,8}\s)",
-            " δαπανες ",
-            x,
-        )
-    )
-
-    # Substituting μισθοι variations with μισθοι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μισθ[α-ω]{,8}\s)|(\sμισθ[α-ω]{,8}$)|(\sμισθ[α-ω]{,8}\s)", " μισθοι ", x
-        )
-    )
-
-    # Substituting μισθοι variations with μισθοι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^μισθ[α-ω]{,8}\s)|(\sμισθ[α-ω]{,8}$)|(\sμισθ[α-ω]{,8}\s)", " μισθοι ", x
-        )
-    )
-
-    # Substituting αλλοιωση variations with αλλοιωση
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αλλοιω[α-ω]{,8}\s)|(\sαλλοιω[α-ω]{,8}$)|(\sαλλοιω[α-ω]{,8}\s)",
-            " αλλοιωση ",
-            x,
-        )
-    )
-
-    # Substituting αλλοιωση variations with αλλοιωση
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^αλλοιω[α-ω]{,8}\s)|(\sαλλοιω[α-ω]{,8}$)|(\sαλλοιω[α-ω]{,8}\s)",
-            " αλλοιωση ",
-            x,
-        )
-    )
-
-    # Substituting ιστος variations with ιστος
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"(^ιστη\s)|(\sιστη$)|(\sιστη\s)", " ιστος ", x)
-    )
-
-    # Substituting ιστος variations with ιστος
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"(^ιστη\s)|(\sιστη$)|(\sιστη\s)", " ιστος ", x)
-    )
-
-    # Substituting ιατρικη variations with ιατρικη
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ιατρικ[α-ω]{,8}\s)|(\sιατρικ[α-ω]{,8}$)|(\sιατρικ[α-ω]{,8}\s)",
-            " ιατρικη ",
-            x,
-        )
-    )
-
-    # Substituting ιατρικη variations with ιατρικη
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ιατρικ[α-ω]{,8}\s)|(\sιατρικ[α-ω]{,8}$)|(\sιατρικ[α-ω]{,8}\s)",
-            " ιατρικη ",
-            x,
-        )
-    )
-
-    # Substituting καρυδι variations with καρυδι
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^καρυδ[α-ω]{,8}\s)|(\sκαρυδ[α-ω]{,8}$)|(\sκαρυδ[α-ω]{,8}\s)",
-            " καρυδι ",
-            x,
-        )
-    )
-
-    # Substituting καρυδι variations with καρυδι
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^καρυδ[α-ω]{,8}\s)|(\sκαρυδ[α-ω]{,8}$)|(\sκαρυδ[α-ω]{,8}\s)",
-            " καρυδι ",
-            x,
-        )
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^χαρτ[α-ω]{,8}\s)|(\sχαρτ[α-ω]{,8}$)|(\sχαρτ[α-ω]{,8}\s)", " χαρτια ", x
-        )
-    )
-
-    # Substituting χαρτια variations with χαρτια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^χαρτ[α-ω]{,8}\s)|(\sχαρτ[α-ω]{,8}$)|(\sχαρτ[α-ω]{,8}\s)", " χαρτια ", x
-        )
-    )
-
-    # Substituting απολυτως variations with απολυτως
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^α _πολυ τως\s)|(\sα _πολυ τως$)|(\sα _πολυ τως\s)", " απολυτως ", x
-        )
-    )
-
-    # Substituting απολυτως variations with απολυτως
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^α _πολυ τως\s)|(\sα _πολυ τως$)|(\sα _πολυ τως\s)", " απολυτως ", x
-        )
-    )
-
-    # Substituting ανεργια variations with ανεργια
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανεργ[α-ω]{,8}\s)|(\sανεργ[α-ω]{,8}$)|(\sανεργ[α-ω]{,8}\s)",
-            " ανεργια ",
-            x,
-        )
-    )
-
-    # Substituting ανεργια variations with ανεργια
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(
-            r"(^ανεργ[α-ω]{,8}\s)|(\sανεργ[α-ω]{,8}$)|(\sανεργ[α-ω]{,8}\s)",
-            " ανεργια ",
-            x,
-        )
-    )
-
-    # Removing double spaces
-    text_analysis.cleaned = text_analysis.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    # Removing double spaces
-    councilors_spelled.cleaned = councilors_spelled.cleaned.apply(
-        lambda x: re.sub(r"\s+", " ", x)
-    )
-
-    return text_analysis, councilors_spelled
+    return apply_topic_rules(text_analysis, councilors_spelled, backend)
@@ -0,0 +1,76 @@
+import numpy as np
+from typing import Dict, List, NamedTuple, Union
+
+# Topics of the dictionaries topic_dictionary used to return, in matrix column order
+LEGACY_TOPICS = (
+    "Identity Characteristics",
+    "Legal rationale",
+    "Cultural/ Social  concerns",
+    "Public order concerns",
+    "Economic concerns",
+    "Humanitarian concerns",
+    "Mobility concerns",
+    "Trust in authorities",
+    "Fairness",
+)
+
+
+class TopicIndex(NamedTuple):
+    """
+    Keywords of a topic taxonomy, compiled to integer topic ids.
+
+    Attributes:
+    ----------
+    labels (List[str]): Label of every topic, topic i being column i of the topic matrices.
+    keywords (Dict[str, np.ndarray]): Ids of the topics every keyword refers to.
+
+    """
+
+    labels: List[str]
+    keywords: Dict[str, np.ndarray]
+
+    def masks(self) -> Dict[str, int]:
+        """
+        Returns the topics of every keyword as a bitmask, bit i set for topic i.
+
+        Returns:
+        -------
+        Dict[str, int]: Bitmask of every keyword.
+
+        """
+        masks = {}
+        for keyword, topic_ids in self.keywords.items():
+            mask = 0
+            for topic_id in topic_ids.tolist():
+                mask |= 1 << topic_id
+            masks[keyword] = mask
+
+        return masks
+
+
+def as_topic_index(topic_dic: Union[TopicIndex, Dict[str, str]]) -> TopicIndex:
+    """
+    Accepts either a TopicIndex or a keyword -> topic label dictionary over LEGACY_TOPICS.
+
+    Args:
+    ----
+    topic_dic (Union[TopicIndex, Dict[str, str]]): Topic index or dictionary where the keys are keywords and the values are the topics.
+
+    Returns:
+    -------
+    TopicIndex: The topic index. Keywords of topics outside LEGACY_TOPICS are left out of a converted dictionary.
+
+    """
+    if isinstance(topic_dic, TopicIndex):
+        return topic_dic
+
+    topic_ids = {label: i for i, label in enumerate(LEGACY_TOPICS)}
+
+    return TopicIndex(
+        labels=list(LEGACY_TOPICS),
+        keywords={
+            keyword: np.array([topic_ids[topic]])
+            for keyword, topic in topic_dic.items()
+            if topic in topic_ids
+        },
+    )